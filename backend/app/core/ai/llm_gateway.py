@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
 import inspect
 from time import perf_counter
 from typing import Any
@@ -9,7 +9,8 @@ from langchain.chat_models import init_chat_model
 from langchain_core.messages import BaseMessage
 from pydantic import BaseModel
 
-from ..trace_logging import get_trace_context, log_trace
+from ..metrics import LLM_CALL_SECONDS
+from ..trace_logging import get_trace_context, get_trace_verbosity, log_trace
 
 
 class LLMGateway:
@@ -65,6 +66,22 @@ class LLMGateway:
             response="".join(chunks),
         )
 
+    async def stream_text(
+        self,
+        *,
+        messages: Sequence[BaseMessage],
+        model_id: str | None = None,
+        temperature: float = 0,
+    ) -> AsyncIterator[str]:
+        async for chunk in self.stream(
+            messages=messages,
+            model_id=model_id,
+            temperature=temperature,
+        ):
+            delta = self._extract_response_text(chunk)
+            if delta:
+                yield delta
+
     def invoke_structured(
         self,
         *,
@@ -99,19 +116,29 @@ class LLMGateway:
         response: Any,
         schema_name: str | None = None,
     ) -> None:
+        LLM_CALL_SECONDS.observe(
+            duration_ms / 1000,
+            call_type=call_type,
+            model=model_id or self.default_model,
+        )
+        verbosity = get_trace_verbosity("llm")
+        if verbosity == "off":
+            return
         context = get_trace_context()
+        caller = self._resolve_caller()
+        full = verbosity == "full"
         log_trace(
             layer="llm",
             event=call_type,
-            payload={
+            payload=lambda: {
                 "trace_id": context["trace_id"],
                 "model_id": model_id or self.default_model,
                 "call_type": call_type,
                 "schema_name": schema_name,
-                "caller": self._resolve_caller(),
-                "message_summary": self._summarize_messages(messages),
+                "caller": caller,
+                "message_summary": self._summarize_messages(messages, include_preview=full),
                 "duration_ms": round(duration_ms, 2),
-                "response_summary": self._summarize_response(response),
+                "response_summary": self._summarize_response(response, include_preview=full),
             },
         )
 
@@ -132,27 +159,35 @@ class LLMGateway:
         return ""
 
     @staticmethod
-    def _summarize_messages(messages: Sequence[BaseMessage]) -> list[dict[str, Any]]:
+    def _summarize_messages(
+        messages: Sequence[BaseMessage],
+        *,
+        include_preview: bool = True,
+    ) -> list[dict[str, Any]]:
         summaries: list[dict[str, Any]] = []
         for message in messages:
             content = LLMGateway._extract_response_text(message)
-            limit = 300 if getattr(message, "type", "") == "system" else 1000
-            summaries.append(
-                {
-                    "role": getattr(message, "type", ""),
-                    "length": len(content),
-                    "preview": content[:limit],
-                }
-            )
+            summary: dict[str, Any] = {
+                "role": getattr(message, "type", ""),
+                "length": len(content),
+            }
+            if include_preview:
+                limit = 300 if getattr(message, "type", "") == "system" else 1000
+                summary["preview"] = content[:limit]
+            summaries.append(summary)
         return summaries
 
     @staticmethod
-    def _summarize_response(response: Any) -> Any:
+    def _summarize_response(response: Any, *, include_preview: bool = True) -> Any:
         if hasattr(response, "model_dump") and callable(response.model_dump):
+            if not include_preview:
+                return {"type": type(response).__name__}
             return response.model_dump()
 
         content = LLMGateway._extract_response_text(response)
         if content:
+            if not include_preview:
+                return {"length": len(content)}
             return {
                 "length": len(content),
                 "preview": content[:1000],
@@ -1,13 +1,99 @@
-from sqlalchemy import create_engine
+import os
+
+from dotenv import load_dotenv
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import sessionmaker, declarative_base
 
-# 로컬 SQLite DB 파일 생성
-DATABASE_URL = "sqlite:///./app.db"
+# main.py보다 먼저 import되므로 .env 설정을 여기서도 읽는다.
+load_dotenv()
+
+# 기본값은 로컬 SQLite DB 파일이고, DATABASE_URL로 Postgres 등을 지정할 수 있다.
+DEFAULT_DATABASE_URL = "sqlite:///./app.db"
+DATABASE_URL = os.getenv("DATABASE_URL", DEFAULT_DATABASE_URL)
+
+DEFAULT_SQLITE_JOURNAL_MODE = "WAL"
+DEFAULT_SQLITE_SYNCHRONOUS = "NORMAL"
+DEFAULT_SQLITE_BUSY_TIMEOUT_MS = 5000
+DEFAULT_POOL_SIZE = 5
+DEFAULT_MAX_OVERFLOW = 10
+DEFAULT_POOL_TIMEOUT_SECONDS = 30
+DEFAULT_POOL_RECYCLE_SECONDS = 1800
+
+
+def _get_int_env(name: str, default: int) -> int:
+    raw_value = os.getenv(name)
+    if raw_value is None or not raw_value.strip():
+        return default
+    try:
+        return int(raw_value)
+    except ValueError as exc:
+        raise ValueError(f"{name} must be an integer: {raw_value!r}") from exc
+
+
+def _is_memory_sqlite(database: str | None) -> bool:
+    return not database or database == ":memory:" or database.startswith("file::memory:")
+
+
+# connection이 만들어질 때마다 WAL/busy_timeout/synchronous pragma를 적용한다.
+def _install_sqlite_pragmas(
+    engine: Engine,
+    *,
+    journal_mode: str,
+    synchronous: str,
+    busy_timeout_ms: int,
+) -> None:
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute(f"PRAGMA busy_timeout={busy_timeout_ms}")
+            if journal_mode:
+                cursor.execute(f"PRAGMA journal_mode={journal_mode}")
+            cursor.execute(f"PRAGMA synchronous={synchronous}")
+        finally:
+            cursor.close()
+
+
+def build_engine(database_url: str | None = None) -> Engine:
+    url = make_url(database_url or DATABASE_URL)
+    if url.get_backend_name() == "sqlite":
+        busy_timeout_ms = _get_int_env("SQLITE_BUSY_TIMEOUT_MS", DEFAULT_SQLITE_BUSY_TIMEOUT_MS)
+        engine_options: dict = {
+            "connect_args": {
+                "check_same_thread": False,
+                "timeout": busy_timeout_ms / 1000,
+            },
+        }
+        in_memory = _is_memory_sqlite(url.database)
+        # in-memory DB는 SQLAlchemy 기본 pool(StaticPool 계열)을 그대로 둔다.
+        if not in_memory:
+            engine_options.update(
+                pool_size=_get_int_env("DB_POOL_SIZE", DEFAULT_POOL_SIZE),
+                max_overflow=_get_int_env("DB_MAX_OVERFLOW", DEFAULT_MAX_OVERFLOW),
+                pool_timeout=_get_int_env("DB_POOL_TIMEOUT", DEFAULT_POOL_TIMEOUT_SECONDS),
+            )
+        engine = create_engine(url, **engine_options)
+        _install_sqlite_pragmas(
+            engine,
+            # WAL은 파일 DB에서만 의미가 있다.
+            journal_mode="" if in_memory else os.getenv("SQLITE_JOURNAL_MODE", DEFAULT_SQLITE_JOURNAL_MODE),
+            synchronous=os.getenv("SQLITE_SYNCHRONOUS", DEFAULT_SQLITE_SYNCHRONOUS),
+            busy_timeout_ms=busy_timeout_ms,
+        )
+        return engine
+
+    return create_engine(
+        url,
+        pool_size=_get_int_env("DB_POOL_SIZE", DEFAULT_POOL_SIZE),
+        max_overflow=_get_int_env("DB_MAX_OVERFLOW", DEFAULT_MAX_OVERFLOW),
+        pool_timeout=_get_int_env("DB_POOL_TIMEOUT", DEFAULT_POOL_TIMEOUT_SECONDS),
+        pool_recycle=_get_int_env("DB_POOL_RECYCLE", DEFAULT_POOL_RECYCLE_SECONDS),
+        pool_pre_ping=True,
+    )
+
 
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False}
-)
+engine = build_engine()
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -0,0 +1,399 @@
+from __future__ import annotations
+
+import ast
+import copy
+import keyword
+import operator
+import re
+from dataclasses import dataclass
+from functools import lru_cache, reduce
+from typing import Any, Callable, Iterable, Mapping
+
+import numpy as np
+import pandas as pd
+
+MAX_EXPRESSION_LENGTH = 2_000
+MAX_EXPRESSION_NODES = 256
+# 정수끼리의 거듭제곱은 지수가 이 범위를 벗어나면 float64로 계산한다. 2 이상의 밑은 64제곱부터 int64를 넘는다.
+MAX_INTEGER_EXPONENT = 63
+# 행 수가 이보다 적으면 numexpr thread 준비 비용이 더 크다.
+NUMEXPR_MIN_ROWS = 10_000
+
+_BACKTICK_RE = re.compile(r"`([^`]+)`")
+_PLACEHOLDER_RE = re.compile(r"__expr_col_(\d+)__")
+
+_BINARY_OPS: dict[type[ast.operator], Callable[[Any, Any], Any]] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+    ast.BitAnd: operator.and_,
+    ast.BitOr: operator.or_,
+}
+_COMPARE_OPS: dict[type[ast.cmpop], Callable[[Any, Any], Any]] = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+}
+_NUMEXPR_BINARY = {
+    ast.Add: "+",
+    ast.Sub: "-",
+    ast.Mult: "*",
+    ast.Div: "/",
+    ast.Mod: "%",
+    ast.Pow: "**",
+    ast.BitAnd: "&",
+    ast.BitOr: "|",
+}
+_NUMEXPR_COMPARE = {ast.Eq: "==", ast.NotEq: "!=", ast.Lt: "<", ast.LtE: "<=", ast.Gt: ">", ast.GtE: ">="}
+
+
+def _logical_not(value: Any) -> Any:
+    if isinstance(value, (bool, np.bool_)):
+        return not value
+    return operator.invert(value)
+
+
+def _round(value: Any, decimals: Any = 0) -> Any:
+    return np.round(value, int(decimals))
+
+
+# 이름 -> (최소 인자 수, 최대 인자 수, 구현). 모두 배열 단위로 동작한다.
+_FUNCTIONS: dict[str, tuple[int, int, Callable[..., Any]]] = {
+    "abs": (1, 1, np.abs),
+    "sqrt": (1, 1, np.sqrt),
+    "log": (1, 1, np.log),
+    "log1p": (1, 1, np.log1p),
+    "log10": (1, 1, np.log10),
+    "exp": (1, 1, np.exp),
+    "floor": (1, 1, np.floor),
+    "ceil": (1, 1, np.ceil),
+    "round": (1, 2, _round),
+    "clip": (3, 3, np.clip),
+    "where": (3, 3, np.where),
+    "isnull": (1, 1, pd.isna),
+    "notnull": (1, 1, pd.notna),
+    "minimum": (2, 2, np.minimum),
+    "maximum": (2, 2, np.maximum),
+}
+_NUMEXPR_FUNCTIONS = {"abs", "sqrt", "log", "log1p", "log10", "exp", "where"}
+
+
+class ExpressionError(ValueError):
+    """허용 범위를 벗어나거나 계산할 수 없는 파생 컬럼 수식."""
+
+
+def _numexpr_module() -> Any | None:
+    try:
+        import numexpr
+    except ImportError:
+        return None
+    return numexpr
+
+
+def _quote_column(column: str) -> str:
+    if column.isidentifier() and not keyword.iskeyword(column) and column not in _FUNCTIONS:
+        return column
+    return f"`{column}`"
+
+
+@dataclass(frozen=True)
+class CompiledExpression:
+    """검증된 수식 AST. Name node의 id는 columns 안의 위치를 가리키는 placeholder다."""
+
+    source: str
+    columns: tuple[str, ...]
+    tree: ast.Expression
+
+    def validate(self, available: Iterable[str]) -> None:
+        available_set = set(available)
+        for column in self.columns:
+            if column not in available_set:
+                raise ExpressionError(f"Column not found: {column}")
+
+    def render(self, rename: Mapping[str, str] | None = None) -> str:
+        """컬럼 이름을 바꿔 수식 문자열로 되돌린다. 식별자가 아닌 이름은 backtick으로 감싼다."""
+        rename = rename or {}
+        text = ast.unparse(self.tree)
+        return _PLACEHOLDER_RE.sub(
+            lambda match: _quote_column(rename.get(self._column(match.group(0)), self._column(match.group(0)))),
+            text,
+        )
+
+    def evaluate(self, frame: pd.DataFrame) -> pd.Series:
+        self.validate(frame.columns)
+        result = self._evaluate_numexpr(frame)
+        if result is None:
+            values = {column: _column_values(frame[column]) for column in self.columns}
+            try:
+                with np.errstate(all="ignore"):
+                    result = self._evaluate_node(self.tree.body, values)
+            except ExpressionError:
+                raise
+            except (TypeError, ValueError, ZeroDivisionError, OverflowError) as exc:
+                raise ExpressionError(f"Expression evaluation failed: {exc}") from exc
+        if isinstance(result, pd.Series):
+            return result.set_axis(frame.index)
+        return pd.Series(np.broadcast_to(np.asarray(result), (len(frame),)), index=frame.index)
+
+    def _column(self, placeholder: str) -> str:
+        match = _PLACEHOLDER_RE.fullmatch(placeholder)
+        if match is None:
+            raise ExpressionError(f"Unknown name: {placeholder}")
+        return self.columns[int(match.group(1))]
+
+    def _evaluate_node(self, node: ast.AST, values: dict[str, Any]) -> Any:
+        if isinstance(node, ast.Constant):
+            return _constant_value(node.value)
+        if isinstance(node, ast.Name):
+            return values[self._column(node.id)]
+        if isinstance(node, ast.BinOp):
+            left = self._evaluate_node(node.left, values)
+            right = self._evaluate_node(node.right, values)
+            if isinstance(node.op, ast.Pow):
+                return _power(left, right)
+            return _BINARY_OPS[type(node.op)](left, right)
+        if isinstance(node, ast.UnaryOp):
+            operand = self._evaluate_node(node.operand, values)
+            if isinstance(node.op, ast.USub):
+                return operator.neg(operand)
+            if isinstance(node.op, ast.UAdd):
+                return operand
+            return _logical_not(operand)
+        if isinstance(node, ast.BoolOp):
+            combine = operator.and_ if isinstance(node.op, ast.And) else operator.or_
+            return reduce(combine, (self._evaluate_node(value, values) for value in node.values))
+        if isinstance(node, ast.Compare):
+            # a < b < c는 (a < b) & (b < c)로 계산한다.
+            left = self._evaluate_node(node.left, values)
+            results = []
+            for op, comparator in zip(node.ops, node.comparators):
+                right = self._evaluate_node(comparator, values)
+                results.append(_COMPARE_OPS[type(op)](left, right))
+                left = right
+            return reduce(operator.and_, results)
+        if isinstance(node, ast.Call):
+            _, _, function = _FUNCTIONS[node.func.id]
+            return function(*(self._evaluate_node(arg, values) for arg in node.args))
+        raise ExpressionError(f"Unsupported expression syntax: {type(node).__name__}")
+
+    def _evaluate_numexpr(self, frame: pd.DataFrame) -> np.ndarray | None:
+        """numexpr가 있고 모든 컬럼이 numpy 숫자 dtype이면 한 번에 계산한다. 아니면 None."""
+        if len(frame) < NUMEXPR_MIN_ROWS or not self.columns:
+            return None
+        numexpr = _numexpr_module()
+        if numexpr is None:
+            return None
+        for column in self.columns:
+            dtype = frame[column].dtype
+            if not isinstance(dtype, np.dtype) or dtype.kind not in "biuf":
+                return None
+        text = _to_numexpr(self.tree.body)
+        if text is None:
+            return None
+        local_dict = {
+            f"__expr_col_{index}__": frame[column].to_numpy() for index, column in enumerate(self.columns)
+        }
+        try:
+            return numexpr.evaluate(text, local_dict=local_dict, global_dict={})
+        except (KeyError, TypeError, ValueError, NotImplementedError):
+            # numexpr가 못 다루는 type 조합은 pandas 계산으로 넘긴다.
+            return None
+
+
+def _column_values(series: pd.Series) -> pd.Series:
+    """nullable 숫자 컬럼은 float64(결측 NaN)로 바꾼다. pd.NA는 비교 결과를 bool로 쓸 수 없어 where/and가 실패한다."""
+    dtype = series.dtype
+    if isinstance(dtype, np.dtype) or not pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_bool_dtype(dtype):
+        return series
+    return pd.Series(series.to_numpy(dtype="float64", na_value=np.nan), index=series.index, name=series.name)
+
+
+def _constant_value(value: Any) -> Any:
+    # 숫자 상수는 numpy scalar로 계산한다. Python int 연산은 크기 제한이 없어 9**9**9 같은 수식이 worker를 멈춘다.
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int):
+        return np.int64(value)
+    if isinstance(value, float):
+        return np.float64(value)
+    return value
+
+
+def _is_integer(value: Any) -> bool:
+    return np.asarray(value).dtype.kind in "iu"
+
+
+def _power(base: Any, exponent: Any) -> Any:
+    """정수 거듭제곱은 int64를 유지한다. 음수이거나 너무 큰 정수 지수만 float64로 바꿔 inf/분수가 되게 한다."""
+    if _is_integer(base) and _is_integer(exponent):
+        exponents = np.asarray(exponent)
+        if exponents.size and (exponents.min() < 0 or exponents.max() > MAX_INTEGER_EXPONENT):
+            return operator.pow(base, np.asarray(exponent, dtype="float64"))
+    return operator.pow(base, exponent)
+
+
+def _to_numexpr(node: ast.AST) -> str | None:
+    if isinstance(node, ast.Constant):
+        if isinstance(node.value, bool) or not isinstance(node.value, (int, float)):
+            return None
+        return repr(node.value)
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.BinOp):
+        if isinstance(node.op, ast.Pow) and not _is_small_exponent(node.right):
+            # 지수 범위는 실행 중에만 알 수 있어 _power()가 있는 pandas 계산으로 넘긴다.
+            return None
+        symbol = _NUMEXPR_BINARY.get(type(node.op))
+        left, right = _to_numexpr(node.left), _to_numexpr(node.right)
+        if symbol is None or left is None or right is None:
+            return None
+        return f"({left} {symbol} {right})"
+    if isinstance(node, ast.UnaryOp):
+        operand = _to_numexpr(node.operand)
+        if operand is None:
+            return None
+        symbol = "-" if isinstance(node.op, ast.USub) else "" if isinstance(node.op, ast.UAdd) else "~"
+        return f"({symbol}{operand})"
+    if isinstance(node, ast.BoolOp):
+        parts = [_to_numexpr(value) for value in node.values]
+        if any(part is None for part in parts):
+            return None
+        symbol = " & " if isinstance(node.op, ast.And) else " | "
+        return f"({symbol.join(parts)})"
+    if isinstance(node, ast.Compare):
+        operands = [_to_numexpr(node.left), *(_to_numexpr(value) for value in node.comparators)]
+        if any(part is None for part in operands):
+            return None
+        parts = [
+            f"({left} {_NUMEXPR_COMPARE[type(op)]} {right})"
+            for op, left, right in zip(node.ops, operands, operands[1:])
+        ]
+        return f"({' & '.join(parts)})"
+    if isinstance(node, ast.Call) and node.func.id in _NUMEXPR_FUNCTIONS:
+        args = [_to_numexpr(arg) for arg in node.args]
+        if any(arg is None for arg in args):
+            return None
+        return f"{node.func.id}({', '.join(args)})"
+    return None
+
+
+def _is_small_exponent(node: ast.AST) -> bool:
+    if not isinstance(node, ast.Constant) or isinstance(node.value, bool):
+        return False
+    if isinstance(node.value, float):
+        return True
+    return isinstance(node.value, int) and 0 <= node.value <= MAX_INTEGER_EXPONENT
+
+
+class _ExpressionChecker(ast.NodeTransformer):
+    """허용된 node만 남았는지 확인하면서 컬럼 Name을 placeholder로 바꾼다."""
+
+    def __init__(self, quoted: list[str]) -> None:
+        self.quoted = quoted
+        self.columns: list[str] = []
+
+    def _placeholder(self, column: str) -> str:
+        if column not in self.columns:
+            self.columns.append(column)
+        return f"__expr_col_{self.columns.index(column)}__"
+
+    def visit_Name(self, node: ast.Name) -> ast.Name:
+        match = _PLACEHOLDER_RE.fullmatch(node.id)
+        if match is not None and int(match.group(1)) < len(self.quoted):
+            column = self.quoted[int(match.group(1))]
+        else:
+            column = node.id
+        return ast.copy_location(ast.Name(id=self._placeholder(column), ctx=ast.Load()), node)
+
+    def visit_Constant(self, node: ast.Constant) -> ast.Constant:
+        if node.value is None or not isinstance(node.value, (bool, int, float, str)):
+            raise ExpressionError(f"Unsupported constant: {node.value!r}")
+        if isinstance(node.value, int) and not isinstance(node.value, bool):
+            if not np.iinfo(np.int64).min <= node.value <= np.iinfo(np.int64).max:
+                raise ExpressionError(f"Numeric constant is too large: {node.value}")
+        return node
+
+    def visit_BinOp(self, node: ast.BinOp) -> ast.AST:
+        if type(node.op) not in _BINARY_OPS:
+            raise ExpressionError(f"Unsupported operator: {type(node.op).__name__}")
+        # 문자열 반복/이어 붙이기는 결과 크기를 제한할 수 없어 산술 연산에서 문자열 상수를 받지 않는다.
+        for operand in (node.left, node.right):
+            if isinstance(operand, ast.Constant) and isinstance(operand.value, str):
+                raise ExpressionError("String constants are not allowed in arithmetic")
+        return self.generic_visit(node)
+
+    def visit_UnaryOp(self, node: ast.UnaryOp) -> ast.AST:
+        if not isinstance(node.op, (ast.USub, ast.UAdd, ast.Not, ast.Invert)):
+            raise ExpressionError(f"Unsupported operator: {type(node.op).__name__}")
+        return self.generic_visit(node)
+
+    def visit_BoolOp(self, node: ast.BoolOp) -> ast.AST:
+        return self.generic_visit(node)
+
+    def visit_Compare(self, node: ast.Compare) -> ast.AST:
+        for op in node.ops:
+            if type(op) not in _COMPARE_OPS:
+                raise ExpressionError(f"Unsupported operator: {type(op).__name__}")
+        return self.generic_visit(node)
+
+    def visit_Call(self, node: ast.Call) -> ast.AST:
+        if not isinstance(node.func, ast.Name) or node.func.id not in _FUNCTIONS:
+            name = node.func.id if isinstance(node.func, ast.Name) else type(node.func).__name__
+            raise ExpressionError(f"Unknown function: {name}")
+        if node.keywords:
+            raise ExpressionError(f"{node.func.id}() does not accept keyword arguments")
+        minimum, maximum, _ = _FUNCTIONS[node.func.id]
+        if not minimum <= len(node.args) <= maximum:
+            raise ExpressionError(f"{node.func.id}() takes {minimum}-{maximum} arguments")
+        # 함수 이름은 컬럼으로 보지 않는다.
+        node.args = [self.visit(arg) for arg in node.args]
+        return node
+
+    def generic_visit(self, node: ast.AST) -> ast.AST:
+        if not isinstance(node, (ast.Expression, ast.BinOp, ast.UnaryOp, ast.BoolOp, ast.Compare, *_ALLOWED_LEAVES)):
+            raise ExpressionError(f"Unsupported expression syntax: {type(node).__name__}")
+        return super().generic_visit(node)
+
+
+_ALLOWED_LEAVES = (
+    ast.operator,
+    ast.unaryop,
+    ast.boolop,
+    ast.cmpop,
+    ast.expr_context,
+)
+
+
+@lru_cache(maxsize=256)
+def compile_expression(source: str) -> CompiledExpression:
+    """pandas eval 문법의 부분집합(산술·비교·논리·컬럼·허용 함수)만 받아 AST로 컴파일한다.
+
+    backtick으로 감싼 이름은 공백이나 특수문자가 있어도 컬럼으로 본다.
+    """
+    text = str(source or "").strip()
+    if not text:
+        raise ExpressionError("Expression must not be empty")
+    if len(text) > MAX_EXPRESSION_LENGTH:
+        raise ExpressionError(f"Expression is longer than {MAX_EXPRESSION_LENGTH} characters")
+    quoted: list[str] = []
+
+    def _replace(match: re.Match[str]) -> str:
+        quoted.append(match.group(1))
+        return f"__expr_col_{len(quoted) - 1}__"
+
+    try:
+        tree = ast.parse(_BACKTICK_RE.sub(_replace, text), mode="eval")
+    except SyntaxError as exc:
+        raise ExpressionError(f"Invalid expression syntax: {exc.msg}") from exc
+    if sum(1 for _ in ast.walk(tree)) > MAX_EXPRESSION_NODES:
+        raise ExpressionError(f"Expression has more than {MAX_EXPRESSION_NODES} nodes")
+    checker = _ExpressionChecker(quoted)
+    checked = checker.visit(copy.deepcopy(tree))
+    return CompiledExpression(source=text, columns=tuple(checker.columns), tree=checked)
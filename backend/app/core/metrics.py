@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import bisect
+import threading
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Iterator
+
+DEFAULT_LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+LabelValues = tuple[str, ...]
+
+
+class _Metric:
+    metric_type = ""
+
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...]) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self._lock = threading.Lock()
+
+    def _label_values(self, labels: dict[str, object]) -> LabelValues:
+        if set(labels) != set(self.label_names):
+            raise ValueError(
+                f"metric {self.name} expects labels {self.label_names}, got {tuple(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def _format_labels(self, values: LabelValues, extra: tuple[tuple[str, str], ...] = ()) -> str:
+        pairs = list(zip(self.label_names, values)) + list(extra)
+        if not pairs:
+            return ""
+        rendered = ",".join(f'{name}="{_escape_label(value)}"' for name, value in pairs)
+        return f"{{{rendered}}}"
+
+    def render(self) -> list[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.metric_type}",
+        ]
+
+
+class Counter(_Metric):
+    metric_type = "counter"
+
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...] = ()) -> None:
+        super().__init__(name, documentation, label_names)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: object) -> float:
+        return self._values.get(self._label_values(labels), 0.0)
+
+    def render(self) -> list[str]:
+        lines = super().render()
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines.append(f"{self.name}{self._format_labels(key)} {_format_number(value)}")
+        return lines
+
+
+class Histogram(_Metric):
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...] = (),
+        *,
+        buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets))
+        # label 조합별로 [bucket별 count..., +Inf count]와 sum을 보관한다.
+        self._counts: dict[LabelValues, list[int]] = {}
+        self._sums: dict[LabelValues, float] = {}
+
+    def observe(self, value: float, **labels: object) -> None:
+        key = self._label_values(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = [0] * (len(self.buckets) + 1)
+                self._counts[key] = counts
+            counts[index] += 1
+            self._sums[key] = self._sums.get(key, 0.0) + value
+
+    @contextmanager
+    def time(self, **labels: object) -> Iterator[None]:
+        started_at = perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(perf_counter() - started_at, **labels)
+
+    def count(self, **labels: object) -> int:
+        return sum(self._counts.get(self._label_values(labels), []))
+
+    def render(self) -> list[str]:
+        lines = super().render()
+        with self._lock:
+            items = sorted((key, list(counts), self._sums[key]) for key, counts in self._counts.items())
+        for key, counts, total in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                labels = self._format_labels(key, (("le", _format_number(bound)),))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            cumulative += counts[-1]
+            labels = self._format_labels(key, (("le", "+Inf"),))
+            lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            lines.append(f"{self.name}_sum{self._format_labels(key)} {_format_number(total)}")
+            lines.append(f"{self.name}_count{self._format_labels(key)} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """프로세스 내부 counter/histogram을 모아 Prometheus text format으로 내보낸다."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str, label_names: tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(name, documentation, label_names))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...] = (),
+        *,
+        buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, label_names, buckets=buckets))
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: list[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def _register(self, metric: _Metric):
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.label_names != metric.label_names:
+                    raise ValueError(f"metric already registered with another shape: {metric.name}")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_number(value: float) -> str:
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+REGISTRY = MetricsRegistry()
+
+WORKFLOW_NODE_SECONDS = REGISTRY.histogram(
+    "agent_workflow_node_duration_seconds",
+    "LangGraph node 실행 시간",
+    ("node",),
+)
+WORKFLOW_NODE_ERRORS = REGISTRY.counter(
+    "agent_workflow_node_errors_total",
+    "예외로 끝난 LangGraph node 실행 수",
+    ("node",),
+)
+LLM_CALL_SECONDS = REGISTRY.histogram(
+    "agent_llm_call_duration_seconds",
+    "LLMGateway 호출 시간",
+    ("call_type", "model"),
+)
+SANDBOX_EXECUTION_SECONDS = REGISTRY.histogram(
+    "analysis_sandbox_execution_duration_seconds",
+    "분석 코드 sandbox 실행 시간",
+    ("outcome",),
+)
+DATASET_READ_SECONDS = REGISTRY.histogram(
+    "dataset_csv_read_duration_seconds",
+    "DatasetReader CSV 읽기 시간",
+    ("mode",),
+)
+EMBEDDING_SECONDS = REGISTRY.histogram(
+    "rag_embedding_duration_seconds",
+    "embedding 계산 시간",
+    ("kind",),
+)
+EMBEDDED_TEXTS = REGISTRY.counter(
+    "rag_embedded_texts_total",
+    "embedding한 text 수",
+    ("kind",),
+)
+VECTOR_SEARCH_SECONDS = REGISTRY.histogram(
+    "rag_faiss_search_duration_seconds",
+    "FAISS index 검색 시간",
+)
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable
+
+from sqlalchemy import Column, DateTime, MetaData, String, Table, inspect, select, text
+from sqlalchemy.engine import Connection, Engine
+
+logger = logging.getLogger(__name__)
+
+_migration_metadata = MetaData()
+schema_migrations = Table(
+    "schema_migrations",
+    _migration_metadata,
+    Column("version", String(64), primary_key=True),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: str
+    description: str
+    upgrade: Callable[[Connection, MetaData], None]
+
+
+# 초기 schema는 model metadata 그대로 만든다. 이미 있는 테이블은 건드리지 않는다.
+def _create_initial_schema(connection: Connection, metadata: MetaData) -> None:
+    metadata.create_all(bind=connection, checkfirst=True)
+
+
+def add_column_if_missing(connection: Connection, table_name: str, column_ddl: str) -> None:
+    """fresh DB는 초기 migration이 이미 최신 column을 만들기 때문에 존재 여부를 먼저 본다."""
+    column_name = column_ddl.split()[0]
+    existing = {column["name"] for column in inspect(connection).get_columns(table_name)}
+    if column_name not in existing:
+        connection.execute(text(f"ALTER TABLE {table_name} ADD COLUMN {column_ddl}"))
+
+
+def _add_dataset_ingest_columns(connection: Connection, metadata: MetaData) -> None:
+    add_column_if_missing(connection, "datasets", "checksum VARCHAR(64)")
+    add_column_if_missing(connection, "datasets", "ingest_stats JSON")
+
+
+def _create_preprocess_pipelines_table(connection: Connection, metadata: MetaData) -> None:
+    metadata.tables["preprocess_pipelines"].create(bind=connection, checkfirst=True)
+
+
+def _add_dataset_summary_column(connection: Connection, metadata: MetaData) -> None:
+    add_column_if_missing(connection, "datasets", "data_summary JSON")
+
+
+# 새 schema 변경은 version 순서대로 뒤에 추가한다. 이미 배포된 항목은 수정하지 않는다.
+MIGRATIONS: list[Migration] = [
+    Migration("0001", "initial schema", _create_initial_schema),
+    Migration("0002", "datasets checksum and ingest stats", _add_dataset_ingest_columns),
+    Migration("0003", "preprocess pipeline artifacts", _create_preprocess_pipelines_table),
+    Migration("0004", "datasets preprocess summary cache", _add_dataset_summary_column),
+]
+
+
+def get_applied_versions(engine: Engine) -> set[str]:
+    with engine.connect() as connection:
+        if not inspect(connection).has_table(schema_migrations.name):
+            return set()
+        return set(connection.execute(select(schema_migrations.c.version)).scalars())
+
+
+def run_migrations(
+    engine: Engine,
+    metadata: MetaData,
+    *,
+    migrations: list[Migration] | None = None,
+) -> list[str]:
+    """적용되지 않은 migration을 순서대로 실행하고 새로 적용한 version 목록을 반환한다."""
+    pending_source = MIGRATIONS if migrations is None else migrations
+    _migration_metadata.create_all(bind=engine, checkfirst=True)
+    applied = get_applied_versions(engine)
+    newly_applied: list[str] = []
+    for migration in sorted(pending_source, key=lambda item: item.version):
+        if migration.version in applied:
+            continue
+        # migration 하나와 version 기록을 같은 transaction으로 묶는다.
+        with engine.begin() as connection:
+            migration.upgrade(connection, metadata)
+            connection.execute(
+                schema_migrations.insert().values(
+                    version=migration.version,
+                    applied_at=datetime.now(timezone.utc).replace(tzinfo=None),
+                )
+            )
+        logger.info("applied migration %s (%s)", migration.version, migration.description)
+        newly_applied.append(migration.version)
+    return newly_applied
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import sys
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter
+from types import FrameType
+from typing import Any, AsyncIterator, Callable, Iterator, TypeVar
+
+from . import trace_logging
+from .trace_logging import get_trace_context, log_trace
+
+DEFAULT_SAMPLE_INTERVAL_SECONDS = 0.005
+_MAX_STACK_DEPTH = 128
+
+T = TypeVar("T")
+
+# trace_id별로 실행 중인 profiler. worker thread가 자기 요청의 profiler를 찾아 등록할 때 쓴다.
+_ACTIVE_PROFILERS: dict[str, "SamplingProfiler"] = {}
+_ACTIVE_PROFILERS_LOCK = threading.Lock()
+
+
+class SamplingProfiler:
+    """별도 thread에서 등록된 thread의 stack만 주기적으로 모아 collapsed stack 형식으로 남긴다."""
+
+    def __init__(self, *, interval_seconds: float = DEFAULT_SAMPLE_INTERVAL_SECONDS) -> None:
+        self.interval_seconds = interval_seconds
+        self.samples: Counter[str] = Counter()
+        self.sample_count = 0
+        self.duration_seconds = 0.0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._started_at = 0.0
+        self._thread_ids: set[int] = set()
+        self._thread_ids_lock = threading.Lock()
+
+    def add_thread(self, thread_id: int) -> None:
+        with self._thread_ids_lock:
+            self._thread_ids.add(thread_id)
+
+    def discard_thread(self, thread_id: int) -> None:
+        with self._thread_ids_lock:
+            self._thread_ids.discard(thread_id)
+
+    # start를 호출한 thread(요청을 처리하는 thread)는 자동으로 sampling 대상이 된다.
+    def start(self) -> None:
+        self.add_thread(threading.get_ident())
+        self._started_at = perf_counter()
+        self._thread = threading.Thread(target=self._run, name="trace-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.duration_seconds = perf_counter() - self._started_at
+
+    # flamegraph 도구가 그대로 읽을 수 있는 "frame;frame;frame count" 형식으로 만든다.
+    def render_collapsed(self) -> str:
+        lines = [f"{stack} {count}" for stack, count in self.samples.most_common()]
+        return "\n".join(lines) + ("\n" if lines else "")
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            with self._thread_ids_lock:
+                thread_ids = set(self._thread_ids)
+            thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id not in thread_ids:
+                    continue
+                stack = self._collapse(frame)
+                if stack:
+                    name = thread_names.get(thread_id, str(thread_id))
+                    self.samples[f"thread:{name};{stack}"] += 1
+            self.sample_count += 1
+
+    @staticmethod
+    def _collapse(frame: FrameType | None) -> str:
+        names: list[str] = []
+        while frame is not None and len(names) < _MAX_STACK_DEPTH:
+            code = frame.f_code
+            module = frame.f_globals.get("__name__", "")
+            names.append(f"{module}.{code.co_name}:{frame.f_lineno}")
+            frame = frame.f_back
+        names.reverse()
+        return ";".join(names)
+
+
+# 요청이 띄운 worker thread를 현재 trace의 profiler에 등록한다. profiling 중이 아니면 아무것도 하지 않는다.
+@contextmanager
+def profiled_thread() -> Iterator[None]:
+    trace_id = get_trace_context().get("trace_id")
+    with _ACTIVE_PROFILERS_LOCK:
+        profiler = _ACTIVE_PROFILERS.get(str(trace_id)) if trace_id else None
+    if profiler is None:
+        yield
+        return
+    thread_id = threading.get_ident()
+    profiler.add_thread(thread_id)
+    try:
+        yield
+    finally:
+        profiler.discard_thread(thread_id)
+
+
+def run_in_profiled_thread(func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    with profiled_thread():
+        return func(*args, **kwargs)
+
+
+def _get_profile_path(trace_id: str) -> Path:
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+    return trace_logging.TRACE_SUMMARY_DIR / f"{trace_id}.{stamp}.profile.txt"
+
+
+# 이벤트 스트림이 끝날 때까지 profiler를 켜 두고, 결과를 trace summary 옆에 저장한 뒤 trace에 연결한다.
+async def profile_async_iterator(
+    events: AsyncIterator[T],
+    *,
+    interval_seconds: float = DEFAULT_SAMPLE_INTERVAL_SECONDS,
+) -> AsyncIterator[T]:
+    profiler = SamplingProfiler(interval_seconds=interval_seconds)
+    trace_id = get_trace_context().get("trace_id")
+    if trace_id:
+        with _ACTIVE_PROFILERS_LOCK:
+            _ACTIVE_PROFILERS[str(trace_id)] = profiler
+    profiler.start()
+    try:
+        async for event in events:
+            yield event
+    finally:
+        profiler.stop()
+        if trace_id:
+            with _ACTIVE_PROFILERS_LOCK:
+                _ACTIVE_PROFILERS.pop(str(trace_id), None)
+        _save_profile(profiler)
+
+
+def _save_profile(profiler: SamplingProfiler) -> None:
+    trace_id = get_trace_context().get("trace_id") or "untraced"
+    profile_path = _get_profile_path(str(trace_id))
+    profile_path.parent.mkdir(parents=True, exist_ok=True)
+    profile_path.write_text(profiler.render_collapsed(), encoding="utf-8")
+    payload: dict[str, Any] = {
+        "path": str(profile_path),
+        "format": "collapsed",
+        "sample_count": profiler.sample_count,
+        "interval_ms": round(profiler.interval_seconds * 1000, 3),
+        "duration_ms": round(profiler.duration_seconds * 1000, 2),
+        "scope": "request_threads",
+    }
+    log_trace(layer="profiling", event="profile_saved", payload=payload)
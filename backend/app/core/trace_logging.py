@@ -1,12 +1,22 @@
 from __future__ import annotations
 
+import atexit
 import json
+import logging
+import os
+import queue
+import random
 import threading
+from collections import OrderedDict
 from contextlib import contextmanager
 from contextvars import ContextVar
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Iterator
+from time import monotonic
+from typing import Any, Callable, Iterator, Literal
+
+logger = logging.getLogger(__name__)
 
 TRACE_ID_VAR: ContextVar[str | None] = ContextVar("trace_id", default=None)
 SESSION_ID_VAR: ContextVar[str | int | None] = ContextVar("session_id", default=None)
@@ -15,8 +25,42 @@ STAGE_VAR: ContextVar[str | None] = ContextVar("workflow_stage", default=None)
 
 TRACE_LOG_PATH = Path(__file__).resolve().parents[3] / "storage" / "logs" / "agent-trace.jsonl"
 TRACE_SUMMARY_DIR = TRACE_LOG_PATH.parent / "traces"
-_WRITE_LOCK = threading.Lock()
 _MAX_LOG_STRING_LENGTH = 2000
+_TRACE_FLUSH_INTERVAL_SECONDS = 1.0
+_TRACE_FLUSH_BATCH_SIZE = 200
+# 끝나지 않은 run의 summary도 이 개수를 넘으면 파일에 쓴 뒤 오래된 것부터 메모리에서 내린다.
+_TRACE_SUMMARY_CACHE_SIZE = 256
+# 이 이벤트가 오면 해당 run의 trace를 바로 파일에 반영한다.
+_RUN_END_EVENTS = {"done", "approval_required"}
+# trace summary를 만드는 이벤트는 sampling에서 제외한다.
+_UNSAMPLED_EVENTS = {
+    ("chat", "ingress"),
+    ("chat", "resume_ingress"),
+    ("chat", "thought"),
+    ("chat", "approval_required"),
+    ("chat", "done"),
+    ("workflow", "snapshot"),
+    ("workflow", "workflow_final_state"),
+    ("profiling", "profile_saved"),
+}
+TRACE_LAYER_POLICY_ENV = "TRACE_LAYER_POLICIES"
+
+TraceVerbosity = Literal["off", "summary", "full"]
+TracePayload = dict[str, Any] | Callable[[], dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class TraceLayerPolicy:
+    verbosity: TraceVerbosity = "full"
+    sample_rate: float = 1.0
+
+
+# workflow snapshot은 기본적으로 이전 snapshot과 달라진 key만 남긴다.
+_DEFAULT_LAYER_POLICIES: dict[str, TraceLayerPolicy] = {
+    "workflow": TraceLayerPolicy(verbosity="summary"),
+}
+_layer_policy_overrides: dict[str, TraceLayerPolicy] = {}
+_env_layer_policies: dict[str, TraceLayerPolicy] | None = None
 
 
 def _truncate_string(value: str, *, max_length: int = _MAX_LOG_STRING_LENGTH) -> str:
@@ -198,6 +242,12 @@ def _update_trace_summary(summary: dict[str, Any], entry: dict[str, Any]) -> Non
     if entry.get("run_id") is not None:
         summary["run_id"] = entry["run_id"]
 
+    if layer == "profiling" and event == "profile_saved":
+        profiles = summary.setdefault("profiles", [])
+        if isinstance(profiles, list):
+            profiles.append(payload)
+        return
+
     if layer == "chat" and event == "ingress":
         summary["question"] = payload.get("question")
         summary["source_id"] = payload.get("source_id")
@@ -329,9 +379,212 @@ def _update_trace_summary(summary: dict[str, Any], entry: dict[str, Any]) -> Non
         )
 
 
-def log_trace(*, layer: str, event: str, payload: dict[str, Any], stage: str | None = None) -> None:
+class _TraceWriter:
+    """trace JSONL append와 trace summary 갱신을 background thread에서 모아서 처리한다."""
+
+    def __init__(
+        self,
+        *,
+        flush_interval_seconds: float,
+        max_batch_size: int,
+        max_cached_summaries: int = _TRACE_SUMMARY_CACHE_SIZE,
+    ) -> None:
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_batch_size = max_batch_size
+        self.max_cached_summaries = max_cached_summaries
+        self._queue: queue.SimpleQueue[dict[str, Any] | threading.Event] = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+        self._pending_lines: list[str] = []
+        self._summaries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._dirty_trace_ids: set[str] = set()
+        self._completed_trace_ids: set[str] = set()
+
+    def enqueue(self, entry: dict[str, Any]) -> None:
+        self._ensure_started()
+        self._queue.put(entry)
+
+    # 지금까지 enqueue된 항목이 파일에 반영될 때까지 기다린다.
+    def flush(self, timeout: float | None = None) -> bool:
+        if self._thread is None:
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                thread = threading.Thread(target=self._run, name="trace-writer", daemon=True)
+                thread.start()
+                self._thread = thread
+
+    def _run(self) -> None:
+        last_flush = monotonic()
+        while True:
+            timeout = max(0.0, self.flush_interval_seconds - (monotonic() - last_flush))
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            flush_now = False
+            try:
+                if isinstance(item, threading.Event):
+                    flush_now = True
+                elif item is not None:
+                    flush_now = self._apply_safely(item)
+
+                if (
+                    flush_now
+                    or len(self._pending_lines) >= self.max_batch_size
+                    or monotonic() - last_flush >= self.flush_interval_seconds
+                ):
+                    self._write_safely()
+                    last_flush = monotonic()
+            finally:
+                # thread가 예외로 멈추면 flush를 기다리는 쪽이 timeout까지 막히므로 항상 깨운다.
+                if isinstance(item, threading.Event):
+                    item.set()
+
+    def _apply_safely(self, entry: dict[str, Any]) -> bool:
+        try:
+            return self._apply(entry)
+        except Exception:
+            logger.exception("trace summary 갱신 실패")
+            return False
+
+    # entry를 JSONL 버퍼와 메모리 summary에 반영하고, run이 끝난 이벤트면 True를 돌려준다.
+    def _apply(self, entry: dict[str, Any]) -> bool:
+        self._pending_lines.append(json.dumps(entry, ensure_ascii=False, default=str))
+        trace_id = entry.get("trace_id")
+        if not isinstance(trace_id, str) or not trace_id:
+            return False
+
+        summary = self._summaries.get(trace_id)
+        if summary is None:
+            summary = _load_trace_summary(_get_trace_summary_path(trace_id), entry)
+            self._summaries[trace_id] = summary
+        else:
+            self._summaries.move_to_end(trace_id)
+        _update_trace_summary(summary, entry)
+        self._dirty_trace_ids.add(trace_id)
+
+        run_finished = entry.get("layer") == "chat" and entry.get("event") in _RUN_END_EVENTS
+        if run_finished:
+            self._completed_trace_ids.add(trace_id)
+        else:
+            self._completed_trace_ids.discard(trace_id)
+        return run_finished
+
+    def _write_safely(self) -> None:
+        try:
+            self._write()
+        except Exception:
+            logger.exception("trace 파일 기록 실패")
+
+    def _write(self) -> None:
+        if self._pending_lines:
+            TRACE_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with TRACE_LOG_PATH.open("a", encoding="utf-8") as handle:
+                handle.write("\n".join(self._pending_lines))
+                handle.write("\n")
+            self._pending_lines = []
+
+        for trace_id in sorted(self._dirty_trace_ids):
+            summary_path = _get_trace_summary_path(trace_id)
+            summary_path.parent.mkdir(parents=True, exist_ok=True)
+            summary_path.write_text(
+                json.dumps(self._summaries[trace_id], ensure_ascii=False, indent=2, default=str),
+                encoding="utf-8",
+            )
+        self._dirty_trace_ids.clear()
+
+        # 끝난 run의 summary는 파일에 남았으므로 메모리에서 내린다. resume되면 파일에서 다시 읽는다.
+        for trace_id in self._completed_trace_ids:
+            self._summaries.pop(trace_id, None)
+        self._completed_trace_ids.clear()
+
+        # done 없이 끊긴 run도 쌓이지 않게 한다. 모두 파일에 쓴 뒤라 내려도 다음 이벤트 때 다시 읽는다.
+        while len(self._summaries) > self.max_cached_summaries:
+            self._summaries.popitem(last=False)
+
+
+_TRACE_WRITER = _TraceWriter(
+    flush_interval_seconds=_TRACE_FLUSH_INTERVAL_SECONDS,
+    max_batch_size=_TRACE_FLUSH_BATCH_SIZE,
+)
+
+
+def flush_trace_logs(timeout: float | None = 5.0) -> bool:
+    return _TRACE_WRITER.flush(timeout)
+
+
+atexit.register(flush_trace_logs)
+
+
+# TRACE_LAYER_POLICIES="llm=summary:0.2,workflow=full" 형식을 읽는다.
+def _parse_layer_policies(raw: str) -> dict[str, TraceLayerPolicy]:
+    policies: dict[str, TraceLayerPolicy] = {}
+    for item in raw.split(","):
+        layer, _, spec = item.strip().partition("=")
+        if not layer or not spec:
+            continue
+        verbosity, _, rate_text = spec.strip().partition(":")
+        if verbosity not in ("off", "summary", "full"):
+            logger.warning("알 수 없는 trace verbosity. layer=%s value=%s", layer, verbosity)
+            continue
+        try:
+            sample_rate = float(rate_text) if rate_text else 1.0
+        except ValueError:
+            logger.warning("잘못된 trace sample rate. layer=%s value=%s", layer, rate_text)
+            sample_rate = 1.0
+        policies[layer.strip()] = TraceLayerPolicy(
+            verbosity=verbosity,
+            sample_rate=min(1.0, max(0.0, sample_rate)),
+        )
+    return policies
+
+
+def get_trace_layer_policy(layer: str) -> TraceLayerPolicy:
+    global _env_layer_policies
+    if layer in _layer_policy_overrides:
+        return _layer_policy_overrides[layer]
+    if _env_layer_policies is None:
+        _env_layer_policies = _parse_layer_policies(os.environ.get(TRACE_LAYER_POLICY_ENV, ""))
+    if layer in _env_layer_policies:
+        return _env_layer_policies[layer]
+    return _DEFAULT_LAYER_POLICIES.get(layer, TraceLayerPolicy())
+
+
+def configure_trace_layer(layer: str, policy: TraceLayerPolicy | None) -> None:
+    if policy is None:
+        _layer_policy_overrides.pop(layer, None)
+    else:
+        _layer_policy_overrides[layer] = policy
+
+
+def get_trace_verbosity(layer: str) -> TraceVerbosity:
+    return get_trace_layer_policy(layer).verbosity
+
+
+def _accepts_trace(layer: str, event: str) -> bool:
+    policy = get_trace_layer_policy(layer)
+    if policy.verbosity == "off":
+        return False
+    if policy.sample_rate >= 1.0 or (layer, event) in _UNSAMPLED_EVENTS:
+        return True
+    return random.random() < policy.sample_rate
+
+
+def log_trace(*, layer: str, event: str, payload: TracePayload, stage: str | None = None) -> None:
+    # payload가 callable이면 layer 정책을 통과한 record만 실제로 만든다.
+    if not _accepts_trace(layer, event):
+        return
     context = get_trace_context()
-    serialized_payload = _to_serializable(payload)
+    serialized_payload = _to_serializable(payload() if callable(payload) else payload)
     entry = {
         "ts": datetime.now(timezone.utc).isoformat(),
         "trace_id": context["trace_id"],
@@ -343,19 +596,4 @@ def log_trace(*, layer: str, event: str, payload: dict[str, Any], stage: str | N
         "payload": serialized_payload,
     }
 
-    TRACE_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
-    line = json.dumps(entry, ensure_ascii=False, default=str)
-    with _WRITE_LOCK:
-        with TRACE_LOG_PATH.open("a", encoding="utf-8") as handle:
-            handle.write(line)
-            handle.write("\n")
-        trace_id = entry.get("trace_id")
-        if isinstance(trace_id, str) and trace_id:
-            summary_path = _get_trace_summary_path(trace_id)
-            summary_path.parent.mkdir(parents=True, exist_ok=True)
-            summary = _load_trace_summary(summary_path, entry)
-            _update_trace_summary(summary, entry)
-            summary_path.write_text(
-                json.dumps(summary, ensure_ascii=False, indent=2, default=str),
-                encoding="utf-8",
-            )
+    _TRACE_WRITER.enqueue(entry)
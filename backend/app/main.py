@@ -3,15 +3,20 @@ from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
 
 from .core.db import Base, engine
+from .core.migrations import run_migrations
 from .modules.analysis import router as analysis_api
 from .modules.chat import models as chat_models
 from .modules.chat import router as chats_api
 from .modules.datasets import models as dataset_models
 from .modules.datasets import router as datasets_api
+from .modules.datasets.dependencies import get_dataset_reader
 from .modules.eda import router as eda_api
 from .modules.guidelines import models as guideline_models
 from .modules.guidelines import router as guidelines_api
+from .modules.metrics import router as metrics_api
+from .modules.preprocess import models as preprocess_models
 from .modules.preprocess import router as preprocess_api
+from .modules.preprocess.dependencies import get_lineage_dataset_reader
 from .modules.rag import models as rag_models
 from .modules.rag import router as rag_router
 from .modules.reports import models as report_models
@@ -22,6 +27,8 @@ from .modules.visualization import router as visualization_api
 load_dotenv()
 
 app = FastAPI()
+# datasets module은 preprocess를 모르므로 lineage dataset을 읽을 수 있는 reader를 여기서 주입한다.
+app.dependency_overrides[get_dataset_reader] = get_lineage_dataset_reader
 
 app.add_middleware(
     CORSMiddleware,
@@ -39,7 +46,7 @@ app.add_middleware(
 
 @app.on_event("startup")
 def on_startup():
-    Base.metadata.create_all(bind=engine)
+    run_migrations(engine, Base.metadata)
 
 
 app.include_router(datasets_api.router)
@@ -50,3 +57,4 @@ app.include_router(visualization_api.router)
 app.include_router(rag_router.router)
 app.include_router(guidelines_api.router)
 app.include_router(preprocess_api.router)
+app.include_router(metrics_api.router)
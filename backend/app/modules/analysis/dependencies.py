@@ -1,9 +1,12 @@
+import os
+
 from fastapi import Depends
 from sqlalchemy.orm import Session
 
 from ...core.db import get_db
-from ..datasets.dependencies import get_dataset_repository
+from ..datasets.dependencies import get_dataset_reader, get_dataset_repository
 from ..datasets.repository import DatasetRepository
+from ..datasets.service import DatasetReader
 from ..planner.dependencies import get_planner_service
 from ..planner.service import PlannerService
 from ..profiling.dependencies import get_dataset_context_service
@@ -16,6 +19,8 @@ from .run_service import AnalysisRunService
 from .sandbox import AnalysisSandbox
 from .service import AnalysisService
 
+ANALYSIS_CANDIDATE_COUNT_ENV = "ANALYSIS_CANDIDATE_COUNT"
+
 
 def build_analysis_processor() -> AnalysisProcessor:
     return AnalysisProcessor()
@@ -49,6 +54,20 @@ def get_results_repository(db: Session = Depends(get_db)) -> ResultsRepository:
     return build_results_repository(db=db)
 
 
+def build_analysis_candidate_count() -> int:
+    """첫 코드 생성 시도에서 병렬로 만들 후보 수. 설정이 없으면 1(직렬)이다."""
+    raw_value = os.getenv(ANALYSIS_CANDIDATE_COUNT_ENV, "").strip()
+    if not raw_value:
+        return 1
+    try:
+        candidate_count = int(raw_value)
+    except ValueError as exc:
+        raise ValueError(f"{ANALYSIS_CANDIDATE_COUNT_ENV} must be an integer: {raw_value!r}") from exc
+    if candidate_count < 1:
+        raise ValueError(f"{ANALYSIS_CANDIDATE_COUNT_ENV} must be at least 1: {raw_value!r}")
+    return candidate_count
+
+
 def build_analysis_service(
     *,
     repository: DatasetRepository,
@@ -59,6 +78,8 @@ def build_analysis_service(
     sandbox: AnalysisSandbox,
     results_repository: ResultsRepository | None = None,
     visualization_service: VisualizationService | None = None,
+    candidate_count: int | None = None,
+    reader: DatasetReader | None = None,
 ) -> AnalysisService:
     return AnalysisService(
         dataset_repository=repository,
@@ -69,6 +90,8 @@ def build_analysis_service(
         sandbox=sandbox,
         results_repository=results_repository,
         visualization_service=visualization_service,
+        candidate_count=build_analysis_candidate_count() if candidate_count is None else candidate_count,
+        reader=reader,
     )
 
 
@@ -81,6 +104,7 @@ def get_analysis_service(
     sandbox: AnalysisSandbox = Depends(get_analysis_sandbox),
     results_repository: ResultsRepository = Depends(get_results_repository),
     visualization_service: VisualizationService = Depends(get_visualization_service),
+    reader: DatasetReader = Depends(get_dataset_reader),
 ) -> AnalysisService:
     return build_analysis_service(
         repository=repository,
@@ -91,4 +115,5 @@ def get_analysis_service(
         sandbox=sandbox,
         results_repository=results_repository,
         visualization_service=visualization_service,
+        reader=reader,
     )
@@ -4,6 +4,7 @@ import ast
 import re
 from typing import Any, Iterable
 
+from ...core.expressions import compile_expression
 from .sandbox import validate_analysis_source_code
 from .schemas import (
     AnalysisError,
@@ -562,7 +563,20 @@ class AnalysisProcessor:
                 )
         if derived_column.expression_type == "ratio" and len(source_columns) != 2:
             raise ValueError("ratio derived column requires exactly 2 source columns")
-        return derived_column.model_copy(update={"source_columns": source_columns})
+        params = derived_column.params
+        expression = params.get("expression")
+        if derived_column.expression_type == "arithmetic" and isinstance(expression, str):
+            # preprocess derived_column과 같은 수식 규칙으로 검증하고 컬럼 이름을 실제 이름으로 바꿔 둔다.
+            compiled = compile_expression(expression)
+            rename = {
+                column: self._resolve_column_name(column, metadata, resolved_columns, set())
+                for column in compiled.columns
+            }
+            params = {**params, "expression": compiled.render(rename)}
+            source_columns = list(dict.fromkeys([*source_columns, *rename.values()]))
+        return derived_column.model_copy(
+            update={"source_columns": source_columns, "params": params}
+        )
 
     def _normalize_sort(
         self,
@@ -7,6 +7,7 @@ from typing import Any
 from langchain_core.messages import HumanMessage, SystemMessage
 
 from ...core.ai import LLMGateway, PromptRegistry
+from ..profiling.prompt_context import DatasetPromptContextBuilder
 from .schemas import (
     AnalysisError,
     AnalysisPlan,
@@ -95,9 +96,15 @@ _CODE_FENCE_RE = re.compile(r"^```(?:python)?\s*|\s*```$", re.MULTILINE)
 class AnalysisRunService:
     """LLM-backed analysis planning and code generation service."""
 
-    def __init__(self, *, default_model: str = "gpt-5-nano") -> None:
+    def __init__(
+        self,
+        *,
+        default_model: str = "gpt-5-nano",
+        prompt_context_builder: DatasetPromptContextBuilder | None = None,
+    ) -> None:
         self.default_model = default_model
         self.llm = LLMGateway(default_model=default_model)
+        self.prompt_context_builder = prompt_context_builder or DatasetPromptContextBuilder()
 
     # 질문을 분석 가능한 의미 구조로 바꾼다.
     def build_question_understanding(
@@ -118,7 +125,7 @@ class AnalysisRunService:
                 HumanMessage(
                     content=(
                         f"question:\n{question.strip()}\n\n"
-                        f"dataset_meta:\n{self._to_json(metadata.model_dump())}"
+                        f"dataset_meta:\n{self.prompt_context_builder.to_prompt_json(metadata, question=question)}"
                     )
                 ),
             ],
@@ -147,7 +154,7 @@ class AnalysisRunService:
                         f"question:\n{question.strip()}\n\n"
                         f"question_understanding:\n{self._to_json(understanding.model_dump())}\n\n"
                         f"column_grounding:\n{self._to_json(grounding.model_dump())}\n\n"
-                        f"dataset_meta:\n{self._to_json(metadata.model_dump())}"
+                        f"dataset_meta:\n{self._build_dataset_meta_json(question, grounding, metadata)}"
                     )
                 ),
             ],
@@ -160,10 +167,12 @@ class AnalysisRunService:
         question: str,
         analysis_plan: AnalysisPlan | dict[str, Any],
         model_id: str | None = None,
+        temperature: float = 0,
     ) -> str:
         plan = self._ensure_plan(analysis_plan)
         result = self.llm.invoke(
             model_id=model_id,
+            temperature=temperature,
             messages=[
                 SystemMessage(content=PROMPTS.load_prompt("code_generation.system")),
                 HumanMessage(
@@ -217,6 +226,18 @@ class AnalysisRunService:
         code = _CODE_FENCE_RE.sub("", code).strip()
         return code
 
+    def _build_dataset_meta_json(
+        self,
+        question: str,
+        grounding: ColumnGroundingResult,
+        metadata: MetadataSnapshot,
+    ) -> str:
+        return self.prompt_context_builder.to_prompt_json(
+            metadata,
+            question=question,
+            required_columns=grounding.resolved_columns.values(),
+        )
+
     def _to_json(self, payload: dict[str, Any]) -> str:
         return json.dumps(payload, ensure_ascii=False, default=str)
 
@@ -7,7 +7,9 @@ import subprocess
 import sys
 import tempfile
 from pathlib import Path
+from time import perf_counter
 
+from ...core.metrics import SANDBOX_EXECUTION_SECONDS
 from .schemas import AnalysisOutputPayload, SandboxExecutionResult
 
 _FORBIDDEN_CALLS = {
@@ -79,6 +81,43 @@ def _extract_root_name(node: ast.Attribute) -> str | None:
     return None
 
 
+class SandboxWorker:
+    """코드를 받기 전에 pandas import와 dataset 로드를 먼저 시작해 두는 sandbox subprocess."""
+
+    def __init__(
+        self,
+        *,
+        process: subprocess.Popen[str],
+        workdir: tempfile.TemporaryDirectory[str],
+        dataset_path: str,
+    ) -> None:
+        self.process = process
+        self.workdir = workdir
+        self.dataset_path = dataset_path
+        self.used = False
+
+    # 생성된 코드를 stdin으로 넘기고 종료될 때까지 기다린다.
+    def run(self, code: str, *, timeout_seconds: int) -> tuple[int, str, str]:
+        self.used = True
+        try:
+            stdout, stderr = self.process.communicate(input=code, timeout=timeout_seconds)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            _, stderr = self.process.communicate()
+            raise subprocess.TimeoutExpired(
+                self.process.args,
+                timeout_seconds,
+                stderr=stderr,
+            ) from None
+        return self.process.returncode, stdout or "", stderr or ""
+
+    def close(self) -> None:
+        if self.process.poll() is None:
+            self.process.kill()
+            self.process.communicate()
+        self.workdir.cleanup()
+
+
 class AnalysisSandbox:
     """Execute generated analysis code in an isolated Python subprocess."""
 
@@ -95,12 +134,28 @@ class AnalysisSandbox:
         self.max_stdout_bytes = max_stdout_bytes
         self.max_stderr_bytes = max_stderr_bytes
 
-    # 코드 파일을 만들어서 실행하고 결과를 받아 표준 구조로 반환한다.
+    # 코드를 sandbox worker에 넘겨 실행하고 결과를 받아 표준 구조로 반환한다.
     def execute(
         self,
         *,
         code: str,
         dataset_path: str,
+        worker: SandboxWorker | None = None,
+    ) -> SandboxExecutionResult:
+        started_at = perf_counter()
+        result = self._execute(code=code, dataset_path=dataset_path, worker=worker)
+        SANDBOX_EXECUTION_SECONDS.observe(
+            perf_counter() - started_at,
+            outcome="ok" if result.ok else (result.error_type or "runtime"),
+        )
+        return result
+
+    def _execute(
+        self,
+        *,
+        code: str,
+        dataset_path: str,
+        worker: SandboxWorker | None,
     ) -> SandboxExecutionResult:
         # 코드가 비어있는지 검사
         source_code = str(code or "").strip()
@@ -119,24 +174,16 @@ class AnalysisSandbox:
                 message=validation_error,
             )
 
-        # 실행용 임시 폴더를 만들고 그 안에 run_analysis.py를 생성한다.
-        with tempfile.TemporaryDirectory(prefix="analysis_exec_") as temp_dir:
-            workdir = Path(temp_dir)
-            script_path = workdir / "run_analysis.py"
-            script_path.write_text(
-                self._build_script(code=source_code, dataset_path=dataset_path),
-                encoding="utf-8",
-            )
-
+        # 미리 띄워 둔 worker가 없거나 이미 쓴 worker면 새로 띄운다.
+        owns_worker = worker is None or worker.used or worker.dataset_path != dataset_path
+        started: SandboxWorker | None = None
+        try:
             try:
-                # subprocess 실행
-                completed = subprocess.run(
-                    [self.python_executable, "-I", str(script_path)],
-                    cwd=str(workdir),
-                    capture_output=True,
-                    text=True,
-                    timeout=self.timeout_seconds,
-                    env=self._build_subprocess_env(),
+                if owns_worker:
+                    worker = started = self.start_worker(dataset_path=dataset_path)
+                returncode, stdout, stderr_text = worker.run(
+                    source_code,
+                    timeout_seconds=self.timeout_seconds,
                 )
             # timeout 처리
             except subprocess.TimeoutExpired as exc:
@@ -146,75 +193,121 @@ class AnalysisSandbox:
                     message="analysis execution timed out",
                     stderr=str(exc.stderr or ""),
                 )
-            # 기타 실행 예외 처리
+            # worker 기동 실패를 포함한 기타 실행 예외 처리
             except Exception as exc:
                 return SandboxExecutionResult(
                     ok=False,
                     error_type="runtime",
                     message=f"failed to execute analysis code: {exc}",
                 )
-            # 프로세스 종료 코드 검사
-            stderr_text = str(completed.stderr or "")
-            if completed.returncode != 0:
-                return SandboxExecutionResult(
-                    ok=False,
-                    error_type="runtime",
-                    message="analysis execution failed",
-                    stderr=stderr_text,
-                )
-            stdout_size = len((completed.stdout or "").encode("utf-8"))
-            stderr_size = len(stderr_text.encode("utf-8"))
-            if stdout_size > self.max_stdout_bytes or stderr_size > self.max_stderr_bytes:
-                return SandboxExecutionResult(
-                    ok=False,
-                    error_type="runtime",
-                    message="analysis execution output exceeded size limit",
-                    stderr=stderr_text[:4000],
-                )
-            # stdout 비었는지 검사
-            stdout_text = str(completed.stdout or "").strip()
-            if not stdout_text:
-                return SandboxExecutionResult(
-                    ok=False,
-                    error_type="invalid_json",
-                    message="analysis execution produced empty stdout",
-                    stderr=stderr_text,
-                )
-            # stdout 문자열을 JSON으로 파싱한다.
-            try:
-                payload = json.loads(stdout_text)
-            except json.JSONDecodeError:
-                return SandboxExecutionResult(
-                    ok=False,
-                    error_type="invalid_json",
-                    message="analysis execution did not return valid JSON",
-                    stderr=stderr_text,
-                )
-            # 출력 스키마를 검증한다.
-            try:
-                output_payload = AnalysisOutputPayload.model_validate(payload)
-            except Exception as exc:
-                return SandboxExecutionResult(
-                    ok=False,
-                    error_type="invalid_json",
-                    message=f"analysis output schema validation failed: {exc}",
-                    stderr=stderr_text,
-                )
+        finally:
+            if started is not None:
+                started.close()
+        return self._build_execution_result(
+            returncode=returncode,
+            stdout=stdout,
+            stderr_text=stderr_text,
+        )
+
+    # 코드 생성(LLM) 동안 interpreter 기동, pandas import, dataset 로드를 미리 진행한다.
+    def start_worker(self, *, dataset_path: str) -> SandboxWorker:
+        workdir = tempfile.TemporaryDirectory(prefix="analysis_exec_")
+        script_path = Path(workdir.name) / "run_analysis.py"
+        script_path.write_text(
+            self._build_script(dataset_path=dataset_path),
+            encoding="utf-8",
+        )
+        try:
+            process = subprocess.Popen(
+                [self.python_executable, "-I", str(script_path)],
+                cwd=workdir.name,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                encoding="utf-8",
+                env=self._build_subprocess_env(),
+            )
+        except Exception:
+            workdir.cleanup()
+            raise
+        return SandboxWorker(process=process, workdir=workdir, dataset_path=dataset_path)
 
+    def _build_execution_result(
+        self,
+        *,
+        returncode: int,
+        stdout: str,
+        stderr_text: str,
+    ) -> SandboxExecutionResult:
+        # 프로세스 종료 코드 검사
+        if returncode != 0:
+            return SandboxExecutionResult(
+                ok=False,
+                error_type="runtime",
+                message="analysis execution failed",
+                stderr=stderr_text,
+            )
+        stdout_size = len(stdout.encode("utf-8"))
+        stderr_size = len(stderr_text.encode("utf-8"))
+        if stdout_size > self.max_stdout_bytes or stderr_size > self.max_stderr_bytes:
+            return SandboxExecutionResult(
+                ok=False,
+                error_type="runtime",
+                message="analysis execution output exceeded size limit",
+                stderr=stderr_text[:4000],
+            )
+        # stdout 비었는지 검사
+        stdout_text = stdout.strip()
+        if not stdout_text:
+            return SandboxExecutionResult(
+                ok=False,
+                error_type="invalid_json",
+                message="analysis execution produced empty stdout",
+                stderr=stderr_text,
+            )
+        # stdout 문자열을 JSON으로 파싱한다.
+        try:
+            payload = json.loads(stdout_text)
+        except json.JSONDecodeError:
             return SandboxExecutionResult(
-                ok=True,
-                stdout_json=output_payload,
+                ok=False,
+                error_type="invalid_json",
+                message="analysis execution did not return valid JSON",
                 stderr=stderr_text,
             )
+        # 출력 스키마를 검증한다.
+        try:
+            output_payload = AnalysisOutputPayload.model_validate(payload)
+        except Exception as exc:
+            return SandboxExecutionResult(
+                ok=False,
+                error_type="invalid_json",
+                message=f"analysis output schema validation failed: {exc}",
+                stderr=stderr_text,
+            )
+
+        return SandboxExecutionResult(
+            ok=True,
+            stdout_json=output_payload,
+            stderr=stderr_text,
+        )
 
-    def _build_script(self, *, code: str, dataset_path: str) -> str:
+    # dataset을 먼저 읽어 두고, 분석 코드는 stdin으로 받아 실행한다.
+    def _build_script(self, *, dataset_path: str) -> str:
         return (
             "from pathlib import Path\n"
             "import json\n"
+            "import sys\n"
             "import pandas as pd\n"
             f"dataset_path = str(Path({dataset_path!r}).resolve())\n"
-            "df = pd.read_csv(dataset_path)\n\n"
-            f"{code}\n"
+            "df = pd.read_csv(dataset_path)\n"
+            "_code = sys.stdin.read()\n"
+            "exec(\n"
+            "    compile(_code, 'run_analysis.py', 'exec'),\n"
+            "    {'__name__': '__main__', 'Path': Path, 'json': json, 'pd': pd,\n"
+            "     'dataset_path': dataset_path, 'df': df},\n"
+            ")\n"
         )
 
     def _build_subprocess_env(self) -> dict[str, str]:
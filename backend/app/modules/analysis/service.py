@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import contextvars
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 from typing import Any
 
+from ...core.profiling import run_in_profiled_thread
 from ..datasets.models import Dataset
 from ..datasets.repository import DatasetRepository
+from ..datasets.service import DatasetReader
 from ..planner.service import PlannerService
 from ..profiling.schemas import DatasetContext
 from ..profiling.service import DatasetContextService
@@ -13,7 +19,7 @@ from ..results.repository import ResultsRepository
 from ..visualization.service import VisualizationService
 from .processor import AnalysisProcessor
 from .run_service import AnalysisRunService
-from .sandbox import AnalysisSandbox
+from .sandbox import AnalysisSandbox, SandboxWorker
 from .schemas import (
     AnalysisError,
     AnalysisExecutionResult,
@@ -24,6 +30,18 @@ from .schemas import (
     QuestionUnderstanding,
 )
 
+# 병렬 후보끼리 같은 코드를 내지 않도록 primary 외 후보에 쓰는 temperature.
+_CANDIDATE_TEMPERATURE = 0.7
+
+
+class _CandidateCancelled(Exception):
+    """다른 병렬 후보가 이미 채택돼 남은 단계를 건너뛸 때 쓴다."""
+
+
+def _raise_if_cancelled(cancelled: threading.Event | None) -> None:
+    if cancelled is not None and cancelled.is_set():
+        raise _CandidateCancelled("analysis candidate cancelled after another candidate was accepted")
+
 
 class AnalysisService:
     """Thin orchestration layer for the analysis pipeline."""
@@ -40,6 +58,8 @@ class AnalysisService:
         results_repository: ResultsRepository | None = None,
         visualization_service: VisualizationService | None = None,
         max_retries: int = 1,
+        candidate_count: int = 1,
+        reader: DatasetReader | None = None,
     ) -> None:
         self.dataset_repository = dataset_repository
         self.dataset_context_service = dataset_context_service
@@ -50,6 +70,8 @@ class AnalysisService:
         self.results_repository = results_repository
         self.visualization_service = visualization_service
         self.max_retries = max_retries
+        self.candidate_count = max(1, candidate_count)
+        self.reader = reader
 
     # profiling 기반 dataset_context를 내부 MetadataSnapshot 호환 shape로 변환한다.
     def build_dataset_metadata(self, source_id: str) -> MetadataSnapshot:
@@ -105,6 +127,9 @@ class AnalysisService:
 
         analysis_plan = planning_result.analysis_plan
         dataset_meta = analysis_plan.metadata_snapshot
+        # sandbox는 storage_path를 직접 읽으므로 lineage dataset이면 먼저 CSV로 materialize한다.
+        if self.reader is not None:
+            self.reader.ensure_file(dataset.storage_path)
 
         execution_bundle = self._run_code_generation_loop(
             question=question,
@@ -153,75 +178,168 @@ class AnalysisService:
         analysis_plan: AnalysisPlan,
         model_id: str | None,
     ) -> dict[str, Any]:
-        generated_code = ""
-        validated_code = ""
-        sandbox_result = None
-        analysis_error = None
-        execution_result = AnalysisExecutionResult(
-            execution_status="fail",
-            error_stage="code_generation",
-            error_message="analysis execution did not start",
-        )
+        bundle: dict[str, Any] = {
+            "generated_code": "",
+            "validated_code": "",
+            "sandbox_result": None,
+            "analysis_result": AnalysisExecutionResult(
+                execution_status="fail",
+                error_stage="code_generation",
+                error_message="analysis execution did not start",
+            ),
+            "analysis_error": None,
+            "final_status": "fail",
+        }
         for attempt in range(self.max_retries + 1):
-            try:
-                # 첫 시도에서는 plan 기반으로 신규 분석 코드를 생성한다.
-                if attempt == 0:
-                    generated_code = self.run_service.generate_analysis_code(
-                        question=question,
-                        analysis_plan=analysis_plan,
-                        model_id=model_id,
-                    )
-                # 실패 이후에는 이전 코드와 에러를 반영해 코드만 수정한다.
-                else:
-                    generated_code = self.run_service.repair_analysis_code(
-                        question=question,
-                        analysis_plan=analysis_plan,
-                        previous_code=generated_code,
-                        analysis_error=analysis_error,
-                        model_id=model_id,
-                    )
-                validated_code = self.processor.validate_generated_code(
-                    generated_code=generated_code,
+            # 첫 시도에서 candidate_count > 1이면 후보 코드를 병렬로 만들고 먼저 통과한 결과를 쓴다.
+            if attempt == 0 and self.candidate_count > 1:
+                bundle = self._run_parallel_candidates(
+                    question=question,
+                    dataset=dataset,
                     analysis_plan=analysis_plan,
+                    model_id=model_id,
                 )
-                sandbox_result = self.sandbox.execute(
-                    code=validated_code,
-                    dataset_path=dataset.storage_path,
-                )
-                execution_result = self.processor.validate_execution_result(
-                    sandbox_result=sandbox_result,
+            else:
+                bundle = self._run_code_attempt(
+                    question=question,
+                    dataset=dataset,
                     analysis_plan=analysis_plan,
+                    model_id=model_id,
+                    attempt=attempt,
+                    previous_code=bundle["generated_code"],
+                    previous_error=bundle["analysis_error"],
                 )
-                if execution_result.execution_status == "success":
-                    return {
-                        "generated_code": generated_code,
-                        "validated_code": validated_code,
-                        "sandbox_result": sandbox_result,
-                        "analysis_result": execution_result,
-                        "analysis_error": None,
-                        "final_status": "success",
-                    }
+            if bundle["final_status"] == "success":
+                return bundle
+        return bundle
 
+    # 후보 코드 생성/실행을 thread마다 돌리고 결과 검증을 먼저 통과한 후보를 채택한다.
+    def _run_parallel_candidates(
+        self,
+        *,
+        question: str,
+        dataset: Dataset,
+        analysis_plan: AnalysisPlan,
+        model_id: str | None,
+    ) -> dict[str, Any]:
+        executor = ThreadPoolExecutor(
+            max_workers=self.candidate_count,
+            thread_name_prefix="analysis-candidate",
+        )
+        cancelled = threading.Event()
+        futures = [
+            executor.submit(
+                contextvars.copy_context().run,
+                run_in_profiled_thread,
+                partial(
+                    self._run_code_attempt,
+                    question=question,
+                    dataset=dataset,
+                    analysis_plan=analysis_plan,
+                    model_id=model_id,
+                    attempt=0,
+                    temperature=0 if index == 0 else _CANDIDATE_TEMPERATURE,
+                    cancelled=cancelled,
+                ),
+            )
+            for index in range(self.candidate_count)
+        ]
+        try:
+            for future in as_completed(futures):
+                bundle = future.result()
+                if bundle["final_status"] == "success":
+                    return bundle
+        finally:
+            # 채택된 뒤 남은 후보는 기다리지 않는다. 이미 실행 중인 후보는 다음 단계 전에 flag를 보고 멈춘다.
+            cancelled.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+        # 모두 실패하면 primary 후보의 실패를 repair 입력으로 넘긴다.
+        return futures[0].result()
+
+    # 코드 생성(또는 repair) 한 번과 그 코드의 검증/실행/결과 검증을 수행한다.
+    def _run_code_attempt(
+        self,
+        *,
+        question: str,
+        dataset: Dataset,
+        analysis_plan: AnalysisPlan,
+        model_id: str | None,
+        attempt: int,
+        previous_code: str = "",
+        previous_error: AnalysisError | None = None,
+        temperature: float = 0,
+        cancelled: threading.Event | None = None,
+    ) -> dict[str, Any]:
+        generated_code = previous_code
+        validated_code = ""
+        sandbox_result = None
+        worker: SandboxWorker | None = None
+        try:
+            # LLM이 코드를 만드는 동안 sandbox worker가 interpreter 기동과 dataset 로드를 먼저 진행한다.
+            worker = self.sandbox.start_worker(dataset_path=dataset.storage_path)
+            _raise_if_cancelled(cancelled)
+            # 첫 시도에서는 plan 기반으로 신규 분석 코드를 생성한다.
+            if attempt == 0:
+                generated_code = self.run_service.generate_analysis_code(
+                    question=question,
+                    analysis_plan=analysis_plan,
+                    model_id=model_id,
+                    temperature=temperature,
+                )
+            # 실패 이후에는 이전 코드와 에러를 반영해 코드만 수정한다.
+            else:
+                generated_code = self.run_service.repair_analysis_code(
+                    question=question,
+                    analysis_plan=analysis_plan,
+                    previous_code=previous_code,
+                    analysis_error=previous_error,
+                    model_id=model_id,
+                )
+            _raise_if_cancelled(cancelled)
+            validated_code = self.processor.validate_generated_code(
+                generated_code=generated_code,
+                analysis_plan=analysis_plan,
+            )
+            sandbox_result = self.sandbox.execute(
+                code=validated_code,
+                dataset_path=dataset.storage_path,
+                worker=worker,
+            )
+            execution_result = self.processor.validate_execution_result(
+                sandbox_result=sandbox_result,
+                analysis_plan=analysis_plan,
+            )
+            if execution_result.execution_status == "success":
+                analysis_error = None
+            else:
                 analysis_error = self.processor.build_error(
                     execution_result.error_stage or "result_validation",
                     execution_result.error_message or "analysis execution failed",
                     detail={"attempt": attempt + 1},
                 )
-            except Exception as exc:
+        except Exception as exc:
+            if worker is None:
+                stage = "sandbox_execution"
+            elif isinstance(exc, _CandidateCancelled):
+                stage = "code_generation"
+            else:
                 stage = "code_generation" if not generated_code else "code_validation"
-                analysis_error = self.processor.build_error(
-                    stage,
-                    str(exc),
-                    detail={
-                        "attempt": attempt + 1,
-                        "exception_type": type(exc).__name__,
-                    },
-                )
-                execution_result = AnalysisExecutionResult(
-                    execution_status="fail",
-                    error_stage=analysis_error.stage,
-                    error_message=analysis_error.message,
-                )
+            analysis_error = self.processor.build_error(
+                stage,
+                str(exc),
+                detail={
+                    "attempt": attempt + 1,
+                    "exception_type": type(exc).__name__,
+                },
+            )
+            execution_result = AnalysisExecutionResult(
+                execution_status="fail",
+                error_stage=analysis_error.stage,
+                error_message=analysis_error.message,
+            )
+        finally:
+            if worker is not None:
+                worker.close()
 
         return {
             "generated_code": generated_code,
@@ -229,7 +347,7 @@ class AnalysisService:
             "sandbox_result": sandbox_result,
             "analysis_result": execution_result,
             "analysis_error": analysis_error,
-            "final_status": "fail",
+            "final_status": "success" if analysis_error is None else "fail",
         }
 
     # 질문이나 plan 초안이 모호할 때 needs_clarification 응답 payload를 만든다.
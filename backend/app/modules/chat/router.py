@@ -1,7 +1,7 @@
 import json
 from typing import Any, AsyncIterator, Dict
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, status
 from fastapi.responses import StreamingResponse
 
 from ...core.trace_logging import get_trace_context
@@ -22,6 +22,13 @@ SSE_HEADERS = {
 }
 
 
+PROFILE_HEADER = "X-Trace-Profile"
+
+
+def _is_profile_requested(flag: bool, header_value: str | None) -> bool:
+    return flag or (header_value or "").strip().lower() in {"1", "true", "yes", "on"}
+
+
 def _format_sse(event: str, data: Dict[str, Any]) -> str:
     return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
 
@@ -52,6 +59,7 @@ def _stream_response(events: AsyncIterator[Dict[str, Any]]) -> StreamingResponse
 async def ask_chat_stream(
     request: ChatRequest,
     chat_service: ChatService = Depends(get_chat_service),
+    profile_header: str | None = Header(default=None, alias=PROFILE_HEADER),
 ):
     normalized_source_id = (request.source_id or "").strip() or None
     if normalized_source_id and not chat_service.has_dataset_source(normalized_source_id):
@@ -67,6 +75,7 @@ async def ask_chat_stream(
             model_id=request.model_id,
             source_id=normalized_source_id,
             trace_id=request.trace_id,
+            profile=_is_profile_requested(request.profile, profile_header),
         )
     )
 
@@ -76,6 +85,7 @@ async def resume_chat_run(
     run_id: str,
     request: ResumeRunRequest,
     chat_service: ChatService = Depends(get_chat_service),
+    profile_header: str | None = Header(default=None, alias=PROFILE_HEADER),
 ):
     if not chat_service.has_session(session_id):
         raise HTTPException(
@@ -104,6 +114,7 @@ async def resume_chat_run(
             stage=request.stage,
             instruction=request.instruction,
             trace_id=request.trace_id,
+            profile=_is_profile_requested(request.profile, profile_header),
         )
     )
 
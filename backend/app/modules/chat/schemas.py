@@ -19,6 +19,7 @@ class ChatRequest(BaseModel):
     model_id: Optional[str] = Field(default=None, description="Optional model identifier.")
     source_id: Optional[str] = Field(default=None, description="Optional dataset source identifier.")
     trace_id: Optional[str] = Field(default=None, description="Optional trace identifier for request logging.")
+    profile: bool = Field(default=False, description="Capture a sampling profile for this run.")
 
 
 class PendingApproval(BaseModel):
@@ -37,6 +38,7 @@ class ResumeRunRequest(BaseModel):
     stage: Literal["preprocess", "visualization", "report"]
     instruction: Optional[str] = None
     trace_id: Optional[str] = None
+    profile: bool = False
 
 
 class PendingApprovalResponse(BaseModel):
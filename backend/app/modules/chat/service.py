@@ -31,6 +31,7 @@ class ChatService:
         model_id: Optional[str] = None,
         source_id: Optional[str] = None,
         trace_id: Optional[str] = None,
+        profile: bool = False,
     ) -> AsyncIterator[Dict[str, Any]]:
         source_id = (source_id or "").strip() or None
         session = self._get_or_create_session(session_id=session_id, title=question)
@@ -81,6 +82,7 @@ class ChatService:
                     question=question,
                     dataset=dataset,
                     model_id=model_id,
+                    profile=profile,
                 ),
                 session=session,
             ):
@@ -95,6 +97,7 @@ class ChatService:
         stage: str,
         instruction: Optional[str] = None,
         trace_id: Optional[str] = None,
+        profile: bool = False,
     ) -> AsyncIterator[Dict[str, Any]]:
         session = self._get_session(session_id)
         if session is None:
@@ -135,6 +138,7 @@ class ChatService:
                         "stage": stage,
                         "instruction": instruction or "",
                     },
+                    profile=profile,
                 ),
                 session=session,
             ):
@@ -238,6 +242,7 @@ class ChatService:
         output_type: str | None = None
         output_payload: Dict[str, Any] | None = None
         chunk_count = 0
+        answer_length = 0
 
         async for event in agent_stream:
             event_type = event.get("type")
@@ -285,16 +290,7 @@ class ChatService:
                 if isinstance(delta, str) and delta:
                     answer_parts.append(delta)
                     chunk_count += 1
-                    log_trace(
-                        layer="chat",
-                        event="chunk",
-                        payload={
-                            "trace_id": trace_id,
-                            "chunk_count": chunk_count,
-                            "accumulated_answer_length": len("".join(answer_parts)),
-                            "last_delta_sample": delta,
-                        },
-                    )
+                    answer_length += len(delta)
                     yield {"event": "chunk", "data": {"delta": delta}}
             elif event_type == "done":
                 final_answer = event.get("answer")
@@ -322,6 +318,18 @@ class ChatService:
                 if isinstance(event_output, dict):
                     output_payload = event_output
 
+        # token 단위 chunk마다 남기면 trace가 답변 길이만큼 늘어나므로 답변마다 한 번만 남긴다.
+        if chunk_count:
+            log_trace(
+                layer="chat",
+                event="chunk",
+                payload={
+                    "trace_id": trace_id,
+                    "chunk_count": chunk_count,
+                    "accumulated_answer_length": answer_length,
+                },
+            )
+
         final_answer = "".join(answer_parts).strip()
         if not final_answer and isinstance(output_payload, dict):
             output_content = output_payload.get("content")
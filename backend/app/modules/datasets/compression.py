@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import gzip
+import io
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any, Literal
+
+logger = logging.getLogger(__name__)
+
+DatasetCompressionCodec = Literal["none", "gzip", "zstd"]
+DatasetCompressionScope = Literal["derived", "all"]
+
+COMPRESSION_SUFFIXES: dict[str, str] = {"gzip": ".gz", "zstd": ".zst"}
+DEFAULT_COMPRESSION_LEVELS: dict[str, int] = {"gzip": 6, "zstd": 3}
+
+DATASET_COMPRESSION_ENV = "DATASET_COMPRESSION"
+DATASET_COMPRESSION_LEVEL_ENV = "DATASET_COMPRESSION_LEVEL"
+DATASET_COMPRESSION_SCOPE_ENV = "DATASET_COMPRESSION_SCOPE"
+
+
+def _zstd_available() -> bool:
+    try:
+        import zstandard  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+@dataclass(frozen=True)
+class DatasetCompressionPolicy:
+    """어떤 dataset 파일을 어떤 codec/level로 압축 저장할지 정한다.
+
+    scope가 "derived"이면 전처리 결과처럼 서버가 만든 파일만, "all"이면 업로드 원본도 압축한다.
+    """
+
+    codec: DatasetCompressionCodec = "none"
+    level: int | None = None
+    scope: DatasetCompressionScope = "derived"
+
+    @classmethod
+    def from_env(cls) -> "DatasetCompressionPolicy":
+        codec = os.getenv(DATASET_COMPRESSION_ENV, "none").strip().lower() or "none"
+        if codec not in ("none", "gzip", "zstd"):
+            raise ValueError(f"{DATASET_COMPRESSION_ENV} must be one of none, gzip, zstd: {codec!r}")
+        scope = os.getenv(DATASET_COMPRESSION_SCOPE_ENV, "derived").strip().lower() or "derived"
+        if scope not in ("derived", "all"):
+            raise ValueError(f"{DATASET_COMPRESSION_SCOPE_ENV} must be derived or all: {scope!r}")
+        raw_level = os.getenv(DATASET_COMPRESSION_LEVEL_ENV, "").strip()
+        level = int(raw_level) if raw_level else None
+        # zstandard는 선택 의존성이라 없으면 gzip으로 낮춘다.
+        if codec == "zstd" and not _zstd_available():
+            logger.warning("zstandard is not installed; falling back to gzip dataset compression")
+            codec = "gzip"
+            level = None
+        return cls(codec=codec, level=level, scope=scope)
+
+    def codec_for(self, *, derived: bool) -> DatasetCompressionCodec:
+        if self.codec == "none" or (self.scope == "derived" and not derived):
+            return "none"
+        return self.codec
+
+    def resolved_level(self, codec: DatasetCompressionCodec) -> int | None:
+        if codec == "none":
+            return None
+        return self.level if self.level is not None else DEFAULT_COMPRESSION_LEVELS[codec]
+
+    def pandas_options(self, codec: DatasetCompressionCodec) -> dict[str, Any] | None:
+        """DataFrame.to_csv(compression=...)에 넘길 값을 만든다."""
+        if codec == "none":
+            return None
+        level = self.resolved_level(codec)
+        if codec == "gzip":
+            return {"method": "gzip", "compresslevel": level, "mtime": 0}
+        return {"method": "zstd", "level": level}
+
+
+def compression_suffix(codec: DatasetCompressionCodec) -> str:
+    return COMPRESSION_SUFFIXES.get(codec, "")
+
+
+def detect_codec(path: str | Path) -> DatasetCompressionCodec:
+    suffix = Path(path).suffix.lower()
+    for codec, codec_suffix in COMPRESSION_SUFFIXES.items():
+        if suffix == codec_suffix:
+            return codec  # type: ignore[return-value]
+    return "none"
+
+
+def strip_compression_suffix(path: str | Path) -> Path:
+    """`a.csv.gz` → `a.csv`. 압축 suffix가 없으면 그대로 돌려준다."""
+    file_path = Path(path)
+    if detect_codec(file_path) == "none":
+        return file_path
+    return file_path.with_suffix("")
+
+
+def open_compressed_writer(
+    target: IO[bytes],
+    codec: DatasetCompressionCodec,
+    level: int | None,
+) -> IO[bytes]:
+    """raw bytes를 받아 codec으로 압축해 target에 쓰는 file object를 연다."""
+    if codec == "none":
+        return target
+    # level 0(gzip 무압축, zstd 기본값)도 유효한 값이라 None일 때만 기본값을 쓴다.
+    resolved = DEFAULT_COMPRESSION_LEVELS[codec] if level is None else level
+    if codec == "gzip":
+        return gzip.GzipFile(fileobj=target, mode="wb", compresslevel=resolved, mtime=0)
+    import zstandard
+
+    return zstandard.ZstdCompressor(level=resolved).stream_writer(target, closefd=False)
+
+
+def open_dataset_binary(path: str | Path) -> IO[bytes]:
+    """압축 여부와 관계없이 원본 bytes를 stream으로 읽는다."""
+    codec = detect_codec(path)
+    if codec == "gzip":
+        return gzip.open(path, "rb")
+    if codec == "zstd":
+        import zstandard
+
+        return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True))
+    return open(path, "rb")
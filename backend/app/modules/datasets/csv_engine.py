@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import logging
+import os
+from dataclasses import dataclass
+from typing import Any, Literal
+
+logger = logging.getLogger(__name__)
+
+CsvEngine = Literal["c", "pyarrow"]
+CsvDtypeBackend = Literal["numpy", "numpy_nullable", "pyarrow"]
+
+DATASET_CSV_ENGINE_ENV = "DATASET_CSV_ENGINE"
+DATASET_DTYPE_BACKEND_ENV = "DATASET_DTYPE_BACKEND"
+
+
+def _pyarrow_available() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+@dataclass(frozen=True)
+class CsvReadOptions:
+    """DatasetReader가 쓸 pandas CSV parser와 dtype backend.
+
+    engine이 "pyarrow"이면 전체 파일 읽기를 여러 thread로 parse한다. pyarrow engine이 지원하지 않는
+    chunksize/nrows 읽기는 C engine으로 읽는다. dtype_backend는 모든 읽기에 같이 적용한다.
+    """
+
+    engine: CsvEngine = "c"
+    dtype_backend: CsvDtypeBackend = "numpy"
+
+    @classmethod
+    def from_env(cls) -> "CsvReadOptions":
+        engine = os.getenv(DATASET_CSV_ENGINE_ENV, "c").strip().lower() or "c"
+        if engine not in ("c", "pyarrow"):
+            raise ValueError(f"{DATASET_CSV_ENGINE_ENV} must be c or pyarrow: {engine!r}")
+        dtype_backend = os.getenv(DATASET_DTYPE_BACKEND_ENV, "numpy").strip().lower() or "numpy"
+        if dtype_backend not in ("numpy", "numpy_nullable", "pyarrow"):
+            raise ValueError(
+                f"{DATASET_DTYPE_BACKEND_ENV} must be one of numpy, numpy_nullable, pyarrow: {dtype_backend!r}"
+            )
+        # pyarrow는 선택 의존성이라 없으면 기본 C engine/numpy dtype으로 낮춘다.
+        if "pyarrow" in (engine, dtype_backend) and not _pyarrow_available():
+            logger.warning("pyarrow is not installed; falling back to the C CSV engine and numpy dtypes")
+            engine = "c"
+            if dtype_backend == "pyarrow":
+                dtype_backend = "numpy"
+        return cls(engine=engine, dtype_backend=dtype_backend)
+
+    def engine_for(self, *, nrows: int | None = None, chunked: bool = False) -> CsvEngine:
+        # pyarrow engine은 chunksize를 지원하지 않고, 앞부분만 읽을 때는 thread 준비 비용이 더 크다.
+        if chunked or nrows is not None:
+            return "c"
+        return self.engine
+
+    def pandas_options(self, *, nrows: int | None = None, chunked: bool = False) -> dict[str, Any]:
+        """pd.read_csv에 더할 engine/dtype_backend 인자. 기본 설정이면 빈 dict라 기존 호출과 같다."""
+        options: dict[str, Any] = {}
+        engine = self.engine_for(nrows=nrows, chunked=chunked)
+        if engine != "c":
+            options["engine"] = engine
+        if self.dtype_backend != "numpy":
+            options["dtype_backend"] = self.dtype_backend
+        return options
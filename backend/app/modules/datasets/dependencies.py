@@ -4,8 +4,11 @@ from fastapi import Depends
 from sqlalchemy.orm import Session
 
 from ...core.db import get_db
+from .compression import DatasetCompressionPolicy
+from .csv_engine import CsvReadOptions
+from .lineage import LineageTransform, MaterializedFrameCache
 from .repository import DatasetRepository
-from .service import DatasetReader, DatasetService, DatasetStorage
+from .service import DERIVED_DIRNAME, DatasetReader, DatasetService, DatasetStorage
 
 
 def _datasets_storage_dir() -> Path:
@@ -28,16 +31,40 @@ def get_data_source_repository(db: Session = Depends(get_db)) -> DatasetReposito
     return build_data_source_repository(db)
 
 
+def build_dataset_compression_policy() -> DatasetCompressionPolicy:
+    return DatasetCompressionPolicy.from_env()
+
+
 def build_dataset_storage() -> DatasetStorage:
-    return DatasetStorage(_datasets_storage_dir())
+    return DatasetStorage(
+        _datasets_storage_dir(),
+        compression=build_dataset_compression_policy(),
+    )
 
 
 def get_dataset_storage() -> DatasetStorage:
     return build_dataset_storage()
 
 
-def build_dataset_reader() -> DatasetReader:
-    return DatasetReader()
+def build_derived_dataset_dir() -> Path:
+    return _datasets_storage_dir() / DERIVED_DIRNAME
+
+
+def build_materialized_frame_cache() -> MaterializedFrameCache:
+    return MaterializedFrameCache(_datasets_storage_dir() / ".materialized")
+
+
+def build_csv_read_options() -> CsvReadOptions:
+    return CsvReadOptions.from_env()
+
+
+def build_dataset_reader(*, lineage_transform: LineageTransform | None = None) -> DatasetReader:
+    # lineage dataset을 materialize할 transform은 datasets가 preprocess에 의존하지 않도록 app 조립 지점에서 넣는다.
+    return DatasetReader(
+        lineage_transform=lineage_transform,
+        materialized_cache=build_materialized_frame_cache(),
+        csv_options=build_csv_read_options(),
+    )
 
 
 def get_dataset_reader() -> DatasetReader:
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import warnings
+from dataclasses import dataclass, replace
+from typing import Any, Iterable
+
+import numpy as np
+import pandas as pd
+
+# 표본에서 고유값 비율이 이보다 낮은 문자열 컬럼만 category로 읽는다.
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+
+_DOWNCAST_INTEGER_DTYPES = ("int8", "int16", "int32")
+# one-hot(uint8)처럼 부호 없는 정수도 CSV로 쓰고 다시 읽으면 int64가 된다.
+_UNSIGNED_INTEGER_DTYPES = ("uint8", "uint16", "uint32", "uint64")
+
+
+@dataclass(frozen=True)
+class DatasetLoadPlan:
+    """profile로 정한 메모리 절약형 dtype. 값은 기본 read_csv 결과와 같고 저장 형식만 작아진다.
+
+    - category_columns: 반복되는 문자열 컬럼을 read_csv 단계에서 category로 읽는다.
+    - datetime_columns: 읽은 뒤 한 번만 datetime64로 바꾼다. 형식이 섞여 실패하면 문자열로 둔다.
+    - downcast_integers: int64 컬럼을 값 범위에 맞는 가장 작은 정수 dtype으로 줄인다.
+    - exclude: 어떤 변환도 하지 않을 컬럼.
+    """
+
+    category_columns: frozenset[str] = frozenset()
+    datetime_columns: frozenset[str] = frozenset()
+    downcast_integers: bool = True
+    exclude: frozenset[str] = frozenset()
+
+    def without(self, columns: Iterable[str]) -> "DatasetLoadPlan":
+        excluded = frozenset(columns)
+        return replace(
+            self,
+            category_columns=self.category_columns - excluded,
+            datetime_columns=self.datetime_columns - excluded,
+            exclude=self.exclude | excluded,
+        )
+
+    def read_options(self, usecols: Iterable[str] | None = None) -> dict[str, Any]:
+        """pd.read_csv에 넘길 dtype 인자. 없는 컬럼 이름은 pandas가 무시한다."""
+        columns = self.category_columns if usecols is None else self.category_columns & set(usecols)
+        if not columns:
+            return {}
+        return {"dtype": {column: "category" for column in sorted(columns)}}
+
+    def apply(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """read_csv 뒤에 남은 변환(datetime 파싱, 정수 downcast, 이미 읽힌 frame의 category 변환)을 적용한다."""
+        converted: dict[str, pd.Series] = {}
+        for column in frame.columns:
+            key = str(column)
+            if key in self.exclude:
+                continue
+            series = frame[column]
+            if key in self.category_columns and not isinstance(series.dtype, pd.CategoricalDtype):
+                if pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series):
+                    converted[key] = series.astype("category")
+            elif key in self.datetime_columns and not pd.api.types.is_datetime64_any_dtype(series):
+                parsed = _parse_datetime(series)
+                if parsed is not None:
+                    converted[key] = parsed
+            elif self.downcast_integers and series.dtype == np.int64:
+                converted[key] = pd.to_numeric(series, downcast="integer")
+        if not converted:
+            return frame
+        return frame.assign(**converted)
+
+
+def _parse_datetime(series: pd.Series) -> pd.Series | None:
+    if not (pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series)):
+        return None
+    try:
+        with warnings.catch_warnings():
+            # 형식을 추론하지 못하면 pandas가 값마다 파싱하며 경고를 낸다. 실패하면 문자열로 둔다.
+            warnings.simplefilter("ignore", UserWarning)
+            return pd.to_datetime(series, errors="raise")
+    except (ValueError, TypeError, OverflowError):
+        return None
+
+
+def csv_dtype_name(dtype: Any) -> str:
+    """기본 설정 read_csv로 다시 읽었을 때의 dtype 이름. load plan 적용 여부와 상관없이 summary가 같게 한다."""
+    if isinstance(dtype, pd.CategoricalDtype):
+        categories = dtype.categories
+        # 전부 결측인 컬럼은 기본 reader가 float64로 읽는다.
+        return str(categories.dtype) if len(categories) else "float64"
+    if isinstance(dtype, pd.SparseDtype):
+        # CSV에는 dense 값이 쓰이므로 원소 dtype 기준으로 정한다.
+        return csv_dtype_name(dtype.subtype)
+    name = str(dtype)
+    if name in _DOWNCAST_INTEGER_DTYPES or name in _UNSIGNED_INTEGER_DTYPES:
+        return "int64"
+    return name
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import csv
+import hashlib
+import io
+import math
+from dataclasses import dataclass, field
+from typing import IO, Any, Optional
+
+# 업로드 스트림을 읽고 디스크에 쓰는 buffer 크기.
+UPLOAD_BUFFER_SIZE = 1024 * 1024
+
+# pandas.read_csv 기본 NA 토큰과 맞춘다.
+CSV_NA_VALUES = frozenset(
+    {
+        "",
+        "#N/A",
+        "#N/A N/A",
+        "#NA",
+        "-1.#IND",
+        "-1.#QNAN",
+        "-NaN",
+        "-nan",
+        "1.#IND",
+        "1.#QNAN",
+        "<NA>",
+        "N/A",
+        "NA",
+        "NULL",
+        "NaN",
+        "None",
+        "n/a",
+        "nan",
+        "null",
+    }
+)
+
+
+class CsvIngestError(Exception):
+    """업로드 스트림이 UTF-8 CSV로 해석되지 않을 때 발생한다."""
+
+
+@dataclass
+class CsvColumnAccumulator:
+    null_count: int = 0
+    numeric: bool = True
+    min_value: Optional[float] = None
+    max_value: Optional[float] = None
+
+    def add(self, value: str) -> None:
+        if value in CSV_NA_VALUES:
+            self.null_count += 1
+            return
+        if not self.numeric:
+            return
+        try:
+            number = float(value)
+        except ValueError:
+            self.numeric = False
+            self.min_value = None
+            self.max_value = None
+            return
+        if math.isnan(number):
+            return
+        if self.min_value is None or number < self.min_value:
+            self.min_value = number
+        if self.max_value is None or number > self.max_value:
+            self.max_value = number
+
+
+@dataclass
+class CsvIngestResult:
+    checksum: str = ""
+    size: int = 0
+    row_count: int = 0
+    columns: list[str] = field(default_factory=list)
+    accumulators: dict[str, CsvColumnAccumulator] = field(default_factory=dict)
+
+    def to_stats(self) -> dict[str, Any]:
+        """Dataset.ingest_stats에 저장할 JSON payload를 만든다."""
+        return {
+            "row_count": self.row_count,
+            "columns": list(self.columns),
+            "null_counts": {
+                column: accumulator.null_count
+                for column, accumulator in self.accumulators.items()
+            },
+            "numeric_ranges": {
+                column: [accumulator.min_value, accumulator.max_value]
+                for column, accumulator in self.accumulators.items()
+                if accumulator.numeric and accumulator.min_value is not None
+            },
+        }
+
+
+class _TeeReader(io.RawIOBase):
+    """업로드 스트림에서 읽은 bytes를 파일 쓰기와 sha256 계산에 그대로 흘려보낸다."""
+
+    def __init__(self, source: IO[bytes], target: IO[bytes]) -> None:
+        self.source = source
+        self.target = target
+        self.hasher = hashlib.sha256()
+        self.size = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self.source.read(len(buffer))
+        if not data:
+            return 0
+        size = len(data)
+        buffer[:size] = data
+        self.hasher.update(data)
+        self.target.write(data)
+        self.size += size
+        return size
+
+
+def ingest_csv_stream(
+    file_stream: IO[bytes],
+    target: IO[bytes],
+    *,
+    buffer_size: int = UPLOAD_BUFFER_SIZE,
+) -> CsvIngestResult:
+    """스트림을 한 번만 읽으면서 저장, sha256, UTF-8/CSV 검증, profile 누적값 계산을 같이 한다."""
+    tee = _TeeReader(file_stream, target)
+    text = io.TextIOWrapper(
+        io.BufferedReader(tee, buffer_size=buffer_size),
+        encoding="utf-8-sig",
+        newline="",
+    )
+    result = CsvIngestResult()
+    try:
+        reader = csv.reader(text)
+        header = next((row for row in reader if row), None)
+        if header is None:
+            raise CsvIngestError("CSV header가 없습니다.")
+        result.columns = header
+        accumulators = [CsvColumnAccumulator() for _ in header]
+        column_count = len(header)
+        for row in reader:
+            if not row:
+                continue
+            if len(row) > column_count:
+                raise CsvIngestError(
+                    f"{reader.line_num}번째 줄의 필드 수가 header보다 많습니다."
+                )
+            for accumulator, value in zip(accumulators, row):
+                accumulator.add(value)
+            # 필드가 모자란 행은 pandas처럼 결측으로 센다.
+            for accumulator in accumulators[len(row):]:
+                accumulator.null_count += 1
+            result.row_count += 1
+    except (UnicodeDecodeError, csv.Error) as exc:
+        raise CsvIngestError(str(exc)) from exc
+    finally:
+        text.detach()
+
+    # 중복 header는 pandas 컬럼명과 달라지므로 profile 쪽에서 seed를 쓰지 않는다.
+    result.accumulators = dict(zip(header, accumulators))
+    result.checksum = tee.hasher.hexdigest()
+    result.size = tee.size
+    return result
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Literal
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+LINEAGE_MANIFEST_SUFFIX = ".lineage.json"
+DEFAULT_MATERIALIZED_CACHE_BYTES = 1024 * 1024 * 1024
+
+MaterializedFrameFormat = Literal["parquet", "pickle"]
+# (부모 frame, JSON operation 목록) -> 파생 frame. DatasetReader가 preprocess에 의존하지 않도록 dependencies에서 주입한다.
+LineageTransform = Callable[[pd.DataFrame, list[dict[str, Any]]], pd.DataFrame]
+
+_CACHE_SUFFIXES: dict[str, str] = {"parquet": ".parquet", "pickle": ".pkl"}
+
+
+def _parquet_available() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def lineage_manifest_path(storage_path: str | Path) -> Path:
+    path = Path(storage_path)
+    return path.with_name(f"{path.name}{LINEAGE_MANIFEST_SUFFIX}")
+
+
+@dataclass(frozen=True)
+class LineageManifest:
+    """아직 파일로 쓰지 않은 파생 dataset을 (부모 dataset + operation 목록)으로 기록한다."""
+
+    parent_source_id: str
+    parent_storage_path: str
+    operations: list[dict[str, Any]] = field(default_factory=list)
+
+    def write(self, storage_path: str | Path) -> Path:
+        target = lineage_manifest_path(storage_path)
+        target.write_text(json.dumps(asdict(self), ensure_ascii=False), encoding="utf-8")
+        return target
+
+    @classmethod
+    def read(cls, storage_path: str | Path) -> "LineageManifest | None":
+        source = lineage_manifest_path(storage_path)
+        if not source.is_file():
+            return None
+        payload = json.loads(source.read_text(encoding="utf-8"))
+        return cls(
+            parent_source_id=str(payload["parent_source_id"]),
+            parent_storage_path=str(payload["parent_storage_path"]),
+            operations=list(payload.get("operations") or []),
+        )
+
+
+class MaterializedFrameCache:
+    """materialize한 lineage frame을 파일로 보관하고 전체 크기가 한도를 넘으면 오래 안 읽힌 것부터 지운다.
+
+    pyarrow가 있으면 parquet, 없으면 pandas pickle(block 단위 배열)로 저장한다.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        *,
+        max_bytes: int = DEFAULT_MATERIALIZED_CACHE_BYTES,
+        frame_format: MaterializedFrameFormat | None = None,
+    ) -> None:
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.frame_format: MaterializedFrameFormat = frame_format or (
+            "parquet" if _parquet_available() else "pickle"
+        )
+
+    @staticmethod
+    def cache_key(storage_path: str | Path) -> str:
+        return hashlib.sha256(str(Path(storage_path).resolve()).encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{_CACHE_SUFFIXES[self.frame_format]}"
+
+    def get(self, key: str) -> pd.DataFrame | None:
+        path = self._entry_path(key)
+        try:
+            frame = pd.read_parquet(path) if self.frame_format == "parquet" else pd.read_pickle(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, pickle.UnpicklingError, EOFError):
+            # 깨진 entry는 버리고 다시 materialize한다.
+            logger.warning("discarding unreadable materialized frame: %s", path)
+            path.unlink(missing_ok=True)
+            return None
+        self._touch(path)
+        return frame
+
+    @staticmethod
+    def _touch(path: Path) -> None:
+        # mtime을 마지막 사용 시각으로 써서 LRU 순서를 정한다. 커널 기본 시각은 해상도가 낮아 직접 넣는다.
+        now = time.time_ns()
+        os.utime(path, ns=(now, now))
+
+    def put(self, key: str, frame: pd.DataFrame) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._entry_path(key)
+        temp_path = self.cache_dir / f".{uuid.uuid4().hex}.tmp"
+        try:
+            if self.frame_format == "parquet":
+                frame.to_parquet(temp_path)
+            else:
+                frame.to_pickle(temp_path)
+            os.replace(temp_path, path)
+            self._touch(path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+        self.evict(keep=path)
+
+    def evict(self, *, keep: Path | None = None) -> None:
+        entries = []
+        for path in self.cache_dir.glob("*"):
+            if path.suffix not in _CACHE_SUFFIXES.values() or not path.is_file():
+                continue
+            stat = path.stat()
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            # 방금 넣은 entry는 한도보다 커도 이번 읽기에서 쓰므로 남긴다.
+            if path == keep:
+                continue
+            path.unlink(missing_ok=True)
+            total -= size
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import JSON, Column, Integer, String
 
 from ...core.db import Base
 
@@ -15,3 +15,8 @@ class Dataset(Base):
     filename = Column(String(255), nullable=False)
     storage_path = Column(String(512), nullable=False)
     filesize = Column(Integer, nullable=True)
+    # 업로드 시 한 번에 계산한 sha256과 profile seed(row/null count, numeric min/max).
+    checksum = Column(String(64), nullable=True)
+    ingest_stats = Column(JSON, nullable=True)
+    # 전처리 summary(DataSummary) 캐시. 다음 전처리의 summary_before로 재사용한다.
+    data_summary = Column(JSON, nullable=True)
@@ -17,6 +17,11 @@ class DatasetRepository:
         self.db.refresh(dataset)
         return dataset
 
+    def update(self, dataset: Dataset) -> Dataset:
+        self.db.commit()
+        self.db.refresh(dataset)
+        return dataset
+
     def list_page(self, skip: int = 0, limit: int = 20) -> List[Dataset]:
         return (
             self.db.query(Dataset)
@@ -32,6 +37,9 @@ class DatasetRepository:
     def get_by_source_id(self, source_id: str) -> Optional[Dataset]:
         return self.db.query(Dataset).filter(Dataset.source_id == source_id).first()
 
+    def count_by_storage_path(self, storage_path: str) -> int:
+        return self.db.query(Dataset).filter(Dataset.storage_path == storage_path).count()
+
     def delete(self, dataset: Dataset) -> None:
         self.db.delete(dataset)
         self.db.commit()
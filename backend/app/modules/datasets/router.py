@@ -62,7 +62,10 @@ async def delete_dataset(
     source_id: str,
     sync_service: DatasetRagSyncService = Depends(get_dataset_rag_sync_service),
 ):
-    deleted = sync_service.delete_dataset(source_id)
+    try:
+        deleted = sync_service.delete_dataset(source_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
     if not deleted:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="데이터셋을 찾을 수 없습니다.")
     return Response(status_code=status.HTTP_204_NO_CONTENT)
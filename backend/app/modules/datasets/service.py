@@ -1,49 +1,188 @@
+import logging
+import os
+import threading
 import uuid
+from dataclasses import dataclass
 from pathlib import Path
 from typing import IO, Any, Iterator, List, Optional
 
 import pandas as pd
 
+from ...core.metrics import DATASET_READ_SECONDS
+from .compression import (
+    COMPRESSION_SUFFIXES,
+    DatasetCompressionCodec,
+    DatasetCompressionPolicy,
+    compression_suffix,
+    open_compressed_writer,
+)
+from .csv_engine import CsvReadOptions
+from .dtypes import DatasetLoadPlan
+from .ingest import UPLOAD_BUFFER_SIZE, CsvIngestError, CsvIngestResult, ingest_csv_stream
+from .lineage import (
+    LINEAGE_MANIFEST_SUFFIX,
+    LineageManifest,
+    LineageTransform,
+    MaterializedFrameCache,
+    lineage_manifest_path,
+)
 from .models import Dataset
 from .repository import DatasetRepository
 
 ALLOWED_DATASET_EXTENSIONS = {".csv"}
+BLOB_DIRNAME = "blobs"
+# 전처리 결과처럼 업로드가 아닌 파생 파일은 blob store 밖의 이 디렉터리에 쓴다.
+DERIVED_DIRNAME = "derived"
 DATASET_READ_ERROR_DETAIL = "데이터셋을 읽을 수 없습니다. UTF-8 CSV인지 확인해 주세요."
 UTF8_CSV_UPLOAD_ERROR_DETAIL = "UTF-8 CSV만 업로드할 수 있습니다."
+LINEAGE_MATERIALIZE_ERROR_DETAIL = "파생 데이터셋을 만들 수 없습니다. 전처리 작업이 원본 데이터와 맞지 않습니다."
+
+logger = logging.getLogger(__name__)
 
 
 class DatasetReadError(Exception):
     """Raised when a stored dataset cannot be read as a UTF-8 CSV."""
 
 
+@dataclass(frozen=True)
+class StagedCsv:
+    """검증을 마치고 blob으로 옮기기 전의 업로드 임시 파일."""
+
+    temp_path: Path
+    extension: str
+    codec: DatasetCompressionCodec
+    result: CsvIngestResult
+
+
 class DatasetStorage:
     """데이터셋 파일 저장/삭제만 담당한다."""
 
-    def __init__(self, storage_dir: Path) -> None:
+    # blob 재사용(upload)과 참조 수 확인 후 삭제(delete)가 서로 끼어들지 않게 한다. 프로세스 안에서만 유효하다.
+    blob_lock = threading.RLock()
+
+    def __init__(
+        self,
+        storage_dir: Path,
+        *,
+        compression: DatasetCompressionPolicy | None = None,
+    ) -> None:
         self.storage_dir = storage_dir
+        self.compression = compression or DatasetCompressionPolicy()
         self.storage_dir.mkdir(parents=True, exist_ok=True)
 
+    def _new_path(self, filename: str) -> Path:
+        return self.storage_dir / f"{uuid.uuid4().hex}_{filename}"
+
     def persist_file(self, file_stream: IO[bytes], filename: str) -> tuple[Path, int]:
         if hasattr(file_stream, "seek"):
             file_stream.seek(0)
 
-        target_path = self.storage_dir / f"{uuid.uuid4().hex}_{filename}"
+        target_path = self._new_path(filename)
         size = 0
-        with open(target_path, "wb") as target:
+        with open(target_path, "wb", buffering=UPLOAD_BUFFER_SIZE) as target:
             while True:
-                chunk = file_stream.read(8192)
+                chunk = file_stream.read(UPLOAD_BUFFER_SIZE)
                 if not chunk:
                     break
                 size += len(chunk)
                 target.write(chunk)
         return target_path, size
 
+    def stage_csv(self, file_stream: IO[bytes], filename: str) -> "StagedCsv":
+        """CSV를 임시 파일로 저장하면서 checksum/검증/profile seed를 한 번의 읽기로 계산한다."""
+        if hasattr(file_stream, "seek"):
+            file_stream.seek(0)
+
+        codec = self.compression.codec_for(derived=False)
+        temp_path = self.storage_dir / f".{uuid.uuid4().hex}.upload.tmp"
+        try:
+            with open(temp_path, "wb", buffering=UPLOAD_BUFFER_SIZE) as raw_target:
+                # checksum/검증은 원본 bytes 기준이고, 디스크에는 policy에 따라 압축해서 쓴다.
+                target = open_compressed_writer(
+                    raw_target,
+                    codec,
+                    self.compression.resolved_level(codec),
+                )
+                try:
+                    result = ingest_csv_stream(file_stream, target)
+                finally:
+                    if target is not raw_target:
+                        target.close()
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+        return StagedCsv(
+            temp_path=temp_path,
+            extension=Path(filename).suffix.lower(),
+            codec=codec,
+            result=result,
+        )
+
+    def commit_staged(self, staged: "StagedCsv") -> Path:
+        """임시 파일을 sha256 blob으로 옮긴다. blob_lock을 잡은 채로 Dataset row까지 만들어야 한다."""
+        # 같은 내용은 sha256 blob 하나를 공유한다. 이미 있으면 방금 쓴 임시 파일만 버린다.
+        checksum = staged.result.checksum
+        existing = self._find_blob(checksum, staged.extension)
+        if existing is not None:
+            staged.temp_path.unlink()
+            return existing
+
+        blob_path = self._blob_dir(checksum) / f"{checksum}{staged.extension}{compression_suffix(staged.codec)}"
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(staged.temp_path, blob_path)
+        return blob_path
+
+    def _blob_dir(self, checksum: str) -> Path:
+        return self.storage_dir / BLOB_DIRNAME / checksum[:2]
+
+    # 압축 policy가 바뀌었어도 같은 내용의 blob은 codec과 관계없이 재사용한다.
+    def _find_blob(self, checksum: str, extension: str) -> Path | None:
+        for suffix in ("", *COMPRESSION_SUFFIXES.values()):
+            candidate = self._blob_dir(checksum) / f"{checksum}{extension}{suffix}"
+            if candidate.exists():
+                return candidate
+        return None
+
     def delete_file(self, storage_path: str) -> None:
+        manifest_path = lineage_manifest_path(storage_path)
+        if manifest_path.exists():
+            # 아직 materialize되지 않은 lineage dataset은 manifest만 있다.
+            manifest_path.unlink()
+            Path(storage_path).unlink(missing_ok=True)
+            return
         Path(storage_path).unlink()
 
+    def lineage_children(self, storage_path: str) -> list[str]:
+        """storage_path를 부모로 기록한 lineage manifest의 dataset 경로."""
+        parent = Path(storage_path).resolve()
+        children: list[str] = []
+        for manifest_path in self.storage_dir.rglob(f"*{LINEAGE_MANIFEST_SUFFIX}"):
+            child = manifest_path.with_name(manifest_path.name[: -len(LINEAGE_MANIFEST_SUFFIX)])
+            manifest = LineageManifest.read(child)
+            if manifest is not None and Path(manifest.parent_storage_path).resolve() == parent:
+                children.append(str(child))
+        return sorted(children)
+
 
 class DatasetReader:
-    """CSV 읽기 책임만 담당한다."""
+    """CSV 읽기 책임만 담당한다. `.gz`/`.zst` 파일은 pandas가 suffix로 판단해 stream으로 풀어 읽는다.
+
+    파일 대신 lineage manifest만 있는 파생 dataset은 처음 읽을 때 부모를 읽어 operation을 적용하고,
+    그 frame을 materialized cache에 보관해 다음 읽기에 재사용한다.
+    load_plan을 주면 profile 기반 dtype(category, 작은 정수, datetime)으로 읽어 메모리를 줄인다.
+    parser engine과 dtype backend는 csv_options로 정한다.
+    """
+
+    def __init__(
+        self,
+        *,
+        lineage_transform: LineageTransform | None = None,
+        materialized_cache: MaterializedFrameCache | None = None,
+        csv_options: CsvReadOptions | None = None,
+    ) -> None:
+        self.lineage_transform = lineage_transform
+        self.materialized_cache = materialized_cache
+        self.csv_options = csv_options or CsvReadOptions()
 
     @staticmethod
     def _resolve_file(storage_path: str) -> Path:
@@ -52,6 +191,104 @@ class DatasetReader:
             raise FileNotFoundError("파일이 존재하지 않습니다.")
         return file_path
 
+    def exists(self, storage_path: str) -> bool:
+        """실제 파일이 있거나 materialize할 수 있는 lineage manifest가 있으면 True."""
+        if Path(storage_path).is_file():
+            return True
+        return lineage_manifest_path(storage_path).is_file()
+
+    def ensure_file(self, storage_path: str) -> Path:
+        """경로를 직접 여는 consumer(sandbox 등)를 위해 lineage dataset을 CSV 파일로 써 둔다."""
+        file_path = Path(storage_path)
+        if file_path.is_file():
+            return file_path
+        manifest = LineageManifest.read(storage_path)
+        if manifest is None:
+            raise FileNotFoundError("파일이 존재하지 않습니다.")
+        frame = self._materialize(storage_path, manifest)
+        temp_path = file_path.with_name(f".{uuid.uuid4().hex}.{file_path.name}")
+        try:
+            frame.to_csv(temp_path, index=False, compression="infer")
+            os.replace(temp_path, file_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+        return file_path
+
+    def _materialize(self, storage_path: str, manifest: LineageManifest) -> pd.DataFrame:
+        if self.lineage_transform is None:
+            raise FileNotFoundError("파일이 존재하지 않습니다.")
+        cache = self.materialized_cache
+        key = MaterializedFrameCache.cache_key(storage_path)
+        if cache is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+        # 부모도 lineage dataset이면 같은 reader가 재귀적으로 materialize한다.
+        parent = self.read_csv(manifest.parent_storage_path)
+        try:
+            with DATASET_READ_SECONDS.time(mode="lineage"):
+                # 부모 index를 그대로 두면 drop된 행 번호가 남아 파일로 다시 읽은 결과와 달라진다.
+                frame = self.lineage_transform(parent, manifest.operations).reset_index(drop=True)
+        except (ValueError, KeyError, TypeError) as exc:
+            raise DatasetReadError(LINEAGE_MATERIALIZE_ERROR_DETAIL) from exc
+        if cache is not None:
+            try:
+                cache.put(key, frame)
+            except Exception:
+                # cache는 다음 읽기를 빠르게 할 뿐이라 저장에 실패해도 이미 만든 frame은 돌려준다.
+                logger.warning("Failed to cache materialized dataset: %s", storage_path, exc_info=True)
+        return frame
+
+    def _read_lineage(
+        self,
+        storage_path: str,
+        *,
+        nrows: Optional[int],
+        usecols: Optional[List[str]],
+    ) -> pd.DataFrame | None:
+        if Path(storage_path).is_file():
+            return None
+        manifest = LineageManifest.read(storage_path)
+        if manifest is None:
+            return None
+        frame = self._materialize(storage_path, manifest)
+        if usecols is not None:
+            missing = [column for column in usecols if column not in frame.columns]
+            if missing:
+                raise ValueError(f"Usecols do not match columns, columns expected but not found: {missing}")
+            # pandas read_csv처럼 파일의 컬럼 순서를 따른다.
+            wanted = set(usecols)
+            frame = frame[[column for column in frame.columns if column in wanted]]
+        if nrows is not None:
+            frame = frame.head(nrows)
+        return frame
+
+    @staticmethod
+    def _parse_csv(
+        file_path: Path,
+        *,
+        encoding: str,
+        nrows: Optional[int],
+        usecols: Optional[List[str]],
+        options: dict[str, Any],
+    ) -> pd.DataFrame:
+        kwargs = {
+            "encoding": encoding,
+            "sep": ",",
+            "compression": "infer",
+            "nrows": nrows,
+            "usecols": usecols,
+        }
+        if options.get("engine") == "pyarrow":
+            try:
+                return pd.read_csv(file_path, **kwargs, **options)
+            except (ImportError, ValueError, TypeError, NotImplementedError) as exc:
+                # pyarrow engine이 못 다루는 옵션/파일은 C engine으로 다시 읽는다. parse 오류도 C engine 기준으로 보고한다.
+                logger.warning("pyarrow CSV engine failed for %s; retrying with the C engine: %s", file_path, exc)
+                options = {key: value for key, value in options.items() if key != "engine"}
+        return pd.read_csv(file_path, **kwargs, **options)
+
     def read_csv(
         self,
         storage_path: str,
@@ -59,18 +296,28 @@ class DatasetReader:
         nrows: Optional[int] = None,
         usecols: Optional[List[str]] = None,
         encoding: str = "utf-8",
+        load_plan: DatasetLoadPlan | None = None,
     ) -> pd.DataFrame:
+        lineage_frame = self._read_lineage(storage_path, nrows=nrows, usecols=usecols)
+        if lineage_frame is not None:
+            return load_plan.apply(lineage_frame) if load_plan is not None else lineage_frame
         file_path = self._resolve_file(storage_path)
+        options = {
+            **(load_plan.read_options(usecols) if load_plan is not None else {}),
+            **self.csv_options.pandas_options(nrows=nrows),
+        }
         try:
-            return pd.read_csv(
-                file_path,
-                encoding=encoding,
-                sep=",",
-                nrows=nrows,
-                usecols=usecols,
-            )
+            with DATASET_READ_SECONDS.time(mode="full" if nrows is None else "head"):
+                frame = self._parse_csv(
+                    file_path,
+                    encoding=encoding,
+                    nrows=nrows,
+                    usecols=usecols,
+                    options=options,
+                )
         except (UnicodeDecodeError, pd.errors.EmptyDataError, pd.errors.ParserError) as exc:
             raise DatasetReadError(DATASET_READ_ERROR_DETAIL) from exc
+        return load_plan.apply(frame) if load_plan is not None else frame
 
     def read_csv_chunks(
         self,
@@ -79,23 +326,39 @@ class DatasetReader:
         chunksize: int,
         usecols: Optional[List[str]] = None,
         encoding: str = "utf-8",
+        load_plan: DatasetLoadPlan | None = None,
     ) -> Iterator[pd.DataFrame]:
+        lineage_frame = self._read_lineage(storage_path, nrows=None, usecols=usecols)
+        if lineage_frame is not None:
+            if load_plan is not None:
+                lineage_frame = load_plan.apply(lineage_frame)
+            return (
+                lineage_frame.iloc[start : start + chunksize]
+                for start in range(0, len(lineage_frame), chunksize)
+            )
         file_path = self._resolve_file(storage_path)
+        options = {
+            **(load_plan.read_options(usecols) if load_plan is not None else {}),
+            **self.csv_options.pandas_options(chunked=True),
+        }
         try:
             reader = pd.read_csv(
                 file_path,
                 encoding=encoding,
                 sep=",",
+                compression="infer",
                 chunksize=chunksize,
                 usecols=usecols,
+                **options,
             )
         except (UnicodeDecodeError, pd.errors.EmptyDataError, pd.errors.ParserError) as exc:
             raise DatasetReadError(DATASET_READ_ERROR_DETAIL) from exc
 
         def iterator() -> Iterator[pd.DataFrame]:
             try:
-                for chunk in reader:
-                    yield chunk
+                with DATASET_READ_SECONDS.time(mode="chunked"):
+                    for chunk in reader:
+                        yield load_plan.apply(chunk) if load_plan is not None else chunk
             except (UnicodeDecodeError, pd.errors.EmptyDataError, pd.errors.ParserError) as exc:
                 raise DatasetReadError(DATASET_READ_ERROR_DETAIL) from exc
 
@@ -125,22 +388,23 @@ class DatasetService:
         if Path(original_filename).suffix.lower() not in ALLOWED_DATASET_EXTENSIONS:
             raise ValueError("CSV 파일만 업로드할 수 있습니다.")
 
-        storage_path, size = self.storage.persist_file(file_stream, original_filename)
         try:
-            self.reader.read_csv(str(storage_path), nrows=5)
-        except DatasetReadError as exc:
-            try:
-                self.storage.delete_file(str(storage_path))
-            except FileNotFoundError:
-                pass
+            staged = self.storage.stage_csv(file_stream, original_filename)
+        except CsvIngestError as exc:
             raise ValueError(UTF8_CSV_UPLOAD_ERROR_DETAIL) from exc
 
-        dataset = Dataset(
-            filename=display_name or original_filename,
-            storage_path=str(storage_path),
-            filesize=size,
-        )
-        return self.repository.create(dataset)
+        ingest = staged.result
+        # 재사용할 blob을 찾은 뒤 row가 생기기 전에 다른 요청이 그 blob을 지우지 못하게 한다.
+        with self.storage.blob_lock:
+            storage_path = self.storage.commit_staged(staged)
+            dataset = Dataset(
+                filename=display_name or original_filename,
+                storage_path=str(storage_path),
+                filesize=ingest.size,
+                checksum=ingest.checksum,
+                ingest_stats=ingest.to_stats(),
+            )
+            return self.repository.create(dataset)
 
     def list_datasets(self, skip: int = 0, limit: int = 20) -> tuple[List[Dataset], int]:
         items = self.repository.list_page(skip=skip, limit=limit)
@@ -155,14 +419,27 @@ class DatasetService:
         if not dataset:
             return False
 
-        try:
-            self.storage.delete_file(dataset.storage_path)
-        except FileNotFoundError:
-            pass
-
-        self.repository.delete(dataset)
+        if self.repository.count_by_storage_path(dataset.storage_path) <= 1:
+            self._materialize_lineage_children(dataset.storage_path)
+        # blob은 같은 storage_path를 가리키는 마지막 Dataset row가 지워질 때만 삭제한다.
+        # 참조 수 확인부터 row 삭제까지 lock 안에서 해야 그 사이 같은 blob을 재사용한 업로드를 지우지 않는다.
+        with self.storage.blob_lock:
+            if self.repository.count_by_storage_path(dataset.storage_path) <= 1:
+                try:
+                    self.storage.delete_file(dataset.storage_path)
+                except FileNotFoundError:
+                    pass
+            self.repository.delete(dataset)
         return True
 
+    def _materialize_lineage_children(self, storage_path: str) -> None:
+        """부모 파일이 지워져도 읽을 수 있도록 아직 manifest뿐인 자식 dataset을 먼저 CSV로 써 둔다."""
+        for child_path in self.storage.lineage_children(storage_path):
+            try:
+                self.reader.ensure_file(child_path)
+            except (FileNotFoundError, DatasetReadError) as exc:
+                raise ValueError("파생 데이터셋을 보존할 수 없어 원본 데이터셋을 삭제할 수 없습니다.") from exc
+
     def get_dataset_sample(self, source_id: str, n_rows: int = 5) -> Optional[dict[str, Any]]:
         dataset = self.repository.get_by_source_id(source_id)
         if not dataset:
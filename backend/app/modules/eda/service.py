@@ -1,5 +1,3 @@
-from pathlib import Path
-
 import pandas as pd
 
 from .ai import generate_eda_ai_summary
@@ -26,7 +24,7 @@ from .schemas import (
 from ..datasets.repository import DataSourceRepository
 from ..datasets.service import DatasetReader
 from ..profiling.schemas import DatasetProfile
-from ..profiling.service import DatasetProfileService
+from ..profiling.service import DatasetProfileService, load_plan_from_profile
 from .ai import detect_issues, recommend
 
 class EDANotFoundError(LookupError):
@@ -47,6 +45,14 @@ def _safe_float(value: object, ndigits: int = 4) -> float | None:
     return round(float(value), ndigits)
 
 
+def _numeric_values(series: pd.Series) -> pd.Series:
+    """숫자로 바꿀 수 있는 값만 float64로 돌려준다.
+
+    load plan이 정수 컬럼을 int8/int16으로 줄여 읽으므로 그대로 두면 max - min 같은 범위 계산이 넘칠 수 있다.
+    """
+    return pd.to_numeric(series, errors="coerce").astype("float64").dropna()
+
+
 def _serialize_label_value(value: object) -> str:
     if pd.isna(value):
         return "null"
@@ -117,11 +123,14 @@ class EDAService:
         if dataset is None or not dataset.storage_path:
             return None
 
-        file_path = Path(dataset.storage_path)
-        if not file_path.exists() or not file_path.is_file():
+        if not self.reader.exists(dataset.storage_path):
             return None
 
-        df = self.reader.read_csv(dataset.storage_path, usecols=numeric_columns)
+        df = self.reader.read_csv(
+            dataset.storage_path,
+            usecols=numeric_columns,
+            load_plan=load_plan_from_profile(profile),
+        )
         if df.empty:
             return EDAStatsResponse(
                 source_id=source_id,
@@ -141,15 +150,18 @@ class EDAService:
         if dataset is None or not dataset.storage_path:
             return None
 
-        file_path = Path(dataset.storage_path)
-        if not file_path.exists() or not file_path.is_file():
+        if not self.reader.exists(dataset.storage_path):
             return None
 
         numeric_columns = [column for column in profile.numeric_columns if column]
         if len(numeric_columns) < 2:
             return EDACorrelationsResponse(source_id=source_id, pairs=[])
 
-        df = self.reader.read_csv(dataset.storage_path, usecols=numeric_columns)
+        df = self.reader.read_csv(
+            dataset.storage_path,
+            usecols=numeric_columns,
+            load_plan=load_plan_from_profile(profile),
+        )
         if df.empty:
             return EDACorrelationsResponse(source_id=source_id, pairs=[])
 
@@ -164,15 +176,18 @@ class EDAService:
         if dataset is None or not dataset.storage_path:
             return None
 
-        file_path = Path(dataset.storage_path)
-        if not file_path.exists() or not file_path.is_file():
+        if not self.reader.exists(dataset.storage_path):
             return None
 
         numeric_columns = [column for column in profile.numeric_columns if column]
         if not numeric_columns:
             return EDAOutliersResponse(source_id=source_id, numeric_column_count=0, columns=[])
 
-        df = self.reader.read_csv(dataset.storage_path, usecols=numeric_columns)
+        df = self.reader.read_csv(
+            dataset.storage_path,
+            usecols=numeric_columns,
+            load_plan=load_plan_from_profile(profile),
+        )
         if df.empty:
             return EDAOutliersResponse(source_id=source_id, numeric_column_count=0, columns=[])
 
@@ -196,8 +211,7 @@ class EDAService:
         if dataset is None or not dataset.storage_path:
             return None
 
-        file_path = Path(dataset.storage_path)
-        if not file_path.exists() or not file_path.is_file():
+        if not self.reader.exists(dataset.storage_path):
             return None
 
         inferred_type = profile.logical_types.get(column)
@@ -206,7 +220,11 @@ class EDAService:
         if inferred_type == "identifier":
             raise EDAUnsupportedRequestError("Identifier columns are not supported for distribution charts.")
 
-        df = self.reader.read_csv(dataset.storage_path, usecols=[column])
+        df = self.reader.read_csv(
+            dataset.storage_path,
+            usecols=[column],
+            load_plan=load_plan_from_profile(profile),
+        )
         if df.empty:
             return EDADistributionResponse(
                 source_id=source_id,
@@ -219,7 +237,7 @@ class EDAService:
 
         series = df[column]
         if inferred_type == "numerical":
-            numeric_series = pd.to_numeric(series, errors="coerce").dropna()
+            numeric_series = _numeric_values(series)
             if numeric_series.empty:
                 return EDADistributionResponse(
                     source_id=source_id,
@@ -274,6 +292,9 @@ class EDAService:
                 bins=distribution_bins,
             )
 
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # category에는 없는 "null" 값을 채울 수 없어 label 계산 전에 일반 값으로 되돌린다.
+            series = series.astype(object)
         all_value_counts = (
             series.fillna("null")
             .map(_serialize_label_value)
@@ -308,11 +329,10 @@ class EDAService:
         if dataset is None or not dataset.storage_path:
             return None
 
-        file_path = Path(dataset.storage_path)
-        if not file_path.exists() or not file_path.is_file():
+        if not self.reader.exists(dataset.storage_path):
             return None
 
-        df = self.reader.read_csv(dataset.storage_path)
+        df = self.reader.read_csv(dataset.storage_path, load_plan=load_plan_from_profile(profile))
         summary = self._build_summary_response(profile)
         quality = self._build_quality_response(profile)
         column_types = self._build_column_types_response(profile)
@@ -432,7 +452,7 @@ class EDAService:
         numeric_columns = [column for column in profile.numeric_columns if column in df.columns]
         stats_columns: list[EDAStatsColumn] = []
         for column in numeric_columns:
-            series = pd.to_numeric(df[column], errors="coerce").dropna()
+            series = _numeric_values(df[column])
             stats_columns.append(
                 EDAStatsColumn(
                     column=column,
@@ -506,7 +526,7 @@ class EDAService:
 
         outlier_columns: list[EDAOutlierColumn] = []
         for column in numeric_columns:
-            series = pd.to_numeric(df[column], errors="coerce").dropna()
+            series = _numeric_values(df[column])
             if series.empty:
                 outlier_columns.append(EDAOutlierColumn(column=column))
                 continue
@@ -636,12 +656,11 @@ class EDAService:
         dataset = self.dataset_repository.get_by_source_id(source_id)
         if dataset is None or not dataset.storage_path:
             return None
-        file_path = Path(dataset.storage_path)
-        if not file_path.exists() or not file_path.is_file():
+        if not self.reader.exists(dataset.storage_path):
             return None
 
         try:
-            df = self.reader.read_csv(dataset.storage_path)
+            df = self.reader.read_csv(dataset.storage_path, load_plan=load_plan_from_profile(profile))
         except FileNotFoundError:
             return None
 
@@ -2,6 +2,7 @@ import uuid
 from pathlib import Path
 from typing import IO, Any, Optional
 
+from ..datasets.ingest import UPLOAD_BUFFER_SIZE
 from .models import Guideline
 from .repository import GuidelineRepository
 
@@ -41,9 +42,9 @@ class GuidelineService:
 
         target_path = self.storage_dir / f"{uuid.uuid4().hex}_{filename}"
         size = 0
-        with open(target_path, "wb") as target:
+        with open(target_path, "wb", buffering=UPLOAD_BUFFER_SIZE) as target:
             while True:
-                chunk = file_stream.read(8192)
+                chunk = file_stream.read(UPLOAD_BUFFER_SIZE)
                 if not chunk:
                     break
                 size += len(chunk)
@@ -3,6 +3,7 @@ from fastapi import Depends
 from ..analysis.processor import AnalysisProcessor
 from ..profiling.dependencies import get_dataset_context_service
 from ..profiling.service import DatasetContextService
+from .schemas import PlanningMode
 from .service import PlannerService
 
 
@@ -11,11 +12,13 @@ def build_planner_service(
     dataset_context_service: DatasetContextService,
     analysis_processor: AnalysisProcessor | None = None,
     default_model: str = "gpt-5-nano",
+    planning_mode: PlanningMode = "combined",
 ) -> PlannerService:
     return PlannerService(
         dataset_context_service=dataset_context_service,
         analysis_processor=analysis_processor or AnalysisProcessor(),
         default_model=default_model,
+        planning_mode=planning_mode,
     )
 
 
@@ -4,10 +4,11 @@ from typing import Literal
 
 from pydantic import BaseModel, Field
 
-from ..analysis.schemas import AnalysisPlan
+from ..analysis.schemas import AnalysisPlan, AnalysisPlanDraft, QuestionUnderstanding
 
 
 PlanningRoute = Literal["general_question", "analysis", "fallback_rag"]
+PlanningMode = Literal["combined", "multi_call"]
 
 
 class PlannerDecision(BaseModel):
@@ -19,6 +20,12 @@ class PlannerDecision(BaseModel):
     guideline_context_used: bool = False
 
 
+class CombinedPlannerOutput(BaseModel):
+    decision: PlannerDecision
+    question_understanding: QuestionUnderstanding | None = None
+    plan_draft: AnalysisPlanDraft | None = None
+
+
 class PlanningResult(BaseModel):
     route: PlanningRoute
     needs_clarification: bool = False
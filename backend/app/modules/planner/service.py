@@ -1,21 +1,26 @@
 from __future__ import annotations
 
 import json
+import logging
 from typing import Any, Mapping
 
 from langchain_core.messages import HumanMessage, SystemMessage
-from pydantic import BaseModel
 
 from ...core.ai import LLMGateway, PromptRegistry
 from ..analysis.processor import AnalysisProcessor
 from ..analysis.schemas import (
+    AnalysisPlan,
     AnalysisPlanDraft,
+    ColumnGroundingResult,
     MetadataSnapshot,
     QuestionUnderstanding,
 )
+from ..profiling.prompt_context import DatasetPromptContextBuilder
 from ..profiling.schemas import DatasetContext
 from ..profiling.service import DatasetContextService
-from .schemas import PlannerDecision, PlanningResult
+from .schemas import CombinedPlannerOutput, PlannerDecision, PlanningMode, PlanningResult
+
+logger = logging.getLogger(__name__)
 
 PROMPTS = PromptRegistry(
     {
@@ -63,6 +68,15 @@ PROMPTS = PromptRegistry(
             "월별/주별/일별 추세 질문에서는 timestamp/date 컬럼을 분석 단계에서 버킷팅하여 집계하라. 이 때문에 preprocess 파생 컬럼이 필요하다고 가정하지 마라. "
             "라인별 평균 불량률 추세 같은 질문이면 time bucket + series(line) + avg metric 구조로 계획하라."
         ),
+        "combined.system": (
+            "너는 데이터 질문 planner다. "
+            "한 번의 응답으로 decision, question_understanding, plan_draft를 모두 채운 CombinedPlannerOutput 스키마로만 반환하라. "
+            "decision은 아래 [decision] 규칙을 따른다. "
+            "decision 기준으로 분석 경로(ask_analysis, preprocess_required, need_visualization, need_report 중 하나라도 true이고 is_general_question이 false)가 아니면 "
+            "question_understanding과 plan_draft는 null로 두어라. "
+            "분석 경로이면 question_understanding은 [question_understanding] 규칙, plan_draft는 [plan_draft] 규칙을 따른다. "
+            "별도의 컬럼 grounding 결과는 주어지지 않으므로 plan_draft의 컬럼은 dataset_context.columns에 있는 실제 컬럼명만 사용하라."
+        ),
     }
 )
 
@@ -76,10 +90,14 @@ class PlannerService:
         dataset_context_service: DatasetContextService,
         analysis_processor: AnalysisProcessor,
         default_model: str = "gpt-5-nano",
+        planning_mode: PlanningMode = "combined",
+        prompt_context_builder: DatasetPromptContextBuilder | None = None,
     ) -> None:
         self.dataset_context_service = dataset_context_service
         self.analysis_processor = analysis_processor
         self.default_model = default_model
+        self.planning_mode = planning_mode
+        self.prompt_context_builder = prompt_context_builder or DatasetPromptContextBuilder()
         self.llm = LLMGateway(default_model=default_model)
 
     def plan(
@@ -103,7 +121,20 @@ class PlannerService:
         if not context.available:
             raise FileNotFoundError(f"dataset context unavailable: {normalized_source_id}")
 
-        decision = self._build_decision(
+        if self.planning_mode == "combined":
+            try:
+                return self._plan_combined(
+                    user_input=user_input,
+                    request_context=request_context,
+                    source_id=normalized_source_id,
+                    dataset_context=context,
+                    guideline_context=guideline_context,
+                    model_id=model_id,
+                )
+            except ValueError as exc:
+                logger.warning("combined planner 결과 검증 실패. multi-call로 fallback. error=%s", exc)
+
+        return self._plan_multi_call(
             user_input=user_input,
             request_context=request_context,
             source_id=normalized_source_id,
@@ -111,33 +142,92 @@ class PlannerService:
             guideline_context=guideline_context,
             model_id=model_id,
         )
-        if not bool((guideline_context or {}).get("has_evidence", False)):
-            decision.guideline_context_used = False
+
+    def _plan_combined(
+        self,
+        *,
+        user_input: str,
+        request_context: str | None,
+        source_id: str,
+        dataset_context: DatasetContext,
+        guideline_context: Mapping[str, Any] | None,
+        model_id: str | None,
+    ) -> PlanningResult:
+        metadata = self._build_metadata_snapshot(dataset_context)
+        output = self._build_combined_output(
+            user_input=user_input,
+            request_context=request_context,
+            source_id=source_id,
+            dataset_context=dataset_context,
+            guideline_context=guideline_context,
+            model_id=model_id,
+        )
+        decision = self._normalize_decision(output.decision, guideline_context)
         route = self._resolve_route(decision)
         if route != "analysis":
-            return PlanningResult(
-                route=route,
-                preprocess_required=decision.preprocess_required,
-                need_visualization=decision.need_visualization,
-                need_report=decision.need_report,
-                guideline_context_used=decision.guideline_context_used,
+            return self._build_result(decision, route=route)
+
+        understanding = output.question_understanding
+        if understanding is None:
+            raise ValueError("combined planner output is missing question_understanding")
+        if understanding.ambiguity_status != "clear":
+            return self._build_result(
+                decision,
+                route="analysis",
+                needs_clarification=True,
+                clarification_question=understanding.clarification_message,
             )
 
-        metadata = self._build_metadata_snapshot(context)
+        plan_draft = output.plan_draft
+        if plan_draft is None:
+            raise ValueError("combined planner output is missing plan_draft")
+        column_grounding = self.analysis_processor.ground_columns(
+            question_understanding=understanding,
+            dataset_meta=metadata,
+        )
+        return self._finalize_analysis_plan(
+            decision=decision,
+            understanding=understanding,
+            column_grounding=column_grounding,
+            plan_draft=plan_draft,
+            dataset_meta=metadata,
+        )
+
+    def _plan_multi_call(
+        self,
+        *,
+        user_input: str,
+        request_context: str | None,
+        source_id: str,
+        dataset_context: DatasetContext,
+        guideline_context: Mapping[str, Any] | None,
+        model_id: str | None,
+    ) -> PlanningResult:
+        decision = self._build_decision(
+            user_input=user_input,
+            request_context=request_context,
+            source_id=source_id,
+            dataset_context=dataset_context,
+            guideline_context=guideline_context,
+            model_id=model_id,
+        )
+        decision = self._normalize_decision(decision, guideline_context)
+        route = self._resolve_route(decision)
+        if route != "analysis":
+            return self._build_result(decision, route=route)
+
+        metadata = self._build_metadata_snapshot(dataset_context)
         understanding = self._build_question_understanding(
             user_input=user_input,
             dataset_meta=metadata,
             model_id=model_id,
         )
         if understanding.ambiguity_status != "clear":
-            return PlanningResult(
+            return self._build_result(
+                decision,
                 route="analysis",
                 needs_clarification=True,
                 clarification_question=understanding.clarification_message,
-                preprocess_required=decision.preprocess_required,
-                need_visualization=decision.need_visualization,
-                need_report=decision.need_report,
-                guideline_context_used=decision.guideline_context_used,
             )
 
         column_grounding = self.analysis_processor.ground_columns(
@@ -151,34 +241,75 @@ class PlannerService:
             dataset_meta=metadata,
             model_id=model_id,
         )
+        return self._finalize_analysis_plan(
+            decision=decision,
+            understanding=understanding,
+            column_grounding=column_grounding,
+            plan_draft=plan_draft,
+            dataset_meta=metadata,
+        )
+
+    def _finalize_analysis_plan(
+        self,
+        *,
+        decision: PlannerDecision,
+        understanding: QuestionUnderstanding,
+        column_grounding: ColumnGroundingResult,
+        plan_draft: AnalysisPlanDraft,
+        dataset_meta: MetadataSnapshot,
+    ) -> PlanningResult:
         if plan_draft.ambiguity_status != "clear":
             clarification_question = (
                 plan_draft.clarification_message or understanding.clarification_message
             )
-            return PlanningResult(
+            return self._build_result(
+                decision,
                 route="analysis",
                 needs_clarification=True,
                 clarification_question=clarification_question,
-                preprocess_required=decision.preprocess_required,
-                need_visualization=decision.need_visualization,
-                need_report=decision.need_report,
-                guideline_context_used=decision.guideline_context_used,
             )
 
         analysis_plan = self.analysis_processor.validate_and_finalize_plan(
             plan_draft=plan_draft,
-            dataset_meta=metadata,
+            dataset_meta=dataset_meta,
             column_grounding=column_grounding,
         )
-        return PlanningResult(
-            route="analysis",
-            preprocess_required=decision.preprocess_required,
-            analysis_plan=analysis_plan,
-            need_visualization=decision.need_visualization,
-            need_report=decision.need_report,
-            guideline_context_used=decision.guideline_context_used,
+        return self._build_result(decision, route="analysis", analysis_plan=analysis_plan)
+
+    def _build_combined_output(
+        self,
+        *,
+        user_input: str,
+        request_context: str | None,
+        source_id: str,
+        dataset_context: DatasetContext,
+        guideline_context: Mapping[str, Any] | None,
+        model_id: str | None,
+    ) -> CombinedPlannerOutput:
+        return self.llm.invoke_structured(
+            schema=CombinedPlannerOutput,
+            model_id=model_id,
+            messages=[
+                SystemMessage(content=self._build_combined_system_prompt()),
+                HumanMessage(
+                    content=(
+                        f"user_input:\n{user_input.strip()}\n\n"
+                        f"request_context:\n{str(request_context or '').strip()}\n\n"
+                        f"source_id:\n{source_id}\n\n"
+                        f"dataset_context:\n{self.prompt_context_builder.to_prompt_json(dataset_context, question=user_input)}\n\n"
+                        f"guideline_context:\n{self._to_json(dict(guideline_context or {}))}"
+                    )
+                ),
+            ],
         )
 
+    @staticmethod
+    def _build_combined_system_prompt() -> str:
+        sections = [PROMPTS.load_prompt("combined.system")]
+        for key in ("decision", "question_understanding", "plan_draft"):
+            sections.append(f"[{key}]\n{PROMPTS.load_prompt(f'{key}.system')}")
+        return "\n\n".join(sections)
+
     def _build_decision(
         self,
         *,
@@ -199,7 +330,7 @@ class PlannerService:
                         f"user_input:\n{user_input.strip()}\n\n"
                         f"request_context:\n{str(request_context or '').strip()}\n\n"
                         f"source_id:\n{source_id}\n\n"
-                        f"dataset_context:\n{self._to_json(dataset_context.model_dump())}\n\n"
+                        f"dataset_context:\n{self.prompt_context_builder.to_prompt_json(dataset_context, question=user_input)}\n\n"
                         f"guideline_context:\n{self._to_json(dict(guideline_context or {}))}"
                     )
                 ),
@@ -221,7 +352,7 @@ class PlannerService:
                 HumanMessage(
                     content=(
                         f"question:\n{user_input.strip()}\n\n"
-                        f"dataset_meta:\n{self._to_json(dataset_meta.model_dump())}"
+                        f"dataset_meta:\n{self.prompt_context_builder.to_prompt_json(dataset_meta, question=user_input)}"
                     )
                 ),
             ],
@@ -232,7 +363,7 @@ class PlannerService:
         *,
         user_input: str,
         question_understanding: QuestionUnderstanding,
-        column_grounding: BaseModel,
+        column_grounding: ColumnGroundingResult,
         dataset_meta: MetadataSnapshot,
         model_id: str | None,
     ) -> AnalysisPlanDraft:
@@ -246,12 +377,24 @@ class PlannerService:
                         f"question:\n{user_input.strip()}\n\n"
                         f"question_understanding:\n{self._to_json(question_understanding.model_dump())}\n\n"
                         f"column_grounding:\n{self._to_json(column_grounding.model_dump())}\n\n"
-                        f"dataset_meta:\n{self._to_json(dataset_meta.model_dump())}"
+                        f"dataset_meta:\n{self._build_plan_draft_meta_json(user_input, column_grounding, dataset_meta)}"
                     )
                 ),
             ],
         )
 
+    def _build_plan_draft_meta_json(
+        self,
+        user_input: str,
+        column_grounding: ColumnGroundingResult,
+        dataset_meta: MetadataSnapshot,
+    ) -> str:
+        return self.prompt_context_builder.to_prompt_json(
+            dataset_meta,
+            question=user_input,
+            required_columns=column_grounding.resolved_columns.values(),
+        )
+
     def _ensure_dataset_context(
         self,
         *,
@@ -277,6 +420,35 @@ class PlannerService:
             return "analysis"
         return "fallback_rag"
 
+    @staticmethod
+    def _normalize_decision(
+        decision: PlannerDecision,
+        guideline_context: Mapping[str, Any] | None,
+    ) -> PlannerDecision:
+        if not bool((guideline_context or {}).get("has_evidence", False)):
+            decision.guideline_context_used = False
+        return decision
+
+    @staticmethod
+    def _build_result(
+        decision: PlannerDecision,
+        *,
+        route: str,
+        needs_clarification: bool = False,
+        clarification_question: str = "",
+        analysis_plan: AnalysisPlan | None = None,
+    ) -> PlanningResult:
+        return PlanningResult(
+            route=route,
+            needs_clarification=needs_clarification,
+            clarification_question=clarification_question,
+            preprocess_required=decision.preprocess_required,
+            analysis_plan=analysis_plan,
+            need_visualization=decision.need_visualization,
+            need_report=decision.need_report,
+            guideline_context_used=decision.guideline_context_used,
+        )
+
     @staticmethod
     def _build_metadata_snapshot(dataset_context: DatasetContext) -> MetadataSnapshot:
         return MetadataSnapshot(
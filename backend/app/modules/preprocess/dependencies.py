@@ -1,12 +1,26 @@
+import os
+
 from fastapi import Depends
+from sqlalchemy.orm import Session
 
-from ..datasets.dependencies import get_dataset_reader, get_dataset_repository
+from ...core.db import get_db
+from ..datasets.compression import DatasetCompressionPolicy
+from ..datasets.dependencies import (
+    build_dataset_compression_policy,
+    build_dataset_reader,
+    build_derived_dataset_dir,
+    get_dataset_reader,
+    get_dataset_repository,
+)
 from ..datasets.repository import DatasetRepository
 from ..datasets.service import DatasetReader
 from ..profiling.dependencies import get_dataset_profile_service
 from ..profiling.service import DatasetProfileService
 from .processor import PreprocessProcessor
-from .service import PreprocessService
+from .repository import PreprocessPipelineRepository
+from .service import DEFAULT_STREAMING_THRESHOLD_BYTES, PreprocessService
+
+PREPROCESS_STREAMING_THRESHOLD_BYTES_ENV = "PREPROCESS_STREAMING_THRESHOLD_BYTES"
 
 
 def build_preprocess_processor() -> PreprocessProcessor:
@@ -17,18 +31,58 @@ def get_preprocess_processor() -> PreprocessProcessor:
     return build_preprocess_processor()
 
 
+def build_lineage_dataset_reader() -> DatasetReader:
+    """lazy 전처리 결과(lineage manifest)를 preprocess operation으로 materialize하는 DatasetReader."""
+    return build_dataset_reader(lineage_transform=build_preprocess_processor().replay_operations)
+
+
+def get_lineage_dataset_reader() -> DatasetReader:
+    return build_lineage_dataset_reader()
+
+
+def build_preprocess_pipeline_repository(db: Session) -> PreprocessPipelineRepository:
+    return PreprocessPipelineRepository(db)
+
+
+def get_preprocess_pipeline_repository(db: Session = Depends(get_db)) -> PreprocessPipelineRepository:
+    return build_preprocess_pipeline_repository(db)
+
+
+def build_preprocess_streaming_threshold_bytes() -> int:
+    """이 크기(byte) 이상인 입력을 chunk 단위로 전처리한다. 설정이 없으면 기본 256MB다."""
+    raw_value = os.getenv(PREPROCESS_STREAMING_THRESHOLD_BYTES_ENV, "").strip()
+    if not raw_value:
+        return DEFAULT_STREAMING_THRESHOLD_BYTES
+    try:
+        threshold = int(raw_value)
+    except ValueError as exc:
+        raise ValueError(f"{PREPROCESS_STREAMING_THRESHOLD_BYTES_ENV} must be an integer: {raw_value!r}") from exc
+    if threshold < 0:
+        raise ValueError(f"{PREPROCESS_STREAMING_THRESHOLD_BYTES_ENV} must not be negative: {raw_value!r}")
+    return threshold
+
+
 def build_preprocess_service(
     *,
     repository: DatasetRepository,
     reader: DatasetReader,
     processor: PreprocessProcessor,
     profile_service: DatasetProfileService,
+    compression: DatasetCompressionPolicy | None = None,
+    pipeline_repository: PreprocessPipelineRepository | None = None,
+    streaming_threshold_bytes: int | None = None,
 ) -> PreprocessService:
+    if streaming_threshold_bytes is None:
+        streaming_threshold_bytes = build_preprocess_streaming_threshold_bytes()
     return PreprocessService(
         repository=repository,
         reader=reader,
         processor=processor,
         profile_service=profile_service,
+        compression=compression or build_dataset_compression_policy(),
+        pipeline_repository=pipeline_repository,
+        output_dir=build_derived_dataset_dir(),
+        streaming_threshold_bytes=streaming_threshold_bytes,
     )
 
 
@@ -37,10 +91,12 @@ def get_preprocess_service(
     reader: DatasetReader = Depends(get_dataset_reader),
     processor: PreprocessProcessor = Depends(get_preprocess_processor),
     profile_service: DatasetProfileService = Depends(get_dataset_profile_service),
+    pipeline_repository: PreprocessPipelineRepository = Depends(get_preprocess_pipeline_repository),
 ) -> PreprocessService:
     return build_preprocess_service(
         repository=repository,
         reader=reader,
         processor=processor,
         profile_service=profile_service,
+        pipeline_repository=pipeline_repository,
     )
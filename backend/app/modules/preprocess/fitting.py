@@ -0,0 +1,685 @@
+from __future__ import annotations
+
+import math
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+import numpy as np
+import pandas as pd
+
+from ...core.expressions import compile_expression
+from .schemas import PreprocessOperation
+
+DEFAULT_QUANTILE_SAMPLE_SIZE = 200_000
+NUMERIC_RATIO_THRESHOLD = 0.98
+
+FittedParams = dict[str, Any]
+
+
+@dataclass(frozen=True)
+class OperationFootprint:
+    """operation이 읽고 바꾸는 범위. None은 "모든 컬럼"을 뜻한다."""
+
+    reads: frozenset[str] | None
+    writes: frozenset[str] | None
+    filters_rows: bool = False
+
+
+def operation_footprint(operation: PreprocessOperation) -> OperationFootprint:
+    op = operation.op
+    if op == "drop_missing":
+        reads = frozenset(operation.columns) if operation.columns else None
+        return OperationFootprint(reads=reads, writes=frozenset(), filters_rows=True)
+    if op == "drop_columns":
+        return OperationFootprint(reads=frozenset(), writes=frozenset(operation.columns))
+    if op == "rename_columns":
+        return OperationFootprint(
+            reads=frozenset(operation.rename_from),
+            writes=frozenset([*operation.rename_from, *operation.rename_to]),
+        )
+    if op == "derived_column":
+        if operation.expression:
+            reads = frozenset(compile_expression(operation.expression).columns)
+        else:
+            reads = frozenset(operation.source_columns)
+        return OperationFootprint(reads=reads, writes=frozenset([operation.name]))
+    if op == "encode_categorical" and operation.method == "one_hot":
+        # dummy 컬럼 이름은 fit 전까지 알 수 없다.
+        return OperationFootprint(reads=frozenset(operation.columns), writes=None)
+    if op == "outlier":
+        return OperationFootprint(
+            reads=frozenset(operation.columns),
+            writes=frozenset(operation.columns),
+            filters_rows=operation.strategy == "drop",
+        )
+    columns = frozenset(getattr(operation, "columns", []) or [])
+    return OperationFootprint(reads=columns, writes=columns)
+
+
+class QuantileSketch:
+    """값을 모아 quantile을 계산한다. exact가 아니면 크기 제한이 있는 균등 표본으로 근사한다."""
+
+    def __init__(self, *, exact: bool = True, sample_size: int = DEFAULT_QUANTILE_SAMPLE_SIZE) -> None:
+        self.exact = exact
+        self.sample_size = sample_size
+        self.count = 0
+        self._parts: list[np.ndarray] = []
+        self._stored = 0
+        self._rng = np.random.default_rng(0)
+
+    def update(self, values: np.ndarray) -> None:
+        values = np.asarray(values, dtype="float64")
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return
+        seen_before = self.count
+        self.count += len(values)
+        if self.exact or self._stored + len(values) <= self.sample_size:
+            self._parts.append(values)
+            self._stored += len(values)
+            return
+
+        # 기존 표본(seen_before개 대표)과 새 값(len(values)개)에서 비율대로 뽑아 균등 표본을 유지한다.
+        stored = np.concatenate(self._parts)
+        take_new = int(self._rng.hypergeometric(len(values), seen_before, self.sample_size))
+        sample = np.concatenate(
+            [
+                self._rng.choice(stored, self.sample_size - take_new, replace=False),
+                self._rng.choice(values, take_new, replace=False),
+            ]
+        )
+        self._parts = [sample]
+        self._stored = len(sample)
+
+    @property
+    def is_exact(self) -> bool:
+        return self._stored == self.count
+
+    def quantile(self, q: float) -> float:
+        if not self._stored:
+            return math.nan
+        if len(self._parts) > 1:
+            self._parts = [np.concatenate(self._parts)]
+        return float(np.quantile(self._parts[0], q))
+
+
+class MomentAccumulator:
+    """count/mean/M2/min/max를 chunk 단위로 합친다(Chan 병합식)."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.nan
+        self.max = math.nan
+
+    def update(self, values: np.ndarray) -> None:
+        values = np.asarray(values, dtype="float64")
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return
+        chunk_count = len(values)
+        chunk_mean = float(values.mean())
+        chunk_m2 = float(((values - chunk_mean) ** 2).sum())
+        total = self.count + chunk_count
+        delta = chunk_mean - self.mean
+        self.mean += delta * chunk_count / total
+        self.m2 += chunk_m2 + delta * delta * self.count * chunk_count / total
+        self.count = total
+        chunk_min = float(values.min())
+        chunk_max = float(values.max())
+        self.min = chunk_min if math.isnan(self.min) else min(self.min, chunk_min)
+        self.max = chunk_max if math.isnan(self.max) else max(self.max, chunk_max)
+
+    def std(self) -> float:
+        if not self.count:
+            return math.nan
+        return math.sqrt(self.m2 / self.count)
+
+
+class _NumericCheck:
+    """_numeric_series_or_raise와 같은 기준(결측 제외 98% 이상 숫자)을 전체 데이터에 대해 누적한다."""
+
+    def __init__(self, *, operation: str, column: str) -> None:
+        self.operation = operation
+        self.column = column
+        self.non_null = 0
+        self.numeric = 0
+
+    def update(self, series: pd.Series, numeric: pd.Series | None = None) -> pd.Series:
+        numeric_series = pd.to_numeric(series, errors="coerce") if numeric is None else numeric
+        self.non_null += int(series.notna().sum())
+        self.numeric += int(numeric_series.notna().sum())
+        return numeric_series
+
+    def validate(self) -> None:
+        if self.non_null == 0:
+            raise ValueError(f"{self.operation} requires a numeric column: {self.column}")
+        if float(self.numeric) / float(self.non_null) < NUMERIC_RATIO_THRESHOLD:
+            raise ValueError(f"{self.operation} requires a numeric column: {self.column}")
+
+
+def _require_columns(frame: pd.DataFrame, columns: Iterable[str]) -> None:
+    for column in columns:
+        if column not in frame.columns:
+            raise ValueError(f"Column not found: {column}")
+
+
+def _to_python(value: Any) -> Any:
+    return value.item() if hasattr(value, "item") else value
+
+
+def to_jsonable(value: Any) -> Any:
+    """fit parameter를 JSON column에 저장할 수 있는 값으로 바꾼다."""
+    if isinstance(value, dict):
+        return {str(key): to_jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_jsonable(item) for item in value]
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _sorted_values(values: Iterable[Any]) -> list[Any]:
+    items = list(values)
+    try:
+        return sorted(items)
+    except TypeError:
+        return sorted(items, key=str)
+
+
+def _unify_numbers(values: set[Any]) -> set[Any]:
+    """chunk마다 int/float로 다르게 읽힌 숫자 category를 전체 read 때처럼 float로 맞춘다."""
+    numbers = [value for value in values if isinstance(value, (int, float)) and not isinstance(value, bool)]
+    if len(numbers) != len(values) or not any(isinstance(value, float) for value in numbers):
+        return values
+    return {float(value) for value in numbers}
+
+
+def _one_hot_mode(operation: PreprocessOperation, category_count: int) -> str:
+    """category 수에 따라 one_hot 컬럼을 dense/sparse/hash 중 어떤 방식으로 만들지 정한다."""
+    if category_count > operation.max_categories:
+        return operation.high_cardinality
+    return "sparse" if operation.dtype == "sparse" else "dense"
+
+
+def _hashed_dummies(series: pd.Series, column: str, buckets: int) -> pd.DataFrame:
+    """값을 고정 key hash로 bucket에 나눠 bucket별 0/1 sparse 컬럼을 만든다. 결측은 모든 bucket이 0이다."""
+    present = series.notna().to_numpy()
+    hashed = pd.util.hash_array(series.astype(str).to_numpy(dtype=object)) % np.uint64(buckets)
+    bucket_codes = np.where(present, hashed.astype("int64"), -1)
+    values = pd.Categorical.from_codes(bucket_codes, categories=range(buckets))
+    dummies = pd.get_dummies(values, dtype=np.uint8, sparse=True).set_axis(series.index)
+    return dummies.set_axis([f"{column}_hash_{bucket}" for bucket in range(buckets)], axis=1)
+
+
+def is_column_local(operation: PreprocessOperation) -> bool:
+    """대상 컬럼 값만 읽고 그 컬럼만 바꾸는 operation인지 확인한다."""
+    op = operation.op
+    if op in {"impute", "scale", "parse_datetime"}:
+        return True
+    if op == "encode_categorical":
+        return operation.method == "label"
+    return op == "outlier" and operation.strategy == "clip"
+
+
+def is_row_filter(operation: PreprocessOperation) -> bool:
+    return operation.op == "drop_missing" or (operation.op == "outlier" and operation.strategy == "drop")
+
+
+def needs_numeric(operation: PreprocessOperation) -> bool:
+    """컬럼을 숫자로 변환한 값이 필요한 operation인지 확인한다."""
+    if operation.op == "impute":
+        return operation.method in {"mean", "median"}
+    return operation.op in {"scale", "outlier"}
+
+
+class OperationFitter:
+    """stateful operation의 fit parameter를 chunk 단위로 누적한다."""
+
+    def __init__(self, operation: PreprocessOperation, *, exact: bool) -> None:
+        self.operation = operation
+        self.exact = exact
+
+    def update(self, frame: pd.DataFrame) -> None:
+        _require_columns(frame, self.operation.columns)
+        numeric = needs_numeric(self.operation)
+        for column in self.operation.columns:
+            series = frame[column]
+            self.update_column(column, series, pd.to_numeric(series, errors="coerce") if numeric else None)
+
+    def update_column(self, column: str, series: pd.Series, numeric: pd.Series | None) -> None:
+        raise NotImplementedError
+
+    def finalize(self) -> FittedParams:
+        raise NotImplementedError
+
+
+class _ImputeFitter(OperationFitter):
+    def __init__(self, operation: PreprocessOperation, *, exact: bool) -> None:
+        super().__init__(operation, exact=exact)
+        method = operation.method
+        label = f"impute.method '{method}'"
+        self.checks = {column: _NumericCheck(operation=label, column=column) for column in operation.columns}
+        self.moments = {column: MomentAccumulator() for column in operation.columns}
+        self.sketches = {column: QuantileSketch(exact=exact) for column in operation.columns}
+        self.counts: dict[str, Counter] = {column: Counter() for column in operation.columns}
+
+    def update_column(self, column: str, series: pd.Series, numeric: pd.Series | None) -> None:
+        method = self.operation.method
+        if method == "mode":
+            for value, count in series.value_counts(dropna=True).items():
+                self.counts[column][_to_python(value)] += int(count)
+            return
+        values = self.checks[column].update(series, numeric).to_numpy(dtype="float64")
+        if method == "mean":
+            self.moments[column].update(values)
+        else:
+            self.sketches[column].update(values)
+
+    def finalize(self) -> FittedParams:
+        method = self.operation.method
+        fill: dict[str, Any] = {}
+        for column in self.operation.columns:
+            if method == "mode":
+                counts = self.counts[column]
+                if counts:
+                    top = max(counts.values())
+                    fill[column] = _sorted_values(value for value, count in counts.items() if count == top)[0]
+                else:
+                    fill[column] = self.operation.value
+                continue
+            self.checks[column].validate()
+            value = self.moments[column].mean if method == "mean" else self.sketches[column].quantile(0.5)
+            if method == "mean" and not self.moments[column].count:
+                value = math.nan
+            if math.isnan(value):
+                raise ValueError(f"impute.method '{method}' requires a numeric column: {column}")
+            fill[column] = float(value)
+        return {"fill": fill}
+
+
+class _ScaleFitter(OperationFitter):
+    def __init__(self, operation: PreprocessOperation, *, exact: bool) -> None:
+        super().__init__(operation, exact=exact)
+        self.checks = {column: _NumericCheck(operation="scale", column=column) for column in operation.columns}
+        self.moments = {column: MomentAccumulator() for column in operation.columns}
+
+    def update_column(self, column: str, series: pd.Series, numeric: pd.Series | None) -> None:
+        values = self.checks[column].update(series, numeric).to_numpy(dtype="float64")
+        self.moments[column].update(values)
+
+    def finalize(self) -> FittedParams:
+        stats: dict[str, dict[str, float] | None] = {}
+        for column in self.operation.columns:
+            self.checks[column].validate()
+            moments = self.moments[column]
+            if self.operation.method == "standardize":
+                std = moments.std()
+                stats[column] = None if std == 0 or math.isnan(std) else {"mean": moments.mean, "std": std}
+            else:
+                denom = moments.max - moments.min
+                stats[column] = (
+                    None if denom == 0 or math.isnan(denom) else {"min": moments.min, "max": moments.max}
+                )
+        return {"stats": stats}
+
+
+class _OutlierFitter(OperationFitter):
+    def __init__(self, operation: PreprocessOperation, *, exact: bool) -> None:
+        super().__init__(operation, exact=exact)
+        self.checks = {column: _NumericCheck(operation="outlier", column=column) for column in operation.columns}
+        self.moments = {column: MomentAccumulator() for column in operation.columns}
+        self.sketches = {column: QuantileSketch(exact=exact) for column in operation.columns}
+
+    def update_column(self, column: str, series: pd.Series, numeric: pd.Series | None) -> None:
+        values = self.checks[column].update(series, numeric).to_numpy(dtype="float64")
+        if self.operation.method == "zscore":
+            self.moments[column].update(values)
+        else:
+            self.sketches[column].update(values)
+
+    def finalize(self) -> FittedParams:
+        bounds: dict[str, dict[str, float] | None] = {}
+        for column in self.operation.columns:
+            self.checks[column].validate()
+            if self.operation.method == "zscore":
+                moments = self.moments[column]
+                std = moments.std()
+                if std == 0 or math.isnan(std):
+                    bounds[column] = None
+                    continue
+                bounds[column] = {"mean": moments.mean, "std": std}
+            else:
+                q1 = self.sketches[column].quantile(0.25)
+                q3 = self.sketches[column].quantile(0.75)
+                iqr = q3 - q1
+                bounds[column] = {
+                    "lower": q1 - self.operation.iqr_multiplier * iqr,
+                    "upper": q3 + self.operation.iqr_multiplier * iqr,
+                }
+        return {"bounds": bounds}
+
+
+class _EncodeFitter(OperationFitter):
+    def __init__(self, operation: PreprocessOperation, *, exact: bool) -> None:
+        super().__init__(operation, exact=exact)
+        self.values: dict[str, set[Any]] = {column: set() for column in operation.columns}
+        self.missing: dict[str, bool] = {column: False for column in operation.columns}
+
+    def update_column(self, column: str, series: pd.Series, numeric: pd.Series | None) -> None:
+        self.values[column].update(_to_python(value) for value in series.dropna().unique())
+        self.missing[column] = self.missing[column] or bool(series.isna().any())
+
+    def finalize(self) -> FittedParams:
+        if self.operation.method == "label":
+            return {
+                "categories": {column: sorted(values, key=str) for column, values in self.values.items()},
+                "missing": dict(self.missing),
+            }
+        categories: dict[str, list[Any] | None] = {}
+        modes: dict[str, str] = {}
+        for column, values in self.values.items():
+            modes[column] = _one_hot_mode(self.operation, len(values))
+            # hash 방식은 category 목록 없이 값만으로 bucket을 정한다.
+            categories[column] = None if modes[column] == "hash" else _sorted_values(_unify_numbers(values))
+        return {"categories": categories, "modes": modes}
+
+
+class _DerivedColumnCheckFitter(OperationFitter):
+    """log1p/difference/ratio의 숫자 컬럼·음수 검증만 전체 데이터 기준으로 누적한다."""
+
+    def __init__(self, operation: PreprocessOperation, *, exact: bool) -> None:
+        super().__init__(operation, exact=exact)
+        label = f"derived_column.{operation.transform_type}"
+        self.source_columns = [column for column in operation.source_columns if column.strip()]
+        self.checks = {column: _NumericCheck(operation=label, column=column) for column in self.source_columns}
+        self.has_negative = False
+
+    def update(self, frame: pd.DataFrame) -> None:
+        _validate_derived_column(frame, self.operation)
+        for column in self.source_columns:
+            numeric = self.checks[column].update(frame[column])
+            if self.operation.transform_type == "log1p" and bool((numeric.dropna() < 0).any()):
+                self.has_negative = True
+
+    def finalize(self) -> FittedParams:
+        for column in self.source_columns:
+            self.checks[column].validate()
+        if self.has_negative:
+            raise ValueError("derived_column.log1p requires non-negative values")
+        return {}
+
+
+def validate_operation(operation: PreprocessOperation) -> None:
+    """데이터와 무관한 operation 설정 오류를 먼저 확인한다."""
+    op = operation.op
+    if op == "drop_missing" and operation.how not in {"any", "all"}:
+        raise ValueError("drop_missing.how must be any or all")
+    if op == "drop_columns" and not operation.columns:
+        raise ValueError("drop_columns requires columns")
+    if op == "rename_columns":
+        if len(operation.rename_from) != len(operation.rename_to):
+            raise ValueError("rename_columns requires same length for rename_from and rename_to")
+        if not operation.rename_from and not operation.rename_to:
+            raise ValueError("rename_columns requires rename_from and rename_to")
+    if op == "impute":
+        if not operation.columns:
+            raise ValueError("impute requires 'columns'")
+        if operation.method not in {"mean", "median", "mode", "value"}:
+            raise ValueError("impute.method must be mean, median, mode, or value")
+    if op == "scale":
+        if not operation.columns:
+            raise ValueError("scale requires 'columns'")
+        if operation.method not in {"standardize", "normalize"}:
+            raise ValueError("scale.method must be standardize or normalize")
+    if op == "derived_column":
+        if not operation.name.strip():
+            raise ValueError("derived_column requires 'name'")
+        if operation.expression:
+            compile_expression(operation.expression)
+    if op == "encode_categorical":
+        if not operation.columns:
+            raise ValueError("encode_categorical requires 'columns'")
+        if operation.method not in {"one_hot", "label"}:
+            raise ValueError("encode_categorical.method must be one_hot or label")
+    if op == "parse_datetime" and not operation.columns:
+        raise ValueError("parse_datetime requires 'columns'")
+    if op == "outlier":
+        if not operation.columns:
+            raise ValueError("outlier requires 'columns'")
+        if operation.method not in {"zscore", "iqr"}:
+            raise ValueError("outlier.method must be zscore or iqr")
+        if operation.strategy not in {"drop", "clip"}:
+            raise ValueError("outlier.strategy must be drop or clip")
+
+
+def build_operation_fitter(
+    operation: PreprocessOperation,
+    *,
+    exact: bool = True,
+) -> OperationFitter | None:
+    """전체 데이터 통계가 필요한 operation이면 fitter를, 행 단위로 끝나는 operation이면 None을 돌려준다."""
+    validate_operation(operation)
+    op = operation.op
+    if op == "impute" and operation.method != "value":
+        return _ImputeFitter(operation, exact=exact)
+    if op == "scale":
+        return _ScaleFitter(operation, exact=exact)
+    if op == "outlier":
+        return _OutlierFitter(operation, exact=exact)
+    if op == "encode_categorical":
+        return _EncodeFitter(operation, exact=exact)
+    if op == "derived_column" and not operation.expression and operation.transform_type in {
+        "log1p",
+        "difference",
+        "ratio",
+    }:
+        return _DerivedColumnCheckFitter(operation, exact=exact)
+    return None
+
+
+def fit_operation(frame: pd.DataFrame, operation: PreprocessOperation) -> FittedParams:
+    fitter = build_operation_fitter(operation, exact=True)
+    if fitter is None:
+        return {}
+    fitter.update(frame)
+    return fitter.finalize()
+
+
+def _validate_derived_column(frame: pd.DataFrame, operation: PreprocessOperation) -> None:
+    if operation.name in frame.columns:
+        raise ValueError(f"derived_column target already exists: {operation.name}")
+    if operation.expression:
+        compile_expression(operation.expression).validate(frame.columns)
+        return
+    source_columns = [column for column in operation.source_columns if column.strip()]
+    if not source_columns:
+        raise ValueError("derived_column requires 'source_columns'")
+    _require_columns(frame, source_columns)
+    transform_type = operation.transform_type
+    if transform_type == "log1p" and len(source_columns) != 1:
+        raise ValueError("derived_column.log1p requires exactly one source column")
+    if transform_type == "sum" and len(source_columns) < 2:
+        raise ValueError("derived_column.sum requires at least two source columns")
+    if transform_type in {"difference", "ratio"} and len(source_columns) != 2:
+        raise ValueError(f"derived_column.{transform_type} requires exactly two source columns")
+    if transform_type not in {"log1p", "sum", "difference", "ratio"}:
+        raise ValueError("derived_column requires supported transform_type")
+
+
+def transform_operation(
+    frame: pd.DataFrame,
+    operation: PreprocessOperation,
+    params: FittedParams,
+) -> pd.DataFrame:
+    """fit된 parameter로 operation을 적용한다. 전체 frame이든 chunk든 같은 결과 규칙을 쓴다."""
+    out = frame
+    op = operation.op
+    if op == "drop_missing":
+        columns = operation.columns
+        return out.dropna(subset=columns, how=operation.how) if columns else out.dropna(how=operation.how)
+
+    if op == "drop_columns":
+        return out.drop(columns=operation.columns, errors="ignore")
+
+    if op == "rename_columns":
+        mapping = {
+            old_name: new_name
+            for old_name, new_name in zip(operation.rename_from, operation.rename_to)
+            if old_name and new_name
+        }
+        return out.rename(columns=mapping)
+
+    if is_column_local(operation):
+        _require_columns(out, operation.columns)
+        numeric = needs_numeric(operation)
+        for column in operation.columns:
+            series = out[column]
+            out[column] = transform_column(
+                operation,
+                params,
+                column,
+                series,
+                to_float_compatible(pd.to_numeric(series, errors="coerce")) if numeric else None,
+            )
+        return out
+
+    if op == "derived_column":
+        _validate_derived_column(out, operation)
+        if operation.expression:
+            out[operation.name] = compile_expression(operation.expression).evaluate(out)
+            return out
+        source_columns = [column for column in operation.source_columns if column.strip()]
+        numeric = [pd.to_numeric(out[column], errors="coerce") for column in source_columns]
+        if operation.transform_type == "log1p":
+            out[operation.name] = np.log1p(numeric[0])
+        elif operation.transform_type == "sum":
+            out[operation.name] = pd.concat(numeric, axis=1).sum(axis=1)
+        elif operation.transform_type == "difference":
+            out[operation.name] = numeric[0] - numeric[1]
+        else:
+            out[operation.name] = numeric[0] / numeric[1].replace(0, math.nan)
+        return out
+
+    if op == "encode_categorical":
+        _require_columns(out, operation.columns)
+        categories = params["categories"]
+        # modes가 없는 예전 fit parameter는 모두 dense로 본다.
+        modes = params.get("modes") or {}
+        pieces = []
+        for column in operation.columns:
+            mode = modes.get(column, "dense")
+            if mode == "hash":
+                pieces.append(_hashed_dummies(out[column], column, operation.hash_buckets))
+                continue
+            values = pd.Categorical(out[column], categories=categories[column])
+            sparse = mode == "sparse"
+            dtype = np.uint8 if sparse or operation.dtype == "uint8" else np.int64
+            pieces.append(pd.get_dummies(values, prefix=column, dtype=dtype, sparse=sparse).set_axis(out.index))
+        return pd.concat([out.drop(columns=operation.columns), *pieces], axis=1)
+
+    if op == "outlier":
+        _require_columns(out, operation.columns)
+        numerics = {
+            column: to_float_compatible(pd.to_numeric(out[column], errors="coerce")) for column in operation.columns
+        }
+        drop_mask = outlier_mask(operation, params, numerics)
+        return out[~drop_mask].reset_index(drop=True)
+
+    raise ValueError(f"Unknown operation: {operation.op}")
+
+
+def transform_column(
+    operation: PreprocessOperation,
+    params: FittedParams,
+    column: str,
+    series: pd.Series,
+    numeric: pd.Series | None,
+) -> pd.Series:
+    """column-local operation을 컬럼 하나에 적용한다. numeric은 needs_numeric일 때 series를 숫자로 바꾼 값이다."""
+    op = operation.op
+    if op == "impute":
+        fill = params.get("fill") or {}
+        value = fill.get(column, operation.value)
+        if isinstance(value, float):
+            # numpy dtype에서는 결측이 있는 정수 컬럼이 이미 float64라 평균/중앙값을 그대로 받는다.
+            series = to_float_compatible(series)
+        return series.fillna(value)
+
+    if op == "scale":
+        stats = params["stats"].get(column)
+        if stats is None:
+            return numeric
+        if operation.method == "standardize":
+            return (numeric - stats["mean"]) / stats["std"]
+        return (numeric - stats["min"]) / (stats["max"] - stats["min"])
+
+    if op == "encode_categorical":
+        # category 목록에 없는 값과 결측은 -1 code가 되고 결과에서는 NaN이다.
+        codes = pd.Index(params["categories"][column]).get_indexer(series)
+        unmatched = codes < 0
+        # fit 데이터에 결측이 있었으면 결측 없는 chunk도 전체 읽기처럼 float code를 낸다.
+        if not unmatched.any() and not (params.get("missing") or {}).get(column, False):
+            return pd.Series(codes.astype("int64"), index=series.index, name=series.name)
+        return pd.Series(np.where(unmatched, np.nan, codes), index=series.index, name=series.name)
+
+    if op == "parse_datetime":
+        return pd.to_datetime(series, format=operation.format, errors="coerce")
+
+    if op == "outlier":
+        lower, upper = _outlier_bounds(operation, params["bounds"].get(column))
+        if lower is None:
+            return series
+        return numeric.clip(lower=lower, upper=upper)
+
+    raise ValueError(f"Unknown operation: {operation.op}")
+
+
+def _outlier_bounds(
+    operation: PreprocessOperation,
+    column_bounds: dict[str, float] | None,
+) -> tuple[float | None, float | None]:
+    if column_bounds is None:
+        return None, None
+    if operation.method == "zscore":
+        mean = column_bounds["mean"]
+        std = column_bounds["std"]
+        return mean - operation.z_threshold * std, mean + operation.z_threshold * std
+    return column_bounds["lower"], column_bounds["upper"]
+
+
+def outlier_mask(
+    operation: PreprocessOperation,
+    params: FittedParams,
+    numerics: dict[str, pd.Series],
+) -> pd.Series:
+    """outlier drop에서 지울 행을 True로 표시한다."""
+    drop_mask: pd.Series | None = None
+    for column, series in numerics.items():
+        column_bounds = params["bounds"].get(column)
+        if column_bounds is None:
+            continue
+        if operation.method == "zscore":
+            mean = column_bounds["mean"]
+            std = column_bounds["std"]
+            is_outlier = ((series - mean) / std).abs() > operation.z_threshold
+        else:
+            is_outlier = (series < column_bounds["lower"]) | (series > column_bounds["upper"])
+        drop_mask = is_outlier if drop_mask is None else drop_mask | is_outlier
+    if drop_mask is None:
+        index = next(iter(numerics.values())).index if numerics else pd.RangeIndex(0)
+        return pd.Series(False, index=index)
+    # nullable dtype에서는 결측 비교가 pd.NA라 numpy처럼 outlier가 아닌 것으로 본다.
+    return drop_mask.fillna(False).astype(bool)
+
+
+def to_float_compatible(series: pd.Series) -> pd.Series:
+    """nullable 정수 컬럼은 float 값(평균, clip 경계)을 받을 수 있도록 Float64로 바꾼다."""
+    dtype = series.dtype
+    if not isinstance(dtype, np.dtype) and pd.api.types.is_integer_dtype(dtype):
+        return series.astype("Float64")
+    return series
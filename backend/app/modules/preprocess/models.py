@@ -0,0 +1,33 @@
+import uuid
+
+from sqlalchemy import JSON, Column, DateTime, String, delete, event
+from sqlalchemy.sql import func
+
+from ...core.db import Base
+from ..datasets.models import Dataset
+
+
+class PreprocessPipelineArtifact(Base):
+    """전처리 결과 dataset을 만든 operation 목록과 fit parameter를 저장한다."""
+
+    __tablename__ = "preprocess_pipelines"
+
+    id = Column(String(36), primary_key=True, index=True, default=lambda: str(uuid.uuid4()))
+    output_source_id = Column(String(36), unique=True, index=True, nullable=False)
+    input_source_id = Column(String(36), index=True, nullable=False)
+    # 사용자가 요청한 operation 목록. 다시 compile하면 params와 같은 순서의 pipeline이 된다.
+    operations = Column(JSON, nullable=False)
+    params = Column(JSON, nullable=False)
+    input_columns = Column(JSON, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+@event.listens_for(Dataset, "after_delete")
+def _delete_pipeline_artifact(mapper, connection, target: Dataset) -> None:
+    """결과 dataset이 지워지면 그 dataset을 만든 pipeline artifact도 같은 transaction에서 지운다.
+
+    datasets module이 preprocess를 모르도록 정리는 artifact를 소유한 이 module이 맡는다.
+    """
+    connection.execute(
+        delete(PreprocessPipelineArtifact).where(PreprocessPipelineArtifact.output_source_id == target.source_id)
+    )
@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Literal
+
+import numpy as np
+import pandas as pd
+
+from .fitting import (
+    FittedParams,
+    build_operation_fitter,
+    fit_operation,
+    is_column_local,
+    is_row_filter,
+    needs_numeric,
+    operation_footprint,
+    outlier_mask,
+    to_float_compatible,
+    transform_column,
+    transform_operation,
+    validate_operation,
+)
+from .schemas import PreprocessOperation
+
+PipelineStageKind = Literal["drop_columns", "columns", "rows", "frame"]
+
+
+@dataclass(frozen=True)
+class PipelineStage:
+    """한 번의 frame pass로 실행할 operation 묶음. indices는 CompiledPipeline.operations 위치다."""
+
+    kind: PipelineStageKind
+    indices: tuple[int, ...]
+
+
+@dataclass(frozen=True)
+class CompiledPipeline:
+    operations: list[PreprocessOperation]
+    stages: list[PipelineStage] = field(default_factory=list)
+
+
+def _can_hoist_drop(operation: PreprocessOperation, columns: frozenset[str]) -> bool:
+    """drop_columns를 operation 앞으로 옮겨도 결과가 같은지 확인한다."""
+    footprint = operation_footprint(operation)
+    if footprint.reads is None or footprint.writes is None:
+        return False
+    return not (footprint.reads & columns) and not (footprint.writes & columns)
+
+
+def _hoist_drop_columns(operations: list[PreprocessOperation]) -> list[PreprocessOperation]:
+    ordered: list[PreprocessOperation] = []
+    for operation in operations:
+        position = len(ordered)
+        if operation.op == "drop_columns":
+            columns = frozenset(operation.columns)
+            while position > 0 and _can_hoist_drop(ordered[position - 1], columns):
+                position -= 1
+        ordered.insert(position, operation)
+    return ordered
+
+
+def _stage_kind(operation: PreprocessOperation) -> PipelineStageKind:
+    if operation.op == "drop_columns":
+        return "drop_columns"
+    if is_column_local(operation):
+        return "columns"
+    if is_row_filter(operation):
+        return "rows"
+    return "frame"
+
+
+def compile_operations(operations: list[PreprocessOperation]) -> CompiledPipeline:
+    """operation 목록을 결과가 같은 stage 목록으로 바꾼다.
+
+    - drop_columns는 앞선 operation이 해당 컬럼을 읽거나 쓰지 않으면 앞으로 옮긴다.
+    - 연속된 column-local operation(impute/scale/clip/label/parse_datetime)은 한 stage로 묶는다.
+    - 연속된 row filter(drop_missing/outlier drop)는 하나의 boolean mask로 묶는다.
+    """
+    for operation in operations:
+        validate_operation(operation)
+    ordered = _hoist_drop_columns(operations)
+    stages: list[PipelineStage] = []
+    for index, operation in enumerate(ordered):
+        kind = _stage_kind(operation)
+        if stages and stages[-1].kind == kind and kind != "frame":
+            stages[-1] = PipelineStage(kind=kind, indices=(*stages[-1].indices, index))
+        else:
+            stages.append(PipelineStage(kind=kind, indices=(index,)))
+    return CompiledPipeline(operations=ordered, stages=stages)
+
+
+class _NumericCache:
+    """stage 안에서 컬럼별 pd.to_numeric 결과를 한 번만 계산한다."""
+
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[pd.Series, pd.Series]] = {}
+
+    def get(self, column: str, series: pd.Series) -> pd.Series:
+        cached = self._entries.get(column)
+        if cached is not None and cached[0] is series:
+            return cached[1]
+        numeric = to_float_compatible(series if _is_plain_numeric(series) else pd.to_numeric(series, errors="coerce"))
+        self._entries[column] = (series, numeric)
+        return numeric
+
+    def carry_fill(self, column: str, before: pd.Series, after: pd.Series, fill_value: object) -> None:
+        """impute 결과의 숫자 값을 다시 변환하지 않고 이전 변환 결과에서 만든다."""
+        cached = self._entries.get(column)
+        if cached is None or cached[0] is not before:
+            return
+        if not isinstance(fill_value, (int, float)) or isinstance(fill_value, bool):
+            return
+        self._entries[column] = (after, cached[1].mask(before.isna(), float(fill_value)))
+
+
+def _is_plain_numeric(series: pd.Series) -> bool:
+    return pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype)
+
+
+def _require_columns(frame: pd.DataFrame, columns: list[str]) -> None:
+    for column in columns:
+        if column not in frame.columns:
+            raise ValueError(f"Column not found: {column}")
+
+
+def _run_column_stage(
+    frame: pd.DataFrame,
+    stage: PipelineStage,
+    pipeline: CompiledPipeline,
+    params: list[FittedParams | None],
+) -> pd.DataFrame:
+    working: dict[str, pd.Series] = {}
+    cache = _NumericCache()
+
+    def current(column: str) -> pd.Series:
+        if column not in working:
+            working[column] = frame[column]
+        return working[column]
+
+    for index in stage.indices:
+        operation = pipeline.operations[index]
+        _require_columns(frame, operation.columns)
+        numeric = needs_numeric(operation)
+        if params[index] is None:
+            fitter = build_operation_fitter(operation)
+            if fitter is not None:
+                for column in operation.columns:
+                    series = current(column)
+                    fitter.update_column(column, series, cache.get(column, series) if numeric else None)
+            params[index] = fitter.finalize() if fitter is not None else {}
+        for column in operation.columns:
+            series = current(column)
+            working[column] = transform_column(
+                operation,
+                params[index],
+                column,
+                series,
+                cache.get(column, series) if numeric else None,
+            )
+            if operation.op == "impute":
+                fill_value = (params[index].get("fill") or {}).get(column, operation.value)
+                cache.carry_fill(column, series, working[column], fill_value)
+
+    # 컬럼마다 한 번만 frame에 다시 쓴다.
+    for column, series in working.items():
+        frame[column] = series
+    return frame
+
+
+def _run_row_stage(
+    frame: pd.DataFrame,
+    stage: PipelineStage,
+    pipeline: CompiledPipeline,
+    params: list[FittedParams | None],
+) -> tuple[pd.DataFrame, np.ndarray]:
+    keep = np.ones(len(frame), dtype=bool)
+    keep_at_reset: np.ndarray | None = None
+    cache = _NumericCache()
+    for index in stage.indices:
+        operation = pipeline.operations[index]
+        if operation.op == "drop_missing":
+            columns = operation.columns
+            if columns and any(column not in frame.columns for column in columns):
+                # pandas dropna와 같은 오류를 그대로 낸다.
+                frame.dropna(subset=columns, how=operation.how)
+            present = (frame[columns] if columns else frame).notna().to_numpy()
+            keep &= present.all(axis=1) if operation.how == "any" else present.any(axis=1)
+            if params[index] is None:
+                params[index] = {}
+            continue
+
+        _require_columns(frame, operation.columns)
+        numerics = {column: cache.get(column, frame[column]) for column in operation.columns}
+        if params[index] is None:
+            fitter = build_operation_fitter(operation)
+            for column in operation.columns:
+                fitter.update_column(column, frame[column][keep], numerics[column][keep])
+            params[index] = fitter.finalize()
+        keep &= ~outlier_mask(operation, params[index], numerics).to_numpy(dtype=bool, na_value=False)
+        keep_at_reset = keep.copy()
+
+    out = frame[keep]
+    if keep_at_reset is not None:
+        # outlier drop은 reset_index를 하므로 마지막 reset 이후 남은 위치를 index로 쓴다.
+        labels = np.flatnonzero(keep[keep_at_reset])
+        if len(labels) == int(keep_at_reset.sum()):
+            out = out.reset_index(drop=True)
+        else:
+            out = out.set_axis(pd.Index(labels), axis=0)
+    return out, keep
+
+
+def run_pipeline(
+    frame: pd.DataFrame,
+    pipeline: CompiledPipeline,
+    params: list[FittedParams] | None = None,
+) -> tuple[pd.DataFrame, list[FittedParams]]:
+    """compile된 pipeline을 실행한다. params가 없으면 stage 안에서 fit하고 fit 결과도 함께 돌려준다."""
+    out, fitted, _ = run_pipeline_tracked(frame, pipeline, params)
+    return out, fitted
+
+
+def run_pipeline_tracked(
+    frame: pd.DataFrame,
+    pipeline: CompiledPipeline,
+    params: list[FittedParams] | None = None,
+) -> tuple[pd.DataFrame, list[FittedParams], np.ndarray]:
+    """run_pipeline과 같고, 결과 행마다 입력 frame에서의 위치도 돌려준다(row filter가 index를 다시 매기므로)."""
+    fitted: list[FittedParams | None] = list(params) if params is not None else [None] * len(pipeline.operations)
+    out = frame
+    positions = np.arange(len(frame))
+    for stage in pipeline.stages:
+        if stage.kind == "drop_columns":
+            columns = [column for index in stage.indices for column in pipeline.operations[index].columns]
+            out = out.drop(columns=columns, errors="ignore")
+            for index in stage.indices:
+                fitted[index] = {}
+        elif stage.kind == "columns":
+            out = _run_column_stage(out, stage, pipeline, fitted)
+        elif stage.kind == "rows":
+            out, keep = _run_row_stage(out, stage, pipeline, fitted)
+            positions = positions[keep]
+        else:
+            index = stage.indices[0]
+            operation = pipeline.operations[index]
+            if fitted[index] is None:
+                fitted[index] = fit_operation(out, operation)
+            out = transform_operation(out, operation, fitted[index])
+    return out, [item or {} for item in fitted], positions
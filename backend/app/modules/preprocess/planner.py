@@ -116,6 +116,7 @@ def build_preprocess_review_payload(
     dataset_profile: dict[str, Any],
     plan: PreprocessPlan,
     reason_summary: str,
+    preview: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
     missing_rates = dataset_profile.get("missing_rates")
     top_missing_columns: list[dict[str, Any]] = []
@@ -163,6 +164,7 @@ def build_preprocess_review_payload(
             "top_recommendations": top_recommendations,
             "affected_columns": _collect_affected_columns(plan.operations),
             "row_count": int(row_count) if isinstance(row_count, int) else None,
+            "preview": preview,
         },
     }
 
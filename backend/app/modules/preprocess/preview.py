@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_PREVIEW_SAMPLE_SIZE = 5_000
+# 층이 너무 잘게 나뉘면 나머지는 하나의 층으로 묶는다.
+MAX_PREVIEW_STRATA = 64
+MIN_ROWS_PER_STRATUM = 20
+# 95% 신뢰구간의 정규 근사 계수.
+PREVIEW_Z_SCORE = 1.96
+
+_OTHER_STRATUM = "__other__"
+
+
+@dataclass(frozen=True)
+class StratifiedSample:
+    frame: pd.DataFrame
+    strata: np.ndarray
+    population: dict[str, int]
+
+    @property
+    def total_rows(self) -> int:
+        return sum(self.population.values())
+
+
+@dataclass(frozen=True)
+class Estimate:
+    value: float
+    margin: float
+
+
+class StratifiedSampler:
+    """chunk를 한 번 훑으며 층별 균등 표본(bottom-k)과 층 크기를 모은다.
+
+    층은 plan이 건드리는 컬럼의 결측 패턴(과 stratify_by 값)으로 나눈다. drop_missing/impute처럼
+    결측 행에만 영향을 주는 operation도 드문 결측 패턴이 표본에 빠지지 않는다.
+    """
+
+    def __init__(
+        self,
+        *,
+        sample_size: int = DEFAULT_PREVIEW_SAMPLE_SIZE,
+        missing_columns: list[str] | None = None,
+        stratify_by: str | None = None,
+        seed: int = 0,
+    ) -> None:
+        self.sample_size = sample_size
+        self.missing_columns = list(missing_columns or [])
+        self.stratify_by = stratify_by
+        self.population: dict[str, int] = {}
+        self._kept: pd.DataFrame | None = None
+        self._rng = np.random.default_rng(seed)
+
+    def _strata(self, chunk: pd.DataFrame) -> pd.Series:
+        labels = pd.Series("", index=chunk.index, dtype=object)
+        if self.stratify_by is not None:
+            labels = chunk[self.stratify_by].astype(str).where(chunk[self.stratify_by].notna(), "<NA>")
+        columns = [column for column in self.missing_columns if column in chunk.columns][:62]
+        if columns:
+            # 결측 여부 bit를 정수 하나로 묶어 층 label에 붙인다.
+            weights = np.left_shift(np.int64(1), np.arange(len(columns), dtype="int64"))
+            pattern = chunk[columns].isna().to_numpy(dtype="int64") @ weights
+            labels = labels + "|" + pd.Series(pattern, index=chunk.index).astype(str)
+        # 처음 본 순서대로 MAX_PREVIEW_STRATA개까지만 따로 두고 이후 층은 하나로 묶는다.
+        for label in pd.unique(labels):
+            if label not in self.population and len(self.population) >= MAX_PREVIEW_STRATA - 1:
+                labels = labels.where(labels.isin(list(self.population)), _OTHER_STRATUM)
+                break
+            self.population.setdefault(label, 0)
+        return labels
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        if chunk.empty:
+            return
+        labels = self._strata(chunk)
+        for label, count in labels.value_counts().items():
+            self.population[label] = self.population.get(label, 0) + int(count)
+        candidates = chunk.reset_index(drop=True).assign(
+            _preview_stratum=labels.to_numpy(),
+            _preview_key=self._rng.random(len(chunk)),
+        )
+        merged = candidates if self._kept is None else pd.concat([self._kept, candidates], ignore_index=True)
+        # 층마다 random key가 가장 작은 sample_size개를 남기면 층 안의 균등 비복원 표본이 된다.
+        self._kept = (
+            merged.sort_values("_preview_key", kind="stable")
+            .groupby("_preview_stratum", sort=False)
+            .head(self.sample_size)
+            .reset_index(drop=True)
+        )
+
+    def sample(self) -> StratifiedSample:
+        if self._kept is None:
+            return StratifiedSample(frame=pd.DataFrame(), strata=np.array([], dtype=object), population={})
+        total = sum(self.population.values())
+        parts = []
+        for label, group in self._kept.groupby("_preview_stratum", sort=False):
+            size = self.population[label]
+            allocation = max(MIN_ROWS_PER_STRATUM, round(self.sample_size * size / total))
+            parts.append(group.head(min(size, allocation)))
+        kept = pd.concat(parts, ignore_index=True).sort_values("_preview_key", kind="stable")
+        return StratifiedSample(
+            frame=kept.drop(columns=["_preview_stratum", "_preview_key"]).reset_index(drop=True),
+            strata=kept["_preview_stratum"].to_numpy(),
+            population=dict(self.population),
+        )
+
+
+def _row_contributions(before: pd.DataFrame, after: pd.DataFrame, positions: np.ndarray) -> pd.DataFrame:
+    """표본 행마다 row 수/컬럼 결측 수 변화에 기여한 값을 만든다. 걸러진 행은 after 기여가 0이다.
+
+    positions는 after 행마다 before에서의 위치다.
+    """
+    kept = np.zeros(len(before), dtype="float64")
+    kept[positions] = 1.0
+    contributions: dict[str, np.ndarray] = {"__rows__": kept - 1.0}
+    columns = list(dict.fromkeys([*map(str, before.columns), *map(str, after.columns)]))
+    for column in columns:
+        delta = np.zeros(len(before), dtype="float64")
+        if column in after.columns:
+            delta[positions] = after[column].isna().to_numpy(dtype="float64")
+        if column in before.columns:
+            delta -= before[column].isna().to_numpy(dtype="float64")
+        contributions[column] = delta
+    return pd.DataFrame(contributions)
+
+
+def estimate_count_deltas(
+    sample: StratifiedSample,
+    after: pd.DataFrame,
+    positions: np.ndarray,
+) -> dict[str, Estimate]:
+    """층화 표본의 행별 기여로 전체 dataset의 row/결측 수 변화와 95% 오차 한계를 추정한다.
+
+    키 "__rows__"는 row 수 변화, "__missing_total__"은 전체 결측 수 변화다.
+    """
+    contributions = _row_contributions(sample.frame, after, positions)
+    contributions["__missing_total__"] = contributions.drop(columns="__rows__").sum(axis=1)
+    grouped = contributions.groupby(sample.strata, sort=False)
+    means = grouped.mean()
+    variances = grouped.var(ddof=1).fillna(0.0)
+    counts = grouped.size()
+    population = pd.Series(sample.population).reindex(means.index).astype("float64")
+    # 층 크기만큼 다 뽑힌 층은 유한 모집단 보정으로 분산이 0이다.
+    correction = (1.0 - counts / population).clip(lower=0.0)
+    totals = means.mul(population, axis=0).sum()
+    variance = variances.mul(population**2 * correction / counts, axis=0).sum()
+    return {
+        str(column): Estimate(
+            value=float(totals[column]),
+            margin=PREVIEW_Z_SCORE * math.sqrt(max(float(variance[column]), 0.0)),
+        )
+        for column in contributions.columns
+    }
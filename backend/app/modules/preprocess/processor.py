@@ -1,9 +1,58 @@
-import math
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable, Literal
+
 import numpy as np
 import pandas as pd
-
+from pydantic import TypeAdapter
+
+from .fitting import (
+    FittedParams,
+    build_operation_fitter,
+    operation_footprint,
+    transform_operation,
+)
+from .pipeline import CompiledPipeline, compile_operations, run_pipeline, run_pipeline_tracked
 from .schemas import PreprocessOperation
 
+OPERATION_ADAPTER: TypeAdapter[PreprocessOperation] = TypeAdapter(PreprocessOperation)
+
+ChunkSource = Callable[[], Iterable[pd.DataFrame]]
+FitPassAction = Literal["transform", "fit", "skip"]
+
+
+def plan_fit_pass(
+    operations: list[PreprocessOperation],
+    fitted: list[bool],
+) -> list[FitPassAction]:
+    """한 번의 chunk pass에서 fit할 수 있는 operation을 고른다.
+
+    아직 fit되지 않은 operation의 결과에 의존하는 operation은 다음 pass로 넘긴다.
+    반환 목록 길이만큼의 operation까지만 chunk에 적용한다.
+    """
+    actions: list[FitPassAction] = []
+    pending_columns: set[str] = set()
+    pending_all = False
+    for operation, is_fitted in zip(operations, fitted):
+        footprint = operation_footprint(operation)
+        depends = pending_all or (
+            bool(pending_columns)
+            if footprint.reads is None
+            else bool(footprint.reads & pending_columns)
+        )
+        if not is_fitted and depends:
+            break
+        if is_fitted and not depends:
+            actions.append("transform")
+            continue
+        actions.append("skip" if is_fitted else "fit")
+        # 이번 pass에서 결과가 반영되지 않는 operation의 출력은 뒤쪽 operation이 읽으면 안 된다.
+        if footprint.writes is None or footprint.filters_rows:
+            pending_all = True
+        else:
+            pending_columns |= footprint.writes
+    return actions
+
 
 class PreprocessProcessor:
     """전처리 계산 로직만 담당한다."""
@@ -13,255 +62,82 @@ class PreprocessProcessor:
         df: pd.DataFrame,
         operations: list[PreprocessOperation],
     ) -> pd.DataFrame:
-        out = df.copy()
-        for operation in operations:
-            if operation.op == "drop_missing":
-                columns = operation.columns
-                how = operation.how
-                if how not in {"any", "all"}:
-                    raise ValueError("drop_missing.how must be any or all")
-                out = out.dropna(subset=columns, how=how) if columns else out.dropna(how=how)
-                continue
-
-            if operation.op == "drop_columns":
-                if not operation.columns:
-                    raise ValueError("drop_columns requires columns")
-                out = out.drop(columns=operation.columns, errors="ignore")
-                continue
-
-            if operation.op == "rename_columns":
-                rename_from = operation.rename_from
-                rename_to = operation.rename_to
-                if len(rename_from) != len(rename_to):
-                    raise ValueError("rename_columns requires same length for rename_from and rename_to")
-                if not rename_from and not rename_to:
-                    raise ValueError("rename_columns requires rename_from and rename_to")
-                mapping = {
-                    old_name: new_name
-                    for old_name, new_name in zip(rename_from, rename_to)
-                    if old_name and new_name
-                }
-                out = out.rename(columns=mapping)
-                continue
-
-            if operation.op == "impute":
-                if not operation.columns:
-                    raise ValueError("impute requires 'columns'")
-                if operation.method not in {"mean", "median", "mode", "value"}:
-                    raise ValueError("impute.method must be mean, median, mode, or value")
-                for column in operation.columns:
-                    if column not in out.columns:
-                        raise ValueError(f"Column not found: {column}")
-                    if operation.method == "mean":
-                        fill_value = self._numeric_impute_value(out[column], method="mean", column=column)
-                        out[column] = out[column].fillna(fill_value)
-                    elif operation.method == "median":
-                        fill_value = self._numeric_impute_value(out[column], method="median", column=column)
-                        out[column] = out[column].fillna(fill_value)
-                    elif operation.method == "mode":
-                        mode_values = out[column].mode(dropna=True)
-                        out[column] = out[column].fillna(
-                            mode_values.iloc[0] if len(mode_values) else operation.value
-                        )
-                    else:
-                        out[column] = out[column].fillna(operation.value)
-                continue
-
-            if operation.op == "scale":
-                if not operation.columns:
-                    raise ValueError("scale requires 'columns'")
-                if operation.method not in {"standardize", "normalize"}:
-                    raise ValueError("scale.method must be standardize or normalize")
-                for column in operation.columns:
-                    if column not in out.columns:
-                        raise ValueError(f"Column not found: {column}")
-                    series = self._numeric_series_or_raise(out[column], operation="scale", column=column)
-                    if operation.method == "standardize":
-                        mean = series.mean()
-                        std = series.std(ddof=0)
-                        out[column] = series if std == 0 or pd.isna(std) else (series - mean) / std
-                    else:
-                        min_val = series.min()
-                        max_val = series.max()
-                        denom = max_val - min_val
-                        out[column] = (
-                            series if denom == 0 or pd.isna(denom) else (series - min_val) / denom
-                        )
-                continue
-
-            if operation.op == "derived_column":
-                if not operation.name.strip():
-                    raise ValueError("derived_column requires 'name'")
-                if operation.name in out.columns:
-                    raise ValueError(f"derived_column target already exists: {operation.name}")
-                if operation.expression:
-                    out[operation.name] = out.eval(operation.expression, engine="python")
-                    continue
-
-                source_columns = [column for column in operation.source_columns if column.strip()]
-                if not source_columns:
-                    raise ValueError("derived_column requires 'source_columns'")
-                for column in source_columns:
-                    if column not in out.columns:
-                        raise ValueError(f"Column not found: {column}")
-
-                if operation.transform_type == "log1p":
-                    if len(source_columns) != 1:
-                        raise ValueError("derived_column.log1p requires exactly one source column")
-                    source = self._numeric_series_or_raise(
-                        out[source_columns[0]],
-                        operation="derived_column.log1p",
-                        column=source_columns[0],
-                    )
-                    if (source.dropna() < 0).any():
-                        raise ValueError("derived_column.log1p requires non-negative values")
-                    out[operation.name] = np.log1p(source)
-                    continue
-
-                if operation.transform_type == "sum":
-                    if len(source_columns) < 2:
-                        raise ValueError("derived_column.sum requires at least two source columns")
-                    source_frame = out[source_columns].apply(pd.to_numeric, errors="coerce")
-                    out[operation.name] = source_frame.sum(axis=1)
-                    continue
-
-                if operation.transform_type == "difference":
-                    if len(source_columns) != 2:
-                        raise ValueError("derived_column.difference requires exactly two source columns")
-                    left = self._numeric_series_or_raise(
-                        out[source_columns[0]],
-                        operation="derived_column.difference",
-                        column=source_columns[0],
-                    )
-                    right = self._numeric_series_or_raise(
-                        out[source_columns[1]],
-                        operation="derived_column.difference",
-                        column=source_columns[1],
-                    )
-                    out[operation.name] = left - right
-                    continue
-
-                if operation.transform_type == "ratio":
-                    if len(source_columns) != 2:
-                        raise ValueError("derived_column.ratio requires exactly two source columns")
-                    numerator = self._numeric_series_or_raise(
-                        out[source_columns[0]],
-                        operation="derived_column.ratio",
-                        column=source_columns[0],
-                    )
-                    denominator = self._numeric_series_or_raise(
-                        out[source_columns[1]],
-                        operation="derived_column.ratio",
-                        column=source_columns[1],
-                    )
-                    denominator = denominator.replace(0, math.nan)
-                    out[operation.name] = numerator / denominator
-                    continue
-
-                raise ValueError("derived_column requires supported transform_type")
-                continue
-
-            if operation.op == "encode_categorical":
-                if not operation.columns:
-                    raise ValueError("encode_categorical requires 'columns'")
-                if operation.method not in {"one_hot", "label"}:
-                    raise ValueError("encode_categorical.method must be one_hot or label")
-                for column in operation.columns:
-                    if column not in out.columns:
-                        raise ValueError(f"Column not found: {column}")
-                if operation.method == "one_hot":
-                    out = pd.get_dummies(out, columns=operation.columns, prefix=operation.columns, dtype=int)
-                else:
-                    for column in operation.columns:
-                        categories = sorted(out[column].dropna().unique().tolist(), key=str)
-                        mapping = {category: index for index, category in enumerate(categories)}
-                        out[column] = out[column].map(mapping)
-                continue
-
-            if operation.op == "parse_datetime":
-                if not operation.columns:
-                    raise ValueError("parse_datetime requires 'columns'")
-                for column in operation.columns:
-                    if column not in out.columns:
-                        raise ValueError(f"Column not found: {column}")
-                    out[column] = pd.to_datetime(
-                        out[column],
-                        format=operation.format,
-                        errors="coerce",
-                    )
-                continue
-
-            if operation.op == "outlier":
-                if not operation.columns:
-                    raise ValueError("outlier requires 'columns'")
-                if operation.method not in {"zscore", "iqr"}:
-                    raise ValueError("outlier.method must be zscore or iqr")
-                if operation.strategy not in {"drop", "clip"}:
-                    raise ValueError("outlier.strategy must be drop or clip")
-
-                drop_mask = pd.Series([False] * len(out), index=out.index)
-                for column in operation.columns:
-                    if column not in out.columns:
-                        raise ValueError(f"Column not found: {column}")
-
-                    series = self._numeric_series_or_raise(out[column], operation="outlier", column=column)
-                    if operation.method == "zscore":
-                        mean = series.mean()
-                        std = series.std(ddof=0)
-                        if std == 0 or pd.isna(std):
-                            continue
-                        z_scores = (series - mean) / std
-                        is_outlier = z_scores.abs() > operation.z_threshold
-                        if operation.strategy == "drop":
-                            drop_mask |= is_outlier
-                        else:
-                            lower = mean - operation.z_threshold * std
-                            upper = mean + operation.z_threshold * std
-                            out[column] = series.clip(lower=lower, upper=upper)
-                    else:
-                        q1 = series.quantile(0.25)
-                        q3 = series.quantile(0.75)
-                        iqr = q3 - q1
-                        lower = q1 - operation.iqr_multiplier * iqr
-                        upper = q3 + operation.iqr_multiplier * iqr
-                        is_outlier = (series < lower) | (series > upper)
-                        if operation.strategy == "drop":
-                            drop_mask |= is_outlier
-                        else:
-                            out[column] = series.clip(lower=lower, upper=upper)
-
-                if operation.strategy == "drop":
-                    out = out[~drop_mask].reset_index(drop=True)
-                continue
-
-            raise ValueError(f"Unknown operation: {operation.op}")
+        out, _, _ = self.fit_transform(df, operations)
         return out
 
-    @staticmethod
-    def _numeric_impute_value(series: pd.Series, *, method: str, column: str) -> float:
-        numeric_series = PreprocessProcessor._numeric_series_or_raise(
-            series,
-            operation=f"impute.method '{method}'",
-            column=column,
-        )
-
-        if method == "mean":
-            value = numeric_series.mean()
-        else:
-            value = numeric_series.median()
+    def fit_transform(
+        self,
+        df: pd.DataFrame,
+        operations: list[PreprocessOperation],
+    ) -> tuple[pd.DataFrame, CompiledPipeline, list[FittedParams]]:
+        """operation을 적용하고 재사용할 수 있도록 compile된 pipeline과 fit parameter도 돌려준다."""
+        out, pipeline, params, _ = self.fit_transform_tracked(df, operations)
+        return out, pipeline, params
 
-        if pd.isna(value):
-            raise ValueError(f"impute.method '{method}' requires a numeric column: {column}")
-        return float(value)
+    def fit_transform_tracked(
+        self,
+        df: pd.DataFrame,
+        operations: list[PreprocessOperation],
+    ) -> tuple[pd.DataFrame, CompiledPipeline, list[FittedParams], np.ndarray]:
+        """fit_transform 결과와 함께 결과 행마다 입력 frame에서의 위치를 돌려준다."""
+        pipeline = self.compile(operations)
+        # 앞쪽 drop_columns가 새 frame을 만들면 입력 frame을 따로 복사할 필요가 없다.
+        starts_with_drop = bool(pipeline.stages) and pipeline.stages[0].kind == "drop_columns"
+        out, params, positions = run_pipeline_tracked(df if starts_with_drop else df.copy(), pipeline)
+        return out, pipeline, params, positions
+
+    def replay_operations(
+        self,
+        df: pd.DataFrame,
+        operations: list[dict[str, Any]],
+    ) -> pd.DataFrame:
+        """lineage manifest에 JSON으로 기록된 operation을 부모 frame에 다시 fit/적용한다."""
+        return self.apply_operations(df, [OPERATION_ADAPTER.validate_python(item) for item in operations])
 
-    @staticmethod
-    def _numeric_series_or_raise(series: pd.Series, *, operation: str, column: str) -> pd.Series:
-        non_null = series.dropna()
-        if non_null.empty:
-            raise ValueError(f"{operation} requires a numeric column: {column}")
+    def compile(self, operations: list[PreprocessOperation]) -> CompiledPipeline:
+        return compile_operations(operations)
 
-        numeric_series = pd.to_numeric(series, errors="coerce")
-        numeric_ratio = float(numeric_series.dropna().shape[0]) / float(non_null.shape[0])
-        if numeric_ratio < 0.98:
-            raise ValueError(f"{operation} requires a numeric column: {column}")
-        return numeric_series
+    def fit_operations_chunked(
+        self,
+        chunk_source: ChunkSource,
+        pipeline: CompiledPipeline,
+    ) -> list[FittedParams]:
+        """chunk를 여러 번 훑으며 operation별 전역 통계를 fit한다.
+
+        서로 의존하지 않는 stateful operation은 같은 pass에서 함께 fit한다.
+        median/IQR은 표본 크기 한도까지는 정확하고 그 이상은 균등 표본으로 근사한다.
+        반환값은 pipeline.operations 순서와 같다.
+        """
+        operations = pipeline.operations
+        params: list[FittedParams] = [{} for _ in operations]
+        fitted: list[bool] = []
+        for operation in operations:
+            fitted.append(build_operation_fitter(operation) is None)
+
+        while not all(fitted):
+            actions = plan_fit_pass(operations, fitted)
+            fitters = {
+                index: build_operation_fitter(operations[index], exact=False)
+                for index, action in enumerate(actions)
+                if action == "fit"
+            }
+            for chunk in chunk_source():
+                frame = chunk
+                for index, action in enumerate(actions):
+                    if action == "fit":
+                        fitters[index].update(frame)
+                    elif action == "transform":
+                        frame = transform_operation(frame, operations[index], params[index])
+            for index, fitter in fitters.items():
+                params[index] = fitter.finalize()
+                fitted[index] = True
+        return params
+
+    def transform_chunk(
+        self,
+        chunk: pd.DataFrame,
+        pipeline: CompiledPipeline,
+        params: list[FittedParams],
+    ) -> pd.DataFrame:
+        out, _ = run_pipeline(chunk, pipeline, params)
+        return out
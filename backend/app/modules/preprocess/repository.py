@@ -0,0 +1,71 @@
+from typing import Any, Optional
+
+from sqlalchemy.orm import Session
+
+from ..datasets.models import Dataset
+from .models import PreprocessPipelineArtifact
+
+
+class PreprocessPipelineRepository:
+    """fit된 전처리 pipeline artifact 저장/조회를 담당한다."""
+
+    def __init__(self, db: Session) -> None:
+        self.db = db
+
+    def create(
+        self,
+        *,
+        input_source_id: str,
+        output_source_id: str,
+        operations: list[dict[str, Any]],
+        params: list[dict[str, Any]],
+        input_columns: list[str] | None = None,
+    ) -> PreprocessPipelineArtifact:
+        artifact = PreprocessPipelineArtifact(
+            input_source_id=input_source_id,
+            output_source_id=output_source_id,
+            operations=operations,
+            params=params,
+            input_columns=input_columns,
+        )
+        self.db.add(artifact)
+        self.db.commit()
+        self.db.refresh(artifact)
+        return artifact
+
+    def create_with_output(
+        self,
+        output_dataset: Dataset,
+        *,
+        input_source_id: str,
+        operations: list[dict[str, Any]],
+        params: list[dict[str, Any]],
+        input_columns: list[str] | None = None,
+    ) -> tuple[Dataset, PreprocessPipelineArtifact]:
+        """결과 dataset row와 pipeline artifact를 한 transaction으로 저장한다."""
+        try:
+            self.db.add(output_dataset)
+            # artifact가 참조할 source_id를 commit 전에 확정한다.
+            self.db.flush()
+            artifact = PreprocessPipelineArtifact(
+                input_source_id=input_source_id,
+                output_source_id=output_dataset.source_id,
+                operations=operations,
+                params=params,
+                input_columns=input_columns,
+            )
+            self.db.add(artifact)
+            self.db.commit()
+        except BaseException:
+            self.db.rollback()
+            raise
+        self.db.refresh(output_dataset)
+        self.db.refresh(artifact)
+        return output_dataset, artifact
+
+    def get_by_output_source_id(self, output_source_id: str) -> Optional[PreprocessPipelineArtifact]:
+        return (
+            self.db.query(PreprocessPipelineArtifact)
+            .filter(PreprocessPipelineArtifact.output_source_id == output_source_id)
+            .first()
+        )
@@ -6,6 +6,9 @@ from .schemas import (
     PreprocessApplyRecommendationRequest,
     PreprocessApplyRequest,
     PreprocessApplyResponse,
+    PreprocessApplySavedPipelineRequest,
+    PreprocessPreviewRequest,
+    PreprocessPreviewResponse,
 )
 from .service import PreprocessService
 
@@ -18,7 +21,27 @@ def apply(
     service: PreprocessService = Depends(get_preprocess_service),
 ):
     try:
-        return service.apply(source_id=req.source_id, operations=req.operations)
+        return service.apply(source_id=req.source_id, operations=req.operations, lazy=req.lazy)
+    except FileNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc))
+    except DatasetReadError as exc:
+        raise HTTPException(status_code=422, detail=DATASET_READ_ERROR_DETAIL) from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+
+@router.post("/preview", response_model=PreprocessPreviewResponse)
+def preview(
+    req: PreprocessPreviewRequest,
+    service: PreprocessService = Depends(get_preprocess_service),
+):
+    try:
+        return service.preview(
+            source_id=req.source_id,
+            operations=req.operations,
+            sample_size=req.sample_size,
+            stratify_by=req.stratify_by,
+        )
     except FileNotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc))
     except DatasetReadError as exc:
@@ -43,3 +66,22 @@ def apply_recommendation(
         raise HTTPException(status_code=422, detail=DATASET_READ_ERROR_DETAIL) from exc
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
+
+
+@router.post("/pipelines/{pipeline_source_id}/apply", response_model=PreprocessApplyResponse)
+def apply_saved_pipeline(
+    pipeline_source_id: str,
+    req: PreprocessApplySavedPipelineRequest,
+    service: PreprocessService = Depends(get_preprocess_service),
+):
+    try:
+        return service.apply_saved_pipeline(
+            source_id=req.source_id,
+            pipeline_source_id=pipeline_source_id,
+        )
+    except FileNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc))
+    except DatasetReadError as exc:
+        raise HTTPException(status_code=422, detail=DATASET_READ_ERROR_DETAIL) from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
@@ -5,6 +5,7 @@ from typing import Annotated, Literal, Union
 from pydantic import BaseModel, ConfigDict, Field
 
 from ..eda.schemas import PreprocessRecommendation
+from .preview import DEFAULT_PREVIEW_SAMPLE_SIZE
 
 
 class StrictModel(BaseModel):
@@ -53,6 +54,11 @@ class EncodeCategoricalOperation(StrictModel):
     op: Literal["encode_categorical"]
     columns: list[str]
     method: Literal["one_hot", "label"]
+    # one_hot 출력 dtype. category 수가 max_categories를 넘는 컬럼은 high_cardinality 방식으로 바꾼다.
+    dtype: Literal["int64", "uint8", "sparse"] = "uint8"
+    max_categories: int = Field(default=50, ge=1)
+    high_cardinality: Literal["sparse", "hash"] = "sparse"
+    hash_buckets: int = Field(default=32, ge=2)
 
 
 class ParseDatetimeOperation(StrictModel):
@@ -96,6 +102,15 @@ class SummaryDiff(StrictModel):
     missing_by_column_delta: dict[str, int]
     dtype_changes: dict[str, dict[str, str]]
 
+
+class SummaryDiffErrorBounds(StrictModel):
+    """추정한 SummaryDiff 값마다의 ± 오차 한계(행 수 단위)."""
+
+    confidence: float = 0.95
+    row_count_delta: float = 0.0
+    missing_total_delta: float = 0.0
+    missing_by_column_delta: dict[str, float] = Field(default_factory=dict)
+
 PreprocessOperation = Annotated[
     Union[
         DropMissingOperation,
@@ -115,6 +130,8 @@ PreprocessOperation = Annotated[
 class PreprocessApplyRequest(StrictModel):
     source_id: str
     operations: list[PreprocessOperation] = Field(default_factory=list)
+    # True이면 결과 CSV 대신 lineage만 기록하고 처음 읽을 때 materialize한다.
+    lazy: bool = False
 
 
 class PreprocessApplyRecommendationRequest(StrictModel):
@@ -122,6 +139,10 @@ class PreprocessApplyRecommendationRequest(StrictModel):
     recommendation: PreprocessRecommendation
 
 
+class PreprocessApplySavedPipelineRequest(StrictModel):
+    source_id: str
+
+
 class PreprocessApplyResponse(StrictModel):
     input_source_id: str
     output_source_id: str
@@ -129,3 +150,21 @@ class PreprocessApplyResponse(StrictModel):
     summary_before: DataSummary | None = None
     summary_after: DataSummary | None = None
     summary_diff: SummaryDiff | None = None
+
+
+class PreprocessPreviewRequest(StrictModel):
+    source_id: str
+    operations: list[PreprocessOperation] = Field(default_factory=list)
+    sample_size: int = Field(default=DEFAULT_PREVIEW_SAMPLE_SIZE, ge=100, le=100_000)
+    stratify_by: str | None = None
+
+
+class PreprocessPreviewResponse(StrictModel):
+    source_id: str
+    total_row_count: int
+    sample_row_count: int
+    # before/after는 표본 기준, summary_diff는 전체 dataset 기준 추정값이다.
+    summary_before: DataSummary
+    summary_after: DataSummary
+    summary_diff: SummaryDiff
+    error_bounds: SummaryDiffErrorBounds
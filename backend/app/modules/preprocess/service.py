@@ -1,15 +1,30 @@
+import io
 import os
 import uuid
+from dataclasses import replace
 from pathlib import Path
 from typing import Any, Dict
 
 import pandas as pd
+from pydantic import ValidationError
+from ..datasets.compression import (
+    DatasetCompressionPolicy,
+    compression_suffix,
+    open_compressed_writer,
+    strip_compression_suffix,
+)
+from ..datasets.dtypes import DatasetLoadPlan, csv_dtype_name
+from ..datasets.lineage import LineageManifest
 from ..datasets.models import Dataset
 from ..datasets.repository import DatasetRepository
 from ..datasets.service import DatasetReader
 from ..eda.schemas import PreprocessRecommendation
 from ..profiling.service import DatasetProfileService
-from .processor import PreprocessProcessor
+from .fitting import FittedParams, MomentAccumulator, QuantileSketch, operation_footprint, to_jsonable
+from .pipeline import CompiledPipeline
+from .preview import DEFAULT_PREVIEW_SAMPLE_SIZE, StratifiedSampler, estimate_count_deltas
+from .processor import OPERATION_ADAPTER, PreprocessProcessor
+from .repository import PreprocessPipelineRepository
 from .schemas import (
     DataSummary,
     DerivedColumnOperation,
@@ -22,10 +37,20 @@ from .schemas import (
     ParseDatetimeOperation,
     PreprocessApplyResponse,
     PreprocessOperation,
+    PreprocessPreviewResponse,
     ScaleOperation,
     SummaryDiff,
+    SummaryDiffErrorBounds,
 )
 
+_CSV_STABLE_DTYPE_PREFIXES = ("int", "float", "object", "str")
+
+# 이 크기 이상인 dataset은 전체를 메모리에 올리지 않고 chunk 단위로 전처리한다.
+DEFAULT_STREAMING_THRESHOLD_BYTES = 256 * 1024 * 1024
+DEFAULT_STREAMING_CHUNKSIZE = 100_000
+# lazy apply는 결과를 만들지 않으므로 원본 앞부분에 operation을 미리 적용해 실패할 plan을 거른다.
+LAZY_VALIDATION_ROWS = 1_000
+
 
 def _safe_float(value: Any, ndigits: int = 4) -> float | None:
     if pd.isna(value):
@@ -33,11 +58,16 @@ def _safe_float(value: Any, ndigits: int = 4) -> float | None:
     return round(float(value), ndigits)
 
 
-def _build_summary(df: pd.DataFrame) -> DataSummary:
-    missing_by_column = {column: int(df[column].isna().sum()) for column in df.columns}
+def _build_summary(df: pd.DataFrame, columns: list[str] | None = None) -> DataSummary:
+    """columns를 주면 그 컬럼만 계산한 부분 summary를 만든다(row_count는 전체 기준)."""
+    frame = df if columns is None else df[columns]
+    missing_by_column = {column: int(frame[column].isna().sum()) for column in frame.columns}
     numeric_distribution: dict[str, NumericDistribution] = {}
-    for column in df.select_dtypes(include="number").columns:
-        series = df[column].dropna()
+    for column in frame.select_dtypes(include="number").columns:
+        series = frame[column].dropna()
+        if isinstance(series.dtype, pd.SparseDtype):
+            # sparse one-hot 컬럼은 std/quantile을 지원하지 않아 컬럼 하나씩만 dense로 바꾼다.
+            series = series.sparse.to_dense()
         numeric_distribution[str(column)] = NumericDistribution(
             min=_safe_float(series.min()) if len(series) else None,
             max=_safe_float(series.max()) if len(series) else None,
@@ -49,14 +79,161 @@ def _build_summary(df: pd.DataFrame) -> DataSummary:
         )
     return DataSummary(
         row_count=len(df),
-        column_count=len(df.columns),
-        missing_total=int(df.isna().sum().sum()),
+        column_count=len(frame.columns),
+        missing_total=sum(missing_by_column.values()),
         missing_by_column=missing_by_column,
         numeric_distribution=numeric_distribution,
-        dtypes={str(column): str(dtype) for column, dtype in df.dtypes.items()},
+        dtypes={str(column): csv_dtype_name(dtype) for column, dtype in frame.dtypes.items()},
     )
 
 
+def _untouched_columns(pipeline: CompiledPipeline, before_columns: list[str]) -> set[str]:
+    """operation footprint상 값이 그대로인 입력 컬럼. 행이 줄지 않았다면 이 컬럼의 통계는 재사용할 수 있다."""
+    untouched = set(before_columns)
+    for operation in pipeline.operations:
+        footprint = operation_footprint(operation)
+        if footprint.writes is not None:
+            untouched -= footprint.writes
+        elif footprint.reads is None:
+            return set()
+        else:
+            untouched -= footprint.reads
+    return untouched
+
+
+def _merge_summary(before: DataSummary, partial: DataSummary, columns: list[str]) -> DataSummary:
+    """바뀌지 않은 컬럼은 before 값을, 다시 계산한 컬럼은 partial 값을 써서 after summary를 만든다."""
+    missing_by_column: dict[str, int] = {}
+    numeric_distribution: dict[str, NumericDistribution] = {}
+    dtypes: dict[str, str] = {}
+    for column in columns:
+        source = partial if column in partial.missing_by_column else before
+        missing_by_column[column] = source.missing_by_column[column]
+        dtypes[column] = source.dtypes[column]
+        if column in source.numeric_distribution:
+            numeric_distribution[column] = source.numeric_distribution[column]
+    return DataSummary(
+        row_count=partial.row_count,
+        column_count=len(columns),
+        missing_total=sum(missing_by_column.values()),
+        missing_by_column=missing_by_column,
+        numeric_distribution=numeric_distribution,
+        dtypes=dtypes,
+    )
+
+
+def _build_summary_after(
+    processed: pd.DataFrame,
+    before: DataSummary,
+    pipeline: CompiledPipeline,
+) -> DataSummary:
+    # 행이 줄었으면 모든 컬럼 통계가 바뀔 수 있으므로 전체를 다시 계산한다.
+    after_columns = [str(column) for column in processed.columns]
+    if len(processed) != before.row_count or len(set(after_columns)) != len(after_columns):
+        return _build_summary(processed)
+    untouched = _untouched_columns(pipeline, list(before.dtypes))
+    partial = _build_summary(processed, [column for column in after_columns if column not in untouched])
+    return _merge_summary(before, partial, after_columns)
+
+
+def _round_trips_csv(summary: DataSummary) -> bool:
+    """CSV로 다시 읽어도 dtype이 같은 summary만 결과 dataset에 캐시한다(datetime 등은 문자열로 읽힌다)."""
+    return all(dtype.startswith(_CSV_STABLE_DTYPE_PREFIXES) for dtype in summary.dtypes.values())
+
+
+def _cached_summary(dataset: Dataset, columns: list[str]) -> DataSummary | None:
+    """dataset에 저장된 summary가 현재 header와 같을 때만 재사용한다."""
+    payload = getattr(dataset, "data_summary", None)
+    if not isinstance(payload, dict):
+        return None
+    try:
+        summary = DataSummary.model_validate(payload)
+    except ValidationError:
+        return None
+    if list(summary.dtypes) != columns:
+        return None
+    return summary
+
+
+class _ChunkedSummary:
+    """chunk를 순서대로 받아 _build_summary와 같은 DataSummary를 만든다."""
+
+    def __init__(self, *, skip_columns: set[str] | None = None) -> None:
+        self.skip_columns = skip_columns or set()
+        self.row_count = 0
+        self.seen_columns: list[str] = []
+        self.columns: list[str] = []
+        self.missing: dict[str, int] = {}
+        self.dtypes: dict[str, list[str]] = {}
+        self.numeric: dict[str, bool] = {}
+        self.moments: dict[str, MomentAccumulator] = {}
+        self.sketches: dict[str, QuantileSketch] = {}
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        self.row_count += len(chunk)
+        if not self.seen_columns:
+            self.seen_columns = [str(column) for column in chunk.columns]
+        numeric_columns = set(chunk.select_dtypes(include="number").columns)
+        for column in chunk.columns:
+            key = str(column)
+            if key in self.skip_columns:
+                continue
+            if key not in self.missing:
+                self.columns.append(key)
+                self.missing[key] = 0
+                self.dtypes[key] = []
+                self.numeric[key] = True
+                self.moments[key] = MomentAccumulator()
+                self.sketches[key] = QuantileSketch(exact=False)
+            series = chunk[column]
+            self.missing[key] += int(series.isna().sum())
+            dtype = csv_dtype_name(series.dtype)
+            if dtype not in self.dtypes[key]:
+                self.dtypes[key].append(dtype)
+            if column not in numeric_columns:
+                self.numeric[key] = False
+            elif self.numeric[key]:
+                values = series.to_numpy(dtype="float64", na_value=float("nan"))
+                self.moments[key].update(values)
+                self.sketches[key].update(values)
+
+    def _merged_dtype(self, column: str) -> str:
+        dtypes = self.dtypes[column]
+        if len(dtypes) == 1:
+            return dtypes[0]
+        if self.numeric[column]:
+            return "float64" if any(dtype.startswith("float") for dtype in dtypes) else dtypes[0]
+        # 전부 결측인 chunk는 float64로 읽히므로 그 외 dtype이 하나면 그것을 쓴다.
+        non_float = [dtype for dtype in dtypes if not dtype.startswith("float")]
+        return non_float[0] if len(non_float) == 1 else "object"
+
+    def build(self) -> DataSummary:
+        numeric_distribution: dict[str, NumericDistribution] = {}
+        for column in self.columns:
+            if not self.numeric[column]:
+                continue
+            moments = self.moments[column]
+            sketch = self.sketches[column]
+            has_values = moments.count > 0
+            numeric_distribution[column] = NumericDistribution(
+                min=_safe_float(moments.min) if has_values else None,
+                max=_safe_float(moments.max) if has_values else None,
+                mean=_safe_float(moments.mean) if has_values else None,
+                std=_safe_float(moments.std()) if has_values else None,
+                p25=_safe_float(sketch.quantile(0.25)) if has_values else None,
+                p50=_safe_float(sketch.quantile(0.50)) if has_values else None,
+                p75=_safe_float(sketch.quantile(0.75)) if has_values else None,
+            )
+        return DataSummary(
+            row_count=self.row_count,
+            column_count=len(self.columns),
+            missing_total=sum(self.missing.values()),
+            missing_by_column=dict(self.missing),
+            numeric_distribution=numeric_distribution,
+            dtypes={column: self._merged_dtype(column) for column in self.columns},
+        )
+
+
 def _build_diff(before: DataSummary, after: DataSummary) -> SummaryDiff:
     all_columns = set(before.missing_by_column) | set(after.missing_by_column)
     missing_delta = {
@@ -93,11 +270,21 @@ class PreprocessService:
         reader: DatasetReader,
         processor: PreprocessProcessor,
         profile_service: DatasetProfileService,
+        compression: DatasetCompressionPolicy | None = None,
+        streaming_threshold_bytes: int | None = DEFAULT_STREAMING_THRESHOLD_BYTES,
+        streaming_chunksize: int = DEFAULT_STREAMING_CHUNKSIZE,
+        pipeline_repository: PreprocessPipelineRepository | None = None,
+        output_dir: Path | None = None,
     ) -> None:
         self.repository = repository
         self.reader = reader
         self.processor = processor
         self.profile_service = profile_service
+        self.compression = compression or DatasetCompressionPolicy()
+        self.streaming_threshold_bytes = streaming_threshold_bytes
+        self.streaming_chunksize = streaming_chunksize
+        self.pipeline_repository = pipeline_repository
+        self.output_dir = output_dir
 
     def build_dataset_profile(self, source_id: str) -> Dict[str, Any]:
         profile = self.profile_service.build_profile(source_id)
@@ -120,38 +307,364 @@ class PreprocessService:
         self,
         source_id: str,
         operations: list[PreprocessOperation],
+        *,
+        lazy: bool = False,
     ) -> PreprocessApplyResponse:
+        input_dataset = self.repository.get_by_source_id(source_id)
+        if not input_dataset:
+            raise FileNotFoundError(f"Dataset not found: {source_id}")
+        if not input_dataset.storage_path:
+            raise FileNotFoundError("Dataset file path not found")
+        if lazy:
+            return self._apply_lazy(input_dataset, operations)
+
+        codec = self.compression.codec_for(derived=True)
+        output_path, output_filename = self._build_output_path(
+            input_dataset,
+            storage_suffix=compression_suffix(codec),
+        )
+        pipeline = self.processor.compile(operations)
+        load_plan = self._load_plan(source_id, pipeline)
+        if self._should_stream(input_dataset):
+            storage_path = input_dataset.storage_path
+            params = self.processor.fit_operations_chunked(
+                lambda: self.reader.read_csv_chunks(
+                    storage_path,
+                    chunksize=self.streaming_chunksize,
+                    load_plan=load_plan,
+                ),
+                pipeline,
+            )
+            summary_before, summary_after = self._write_transformed_chunks(
+                input_dataset,
+                pipeline,
+                params,
+                output_path=output_path,
+                load_plan=load_plan,
+            )
+        else:
+            df = self.reader.read_csv(input_dataset.storage_path, load_plan=load_plan)
+            summary_before = _cached_summary(input_dataset, [str(column) for column in df.columns])
+            if summary_before is None:
+                summary_before = _build_summary(df)
+                self._remember_summary(input_dataset, summary_before)
+            processed, pipeline, params = self.processor.fit_transform(df, operations)
+            summary_after = _build_summary_after(processed, summary_before, pipeline)
+            processed.to_csv(output_path, index=False, compression=self.compression.pandas_options(codec))
+        return self._create_output(
+            source_id,
+            operations,
+            params,
+            output_path=output_path,
+            output_filename=output_filename,
+            summary_before=summary_before,
+            summary_after=summary_after,
+        )
+
+    def preview(
+        self,
+        source_id: str,
+        operations: list[PreprocessOperation],
+        *,
+        sample_size: int = DEFAULT_PREVIEW_SAMPLE_SIZE,
+        stratify_by: str | None = None,
+    ) -> PreprocessPreviewResponse:
+        """층화 표본에만 plan을 적용해 전체 dataset의 SummaryDiff와 95% 오차 한계를 추정한다.
+
+        fit parameter도 표본에서 구하므로 dtype/컬럼 변화와 분포는 근사값이다.
+        """
         input_dataset = self.repository.get_by_source_id(source_id)
         if not input_dataset:
             raise FileNotFoundError(f"Dataset not found: {source_id}")
         if not input_dataset.storage_path:
             raise FileNotFoundError("Dataset file path not found")
 
-        df = self.reader.read_csv(input_dataset.storage_path)
-        summary_before = _build_summary(df)
-        processed = self.processor.apply_operations(df, operations)
+        header = self._read_header(input_dataset.storage_path)
+        if stratify_by is not None and stratify_by not in header:
+            raise ValueError(f"Column not found: {stratify_by}")
+        # plan이 읽는 컬럼의 결측 패턴으로 층을 나눈다. 읽는 컬럼을 모르면 전체 컬럼을 쓴다.
+        missing_columns: list[str] = []
+        for operation in self.processor.compile(operations).operations:
+            reads = operation_footprint(operation).reads
+            missing_columns.extend(header if reads is None else [column for column in header if column in reads])
+        sampler = StratifiedSampler(
+            sample_size=sample_size,
+            missing_columns=list(dict.fromkeys(missing_columns)),
+            stratify_by=stratify_by,
+        )
+        for chunk in self.reader.read_csv_chunks(input_dataset.storage_path, chunksize=self.streaming_chunksize):
+            sampler.update(chunk)
+        sample = sampler.sample()
+
+        processed, _, _, positions = self.processor.fit_transform_tracked(sample.frame, operations)
+        summary_before = _build_summary(sample.frame)
         summary_after = _build_summary(processed)
-        summary_diff = _build_diff(summary_before, summary_after)
-        output_path, output_filename = self._build_output_path(input_dataset.storage_path)
-        processed.to_csv(output_path, index=False)
-        output_size = os.path.getsize(output_path)
+        sample_diff = _build_diff(summary_before, summary_after)
+        estimates = estimate_count_deltas(sample, processed, positions)
+        columns = sorted(sample_diff.missing_by_column_delta)
+        return PreprocessPreviewResponse(
+            source_id=source_id,
+            total_row_count=sample.total_rows,
+            sample_row_count=len(sample.frame),
+            summary_before=summary_before,
+            summary_after=summary_after,
+            summary_diff=SummaryDiff(
+                row_count_delta=round(estimates["__rows__"].value),
+                column_count_delta=sample_diff.column_count_delta,
+                missing_total_delta=round(estimates["__missing_total__"].value),
+                missing_by_column_delta={column: round(estimates[column].value) for column in columns},
+                dtype_changes=sample_diff.dtype_changes,
+            ),
+            error_bounds=SummaryDiffErrorBounds(
+                row_count_delta=round(estimates["__rows__"].margin, 2),
+                missing_total_delta=round(estimates["__missing_total__"].margin, 2),
+                missing_by_column_delta={column: round(estimates[column].margin, 2) for column in columns},
+            ),
+        )
 
+    def _apply_lazy(
+        self,
+        input_dataset: Dataset,
+        operations: list[PreprocessOperation],
+    ) -> PreprocessApplyResponse:
+        """결과 파일을 쓰지 않고 lineage manifest만 남긴다. 처음 읽힐 때 DatasetReader가 materialize한다."""
+        sample = self._lineage_sample(input_dataset.storage_path)
+        header = [str(column) for column in sample.columns]
+        available = set(header)
+        for operation in self.processor.compile(operations).operations:
+            footprint = operation_footprint(operation)
+            for column in sorted(footprint.reads or ()):
+                if column not in available:
+                    raise ValueError(f"Column not found: {column}")
+            if footprint.writes is None:
+                break
+            available |= footprint.writes
+        # 컬럼 검사로 못 거르는 실패(문자열 컬럼 scale 등)는 표본에 실제로 적용해 본다.
+        self.processor.fit_transform(sample, operations)
+
+        codec = self.compression.codec_for(derived=True)
+        output_path, output_filename = self._build_output_path(
+            input_dataset,
+            storage_suffix=compression_suffix(codec),
+        )
+        LineageManifest(
+            parent_source_id=input_dataset.source_id,
+            parent_storage_path=input_dataset.storage_path,
+            operations=[operation.model_dump(mode="json") for operation in operations],
+        ).write(output_path)
         output_dataset = self.repository.create(
-            Dataset(
-                filename=output_filename,
-                storage_path=str(output_path),
-                filesize=output_size,
-            )
+            Dataset(filename=output_filename, storage_path=str(output_path), filesize=None)
         )
+        # fit parameter와 after summary는 materialize 전에는 알 수 없어 pipeline artifact도 남기지 않는다.
+        return PreprocessApplyResponse(
+            input_source_id=input_dataset.source_id,
+            output_source_id=output_dataset.source_id,
+            output_filename=output_filename,
+            summary_before=_cached_summary(input_dataset, header),
+        )
+
+    def apply_saved_pipeline(
+        self,
+        source_id: str,
+        pipeline_source_id: str,
+    ) -> PreprocessApplyResponse:
+        """저장된 fit parameter로 새 dataset을 다시 fit하지 않고 한 번의 chunk pass로 변환한다."""
+        artifact = (
+            self.pipeline_repository.get_by_output_source_id(pipeline_source_id)
+            if self.pipeline_repository is not None
+            else None
+        )
+        if artifact is None:
+            raise FileNotFoundError(f"Preprocess pipeline not found: {pipeline_source_id}")
+        input_dataset = self.repository.get_by_source_id(source_id)
+        if not input_dataset:
+            raise FileNotFoundError(f"Dataset not found: {source_id}")
+        if not input_dataset.storage_path:
+            raise FileNotFoundError("Dataset file path not found")
+
+        operations = [OPERATION_ADAPTER.validate_python(item) for item in artifact.operations]
+        pipeline = self.processor.compile(operations)
+        if len(artifact.params) != len(pipeline.operations):
+            raise ValueError("Saved preprocess pipeline params do not match its operations")
+        # 저장 당시 입력 컬럼이 새 파일에 없으면 변환 전에 실패시킨다.
+        header = {str(column) for column in self._read_header(input_dataset.storage_path)}
+        for column in artifact.input_columns or []:
+            if column not in header:
+                raise ValueError(f"Column not found: {column}")
+
+        codec = self.compression.codec_for(derived=True)
+        output_path, output_filename = self._build_output_path(
+            input_dataset,
+            storage_suffix=compression_suffix(codec),
+        )
+        summary_before, summary_after = self._write_transformed_chunks(
+            input_dataset,
+            pipeline,
+            artifact.params,
+            output_path=output_path,
+            load_plan=self._load_plan(source_id, pipeline),
+        )
+        return self._create_output(
+            source_id,
+            operations,
+            artifact.params,
+            output_path=output_path,
+            output_filename=output_filename,
+            summary_before=summary_before,
+            summary_after=summary_after,
+        )
+
+    def _create_output(
+        self,
+        source_id: str,
+        operations: list[PreprocessOperation],
+        params: list[FittedParams],
+        *,
+        output_path: Path,
+        output_filename: str,
+        summary_before: DataSummary,
+        summary_after: DataSummary,
+    ) -> PreprocessApplyResponse:
+        output_dataset = Dataset(
+            filename=output_filename,
+            storage_path=str(output_path),
+            filesize=os.path.getsize(output_path),
+            data_summary=summary_after.model_dump(mode="json") if _round_trips_csv(summary_after) else None,
+        )
+        try:
+            if self.pipeline_repository is None:
+                output_dataset = self.repository.create(output_dataset)
+            else:
+                output_dataset, _ = self.pipeline_repository.create_with_output(
+                    output_dataset,
+                    input_source_id=source_id,
+                    operations=[operation.model_dump(mode="json") for operation in operations],
+                    params=to_jsonable(params),
+                    input_columns=list(summary_before.dtypes),
+                )
+        except BaseException:
+            # row가 없으면 아무도 참조하지 않는 파일이므로 지운다.
+            output_path.unlink(missing_ok=True)
+            raise
         return PreprocessApplyResponse(
             input_source_id=source_id,
             output_source_id=output_dataset.source_id,
             output_filename=output_filename,
             summary_before=summary_before,
             summary_after=summary_after,
-            summary_diff=summary_diff,
+            summary_diff=_build_diff(summary_before, summary_after),
         )
 
+    def _should_stream(self, dataset: Dataset) -> bool:
+        if self.streaming_threshold_bytes is None:
+            return False
+        size = dataset.filesize
+        if size is None:
+            try:
+                size = os.path.getsize(dataset.storage_path)
+            except OSError:
+                return False
+        return size >= self.streaming_threshold_bytes
+
+    def _load_plan(self, source_id: str, pipeline: CompiledPipeline) -> DatasetLoadPlan | None:
+        """plan이 건드리지 않는 컬럼만 작은 dtype으로 읽는다. 건드리는 컬럼은 기본 dtype 그대로라 결과가 같다."""
+        if self.profile_service is None:
+            return None
+        touched: set[str] = set()
+        for operation in pipeline.operations:
+            # drop_missing은 결측 여부만 보므로 dtype이 바뀌어도 결과가 같다.
+            if operation.op == "drop_missing":
+                continue
+            footprint = operation_footprint(operation)
+            if footprint.reads is None:
+                return None
+            touched |= footprint.reads | (footprint.writes or frozenset())
+        load_plan = self.profile_service.build_load_plan(source_id)
+        if load_plan is None:
+            return None
+        # 결과는 CSV로 다시 쓰므로 datetime은 원래 문자열 형식을 유지한다.
+        return replace(load_plan.without(touched), datetime_columns=frozenset())
+
+    def _lineage_sample(self, storage_path: str) -> pd.DataFrame:
+        """lazy 부모는 materialize하지 않고 실제 파일 앞부분에 조상 manifest의 operation을 차례로 적용한다."""
+        ancestors: list[LineageManifest] = []
+        current = storage_path
+        while not Path(current).is_file():
+            manifest = LineageManifest.read(current)
+            if manifest is None:
+                break
+            ancestors.append(manifest)
+            current = manifest.parent_storage_path
+        sample = self.reader.read_csv(current, nrows=LAZY_VALIDATION_ROWS)
+        for manifest in reversed(ancestors):
+            sample = self.processor.replay_operations(sample, manifest.operations)
+        return sample
+
+    def _read_header(self, storage_path: str) -> list[str]:
+        return [str(column) for column in self.reader.read_csv(storage_path, nrows=0).columns]
+
+    def _remember_summary(self, dataset: Dataset, summary: DataSummary) -> None:
+        dataset.data_summary = summary.model_dump(mode="json")
+        self.repository.update(dataset)
+
+    def _write_transformed_chunks(
+        self,
+        input_dataset: Dataset,
+        pipeline: CompiledPipeline,
+        params: list[FittedParams],
+        *,
+        output_path: Path,
+        load_plan: DatasetLoadPlan | None = None,
+    ) -> tuple[DataSummary, DataSummary]:
+        """fit된 pipeline으로 chunk를 변환하며 결과 파일에 이어 쓰고 before/after summary를 누적한다.
+
+        저장된 before summary가 있으면 입력 통계는 다시 누적하지 않는다. 행을 거르는 operation이 없으면
+        값이 그대로인 컬럼의 after 통계도 before에서 가져온다.
+        """
+        storage_path = input_dataset.storage_path
+        cached_before = _cached_summary(input_dataset, self._read_header(storage_path))
+        before = _ChunkedSummary()
+        skip_columns: set[str] = set()
+        if cached_before is not None and not any(stage.kind == "rows" for stage in pipeline.stages):
+            skip_columns = _untouched_columns(pipeline, list(cached_before.dtypes))
+        after = _ChunkedSummary(skip_columns=skip_columns)
+        codec = self.compression.codec_for(derived=True)
+        try:
+            with open(output_path, "wb") as raw:
+                writer = open_compressed_writer(raw, codec, self.compression.resolved_level(codec))
+                text = io.TextIOWrapper(writer, encoding="utf-8", newline="")
+                try:
+                    header = True
+                    chunks = self.reader.read_csv_chunks(
+                        storage_path,
+                        chunksize=self.streaming_chunksize,
+                        load_plan=load_plan,
+                    )
+                    for chunk in chunks:
+                        if cached_before is None:
+                            before.update(chunk)
+                        processed = self.processor.transform_chunk(chunk, pipeline, params)
+                        after.update(processed)
+                        processed.to_csv(text, index=False, header=header)
+                        header = False
+                finally:
+                    text.flush()
+                    text.detach()
+                    if writer is not raw:
+                        writer.close()
+        except Exception:
+            output_path.unlink(missing_ok=True)
+            raise
+        if cached_before is None:
+            summary_before = before.build()
+            self._remember_summary(input_dataset, summary_before)
+        else:
+            summary_before = cached_before
+        summary_after = after.build()
+        if skip_columns:
+            summary_after = _merge_summary(summary_before, summary_after, after.seen_columns)
+        return summary_before, summary_after
+
     def apply_recommendation(
         self,
         source_id: str,
@@ -270,8 +783,12 @@ class PreprocessService:
 
         return operations
 
-    @staticmethod
-    def _build_output_path(source_path: str) -> tuple[Path, str]:
-        source = Path(source_path)
-        output_filename = f"{source.stem}_preprocessed_{uuid.uuid4().hex[:8]}.csv"
-        return source.with_name(output_filename), output_filename
+    def _build_output_path(self, input_dataset: Dataset, *, storage_suffix: str = "") -> tuple[Path, str]:
+        """파생 결과는 content-addressed blob 디렉터리가 아닌 output_dir에 쓴다. 없으면 입력 파일 옆에 쓴다."""
+        source = strip_compression_suffix(input_dataset.storage_path)
+        # blob 파일 이름은 checksum이므로 사용자에게 보이는 이름은 입력 dataset의 filename에서 만든다.
+        stem = Path(input_dataset.filename).stem if input_dataset.filename else source.stem
+        output_filename = f"{stem}_preprocessed_{uuid.uuid4().hex[:8]}.csv"
+        output_dir = self.output_dir or source.parent
+        output_dir.mkdir(parents=True, exist_ok=True)
+        return output_dir / f"{output_filename}{storage_suffix}", output_filename
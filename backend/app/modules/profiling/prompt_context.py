@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import json
+import math
+import re
+from typing import Any, Iterable, Mapping
+
+from pydantic import BaseModel
+
+DEFAULT_PROMPT_TOKEN_BUDGET = 1500
+DEFAULT_SAMPLE_ROW_LIMIT = 3
+
+# prompt가 실제로 읽는 scalar 필드만 남긴다.
+_SCALAR_FIELDS = ("filename", "row_count_total", "row_count", "timezone")
+_COLUMN_LIST_FIELDS = (
+    "numeric_columns",
+    "datetime_columns",
+    "categorical_columns",
+    "boolean_columns",
+    "identifier_columns",
+    "group_key_columns",
+)
+_COLUMN_MAP_FIELDS = ("dtypes", "logical_types", "missing_rates")
+_TOKEN_SPLIT_RE = re.compile(r"[^0-9a-zA-Z가-힣]+")
+_CAMEL_CASE_RE = re.compile(r"(?<=[a-z0-9])(?=[A-Z])")
+_CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    return math.ceil(len(text) / _CHARS_PER_TOKEN)
+
+
+class DatasetPromptContextBuilder:
+    """DatasetContext/MetadataSnapshot을 prompt용 compact payload로 줄인다."""
+
+    def __init__(
+        self,
+        *,
+        token_budget: int = DEFAULT_PROMPT_TOKEN_BUDGET,
+        sample_row_limit: int = DEFAULT_SAMPLE_ROW_LIMIT,
+    ) -> None:
+        self.token_budget = token_budget
+        self.sample_row_limit = sample_row_limit
+
+    def build(
+        self,
+        dataset_context: BaseModel | Mapping[str, Any],
+        *,
+        question: str = "",
+        required_columns: Iterable[str] = (),
+    ) -> dict[str, Any]:
+        payload = (
+            dataset_context.model_dump()
+            if isinstance(dataset_context, BaseModel)
+            else dict(dataset_context)
+        )
+        all_columns = [str(column) for column in payload.get("columns") or []]
+        required = {str(column) for column in required_columns}
+        compact: dict[str, Any] = {
+            key: payload[key] for key in _SCALAR_FIELDS if payload.get(key) is not None
+        }
+        quality_summary = payload.get("quality_summary")
+        if quality_summary:
+            compact["quality_summary"] = quality_summary
+
+        ranked_columns = self.rank_columns(
+            all_columns,
+            question=question,
+            required_columns=required,
+            datetime_columns=payload.get("datetime_columns") or [],
+        )
+        # 고정 key 이름과 부가 필드 몫을 먼저 뺀다.
+        overhead = {key: [] for key in ("columns", *_COLUMN_MAP_FIELDS, *_COLUMN_LIST_FIELDS)}
+        overhead["omitted_column_count"] = len(all_columns)
+        remaining = self.token_budget - estimate_tokens(self._to_json({**compact, **overhead}))
+        list_members = [set(payload.get(key) or []) for key in _COLUMN_LIST_FIELDS]
+        selected: set[str] = set()
+        for column in ranked_columns:
+            cost = self._estimate_column_tokens(payload, column, list_members)
+            if selected and column not in required and cost > remaining:
+                break
+            selected.add(column)
+            remaining -= cost
+
+        compact["columns"] = [column for column in all_columns if column in selected]
+        for key in _COLUMN_MAP_FIELDS:
+            values = payload.get(key) or {}
+            if values:
+                compact[key] = {
+                    column: values[column] for column in compact["columns"] if column in values
+                }
+        for key in _COLUMN_LIST_FIELDS:
+            values = [column for column in payload.get(key) or [] if column in selected]
+            if values:
+                compact[key] = values
+        if len(selected) < len(all_columns):
+            compact["omitted_column_count"] = len(all_columns) - len(selected)
+
+        sample_rows = []
+        for row in list(payload.get("sample_rows") or [])[: self.sample_row_limit]:
+            compact_row = {
+                column: row[column] for column in compact["columns"] if column in row
+            }
+            cost = estimate_tokens(self._to_json(compact_row))
+            if cost > remaining:
+                break
+            sample_rows.append(compact_row)
+            remaining -= cost
+        if sample_rows:
+            compact["sample_rows"] = sample_rows
+        return compact
+
+    def to_prompt_json(
+        self,
+        dataset_context: BaseModel | Mapping[str, Any],
+        *,
+        question: str = "",
+        required_columns: Iterable[str] = (),
+    ) -> str:
+        return self._to_json(
+            self.build(
+                dataset_context,
+                question=question,
+                required_columns=required_columns,
+            )
+        )
+
+    # 질문과 컬럼명의 lexical overlap으로 컬럼 우선순위를 정한다.
+    def rank_columns(
+        self,
+        columns: list[str],
+        *,
+        question: str,
+        required_columns: Iterable[str] = (),
+        datetime_columns: Iterable[str] = (),
+    ) -> list[str]:
+        required = {str(column) for column in required_columns}
+        datetime_set = {str(column) for column in datetime_columns}
+        normalized_question = question.lower()
+        question_tokens = set(self._tokenize(question))
+
+        def score(column: str) -> float:
+            if column in required:
+                return float("inf")
+            value = 0.0
+            if column.lower() in normalized_question:
+                value += 10.0
+            for token in self._tokenize(column):
+                if token in question_tokens:
+                    value += 2.0
+                elif len(token) >= 3 and token in normalized_question:
+                    value += 1.0
+            if column in datetime_set:
+                value += 0.5
+            return value
+
+        indexed = list(enumerate(columns))
+        indexed.sort(key=lambda item: (-score(item[1]), item[0]))
+        return [column for _, column in indexed]
+
+    # 컬럼 하나가 columns, 컬럼별 map, 타입별 list에 각각 들어가는 몫을 합친다.
+    def _estimate_column_tokens(
+        self,
+        payload: Mapping[str, Any],
+        column: str,
+        list_members: list[set[str]],
+    ) -> int:
+        name = self._to_json(column)
+        length = len(name) + 2
+        for key in _COLUMN_MAP_FIELDS:
+            values = payload.get(key) or {}
+            if column in values:
+                length += len(name) + len(self._to_json(values[column])) + 4
+        length += sum(len(name) + 2 for members in list_members if column in members)
+        return math.ceil(length / _CHARS_PER_TOKEN)
+
+    @staticmethod
+    def _tokenize(value: str) -> list[str]:
+        spaced = _CAMEL_CASE_RE.sub(" ", str(value or ""))
+        return [token.lower() for token in _TOKEN_SPLIT_RE.split(spaced) if token]
+
+    @staticmethod
+    def _to_json(payload: Any) -> str:
+        return json.dumps(payload, ensure_ascii=False, default=str)
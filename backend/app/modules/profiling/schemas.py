@@ -22,6 +22,8 @@ class ColumnProfile(BaseModel):
     unique_count: int = 0
     unique_ratio: float = Field(ge=0.0, le=1.0)
     sample_values: list[object] = Field(default_factory=list)
+    min_value: float | None = None
+    max_value: float | None = None
 
 
 class DatasetProfile(BaseModel):
@@ -1,7 +1,6 @@
-from pathlib import Path
-
 import pandas as pd
 
+from ..datasets.dtypes import CATEGORY_MAX_UNIQUE_RATIO, DatasetLoadPlan
 from ..datasets.repository import DataSourceRepository
 from ..datasets.service import DatasetReader
 from .schemas import (
@@ -47,6 +46,38 @@ GROUP_KEY_NAME_TOKENS = (
 )
 
 
+_CATEGORY_LOGICAL_TYPES = {"categorical", "group_key", "boolean"}
+
+
+def _load_plan_for_columns(columns: list[tuple[str, str, ColumnProfileType, float]]) -> DatasetLoadPlan:
+    """(컬럼, raw dtype, logical type, 고유값 비율)로 load plan을 만든다."""
+    category_columns = set()
+    datetime_columns = set()
+    for name, raw_dtype, inferred_type, unique_ratio in columns:
+        # 숫자로 읽히는 컬럼을 category로 읽으면 값이 문자열이 되므로 문자열 컬럼만 고른다.
+        is_text = raw_dtype in {"object", "str", "string"}
+        if inferred_type in _CATEGORY_LOGICAL_TYPES and is_text and unique_ratio <= CATEGORY_MAX_UNIQUE_RATIO:
+            category_columns.add(name)
+        elif inferred_type == "datetime" and is_text:
+            datetime_columns.add(name)
+    return DatasetLoadPlan(
+        category_columns=frozenset(category_columns),
+        datetime_columns=frozenset(datetime_columns),
+    )
+
+
+def load_plan_from_profile(profile: DatasetProfile) -> DatasetLoadPlan | None:
+    """이미 만든 profile의 logical type으로 DatasetReader load plan을 만든다."""
+    if not profile.available:
+        return None
+    return _load_plan_for_columns(
+        [
+            (column.name, column.raw_dtype, column.inferred_type, column.unique_ratio)
+            for column in profile.column_profiles
+        ]
+    )
+
+
 class DatasetProfileService:
     """Build reusable dataset profiles from uploaded CSV sources."""
 
@@ -67,19 +98,30 @@ class DatasetProfileService:
         if not dataset or not dataset.storage_path:
             return DatasetProfile(source_id=source_id, available=False)
 
-        file_path = Path(dataset.storage_path)
-        if not file_path.exists() or not file_path.is_file():
+        if not self.reader.exists(dataset.storage_path):
             return DatasetProfile(source_id=source_id, available=False)
 
         sample_df = self.reader.read_csv(dataset.storage_path, nrows=sample_rows)
-        (
-            total_row_count,
-            full_missing_counts,
-            missing_rates,
-        ) = self._compute_missing_statistics(
-            dataset.storage_path,
-            columns=[str(column) for column in sample_df.columns.tolist()],
-        )
+        sample_columns = [str(column) for column in sample_df.columns.tolist()]
+        ingest_stats = self._usable_ingest_stats(dataset, columns=sample_columns)
+        if ingest_stats is not None:
+            total_row_count = int(ingest_stats["row_count"])
+            full_missing_counts = {
+                column: int(ingest_stats["null_counts"].get(column, 0))
+                for column in sample_columns
+            }
+            missing_rates = self._to_missing_rates(full_missing_counts, total_row_count)
+            numeric_ranges = ingest_stats.get("numeric_ranges") or {}
+        else:
+            (
+                total_row_count,
+                full_missing_counts,
+                missing_rates,
+            ) = self._compute_missing_statistics(
+                dataset.storage_path,
+                columns=sample_columns,
+            )
+            numeric_ranges = {}
         row_count = len(sample_df)
 
         numeric_columns: list[str] = []
@@ -112,6 +154,7 @@ class DatasetProfileService:
 
             sample_values = [self._serialize_value(value) for value in non_null_series.head(3).tolist()]
             unique_count = int(non_null_series.nunique(dropna=True))
+            value_range = numeric_ranges.get(column_name) or [None, None]
             column_profiles.append(
                 ColumnProfile(
                     name=column_name,
@@ -122,6 +165,8 @@ class DatasetProfileService:
                     unique_count=unique_count,
                     unique_ratio=self._safe_ratio(unique_count, len(non_null_series)),
                     sample_values=sample_values,
+                    min_value=value_range[0],
+                    max_value=value_range[1],
                 )
             )
 
@@ -156,6 +201,25 @@ class DatasetProfileService:
             column_profiles=column_profiles,
         )
 
+    def build_load_plan(self, source_id: str, *, sample_rows: int = 2000) -> DatasetLoadPlan | None:
+        """표본만 읽어 logical type을 추론하고 load plan을 만든다. 결측 통계는 계산하지 않는다."""
+        dataset = self.repository.get_by_source_id(source_id) if source_id else None
+        if not dataset or not dataset.storage_path or not self.reader.exists(dataset.storage_path):
+            return None
+        sample_df = self.reader.read_csv(dataset.storage_path, nrows=sample_rows)
+        columns = []
+        for column in sample_df.columns:
+            series = sample_df[column]
+            non_null = series.dropna()
+            inferred_type = self._infer_column_type(
+                column_name=str(column),
+                series=series,
+                row_count=len(sample_df),
+            )
+            unique_ratio = self._safe_ratio(int(non_null.nunique(dropna=True)), len(non_null))
+            columns.append((str(column), str(series.dtype), inferred_type, unique_ratio))
+        return _load_plan_for_columns(columns)
+
     def _compute_missing_statistics(
         self,
         storage_path: str,
@@ -178,11 +242,24 @@ class DatasetProfileService:
             for column in columns:
                 missing_counts[column] += int(null_counts.get(column, 0))
 
-        missing_rates = {
+        return total_rows, missing_counts, self._to_missing_rates(missing_counts, total_rows)
+
+    @staticmethod
+    def _to_missing_rates(missing_counts: dict[str, int], total_rows: int) -> dict[str, float]:
+        return {
             column: round(float(count) / float(total_rows), 3) if total_rows > 0 else 0.0
             for column, count in missing_counts.items()
         }
-        return total_rows, missing_counts, missing_rates
+
+    # 업로드 때 누적한 통계는 header가 pandas 컬럼과 같을 때만 전체 재스캔 대신 쓴다.
+    @staticmethod
+    def _usable_ingest_stats(dataset: object, *, columns: list[str]) -> dict | None:
+        ingest_stats = getattr(dataset, "ingest_stats", None)
+        if not isinstance(ingest_stats, dict):
+            return None
+        if ingest_stats.get("columns") != columns or "row_count" not in ingest_stats:
+            return None
+        return ingest_stats
 
     @staticmethod
     def _build_sample_rows(df: pd.DataFrame, *, limit: int = 3) -> list[dict[str, object]]:
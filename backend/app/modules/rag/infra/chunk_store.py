@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
+
+CHUNK_TEXT_FILENAME = "chunks.bin"
+CHUNK_INDEX_FILENAME = "chunks.idx.npy"
+CHUNK_STORE_FILENAMES = (CHUNK_TEXT_FILENAME, CHUNK_INDEX_FILENAME)
+
+
+class ChunkStore:
+    """faiss_id 순서로 chunk text를 이어 붙인 파일과 offset index를 memory-map으로 읽는다.
+
+    index 행 i는 faiss_id i에 대한 (chunk_id, start offset, end offset)이다.
+    """
+
+    def __init__(self, *, index: np.ndarray, data: np.ndarray | None) -> None:
+        self._index = index
+        self._data = data
+
+    def __len__(self) -> int:
+        return int(self._index.shape[0])
+
+    def get(self, faiss_id: int) -> Optional[tuple[int, str]]:
+        if faiss_id < 0 or faiss_id >= len(self):
+            return None
+        chunk_id, start, end = (int(value) for value in self._index[faiss_id])
+        if self._data is None or end <= start:
+            return chunk_id, ""
+        return chunk_id, self._data[start:end].tobytes().decode("utf-8")
+
+    def rows(self) -> list[tuple[int, str, int]]:
+        """저장된 chunk를 (chunk_id, content, faiss_id) 목록으로 돌려준다."""
+        rows: list[tuple[int, str, int]] = []
+        for faiss_id in range(len(self)):
+            chunk_id, content = self.get(faiss_id)
+            rows.append((chunk_id, content, faiss_id))
+        return rows
+
+    @staticmethod
+    def exists(directory: Path) -> bool:
+        return (directory / CHUNK_INDEX_FILENAME).exists() and (directory / CHUNK_TEXT_FILENAME).exists()
+
+    @staticmethod
+    def write(directory: Path, chunk_rows: Iterable[tuple[int, str, int]]) -> None:
+        """(chunk_id, content, faiss_id) 목록을 저장한다. faiss_id는 0부터 빈틈없이 이어져야 한다."""
+        rows = sorted(chunk_rows, key=lambda row: row[2])
+        if [row[2] for row in rows] != list(range(len(rows))):
+            raise ValueError("chunk store requires contiguous faiss ids starting at 0")
+
+        directory.mkdir(parents=True, exist_ok=True)
+        index = np.zeros((len(rows), 3), dtype=np.int64)
+        offset = 0
+        with open(directory / CHUNK_TEXT_FILENAME, "wb") as handle:
+            for position, (chunk_id, content, _) in enumerate(rows):
+                encoded = content.encode("utf-8")
+                handle.write(encoded)
+                index[position] = (chunk_id, offset, offset + len(encoded))
+                offset += len(encoded)
+        np.save(directory / CHUNK_INDEX_FILENAME, index)
+
+    @classmethod
+    def load(cls, directory: Path) -> "ChunkStore":
+        index = np.load(directory / CHUNK_INDEX_FILENAME, mmap_mode="r")
+        text_path = directory / CHUNK_TEXT_FILENAME
+        # 길이 0 파일은 memmap할 수 없으므로 빈 store로 둔다.
+        data = np.memmap(text_path, dtype=np.uint8, mode="r") if text_path.stat().st_size else None
+        return cls(index=index, data=data)
+
+
+__all__ = ["ChunkStore"]
@@ -5,6 +5,8 @@ from typing import List
 import numpy as np
 from sentence_transformers import SentenceTransformer
 
+from ....core.metrics import EMBEDDED_TEXTS, EMBEDDING_SECONDS
+
 
 class E5Embedder:
     def __init__(self, model_name: str = "intfloat/multilingual-e5-small") -> None:
@@ -14,22 +16,26 @@ class E5Embedder:
 
     def embed_documents(self, texts: List[str]) -> np.ndarray:
         prefixed = [f"passage: {text}" for text in texts]
-        embeddings = self._model.encode(
-            prefixed,
-            normalize_embeddings=True,
-            convert_to_numpy=True,
-            show_progress_bar=False,
-        )
+        with EMBEDDING_SECONDS.time(kind="document"):
+            embeddings = self._model.encode(
+                prefixed,
+                normalize_embeddings=True,
+                convert_to_numpy=True,
+                show_progress_bar=False,
+            )
+        EMBEDDED_TEXTS.inc(len(prefixed), kind="document")
         return embeddings.astype("float32")
 
     def embed_query(self, query: str) -> np.ndarray:
         prefixed = [f"query: {query}"]
-        embeddings = self._model.encode(
-            prefixed,
-            normalize_embeddings=True,
-            convert_to_numpy=True,
-            show_progress_bar=False,
-        )
+        with EMBEDDING_SECONDS.time(kind="query"):
+            embeddings = self._model.encode(
+                prefixed,
+                normalize_embeddings=True,
+                convert_to_numpy=True,
+                show_progress_bar=False,
+            )
+        EMBEDDED_TEXTS.inc(len(prefixed), kind="query")
         return embeddings.astype("float32")
 
 __all__ = ["E5Embedder"]
@@ -6,6 +6,8 @@ from typing import Tuple
 import faiss
 import numpy as np
 
+from ....core.metrics import VECTOR_SEARCH_SECONDS
+
 
 class FaissStore:
     def __init__(self, dim: int) -> None:
@@ -19,7 +21,8 @@ class FaissStore:
         return list(range(start, end))
 
     def search(self, query_embedding: np.ndarray, top_k: int) -> Tuple[np.ndarray, np.ndarray]:
-        return self.index.search(query_embedding, top_k)
+        with VECTOR_SEARCH_SECONDS.time():
+            return self.index.search(query_embedding, top_k)
 
     def save(self, path: Path) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
@@ -1,5 +1,6 @@
 from typing import Iterable, List, Optional
 
+from sqlalchemy import delete, insert
 from sqlalchemy.orm import Session
 
 from .models import RagChunk, RagSource
@@ -18,6 +19,21 @@ class RagRepository:
             query = query.filter(RagSource.source_id.in_(source_filter))
         return query.all()
 
+    def find_source_by_checksum(
+        self,
+        checksum: str,
+        *,
+        embedding_model: str,
+        exclude_source_id: Optional[str] = None,
+    ) -> Optional[RagSource]:
+        query = self.db.query(RagSource).filter(
+            RagSource.checksum == checksum,
+            RagSource.embedding_model == embedding_model,
+        )
+        if exclude_source_id is not None:
+            query = query.filter(RagSource.source_id != exclude_source_id)
+        return query.first()
+
     def replace_source_contents(
         self,
         *,
@@ -45,20 +61,24 @@ class RagRepository:
                 source.embedding_dim = embedding_dim
                 source.chunk_count = len(chunk_rows)
 
-            self.db.query(RagChunk).filter(RagChunk.source_id == source_id).delete(
-                synchronize_session=False
+            # chunk FK가 source row를 보도록 먼저 flush한다.
+            self.db.flush()
+            # chunk는 ORM unit of work를 거치지 않고 단일 delete와 executemany insert로 교체한다.
+            self.db.execute(
+                delete(RagChunk).where(RagChunk.source_id == source_id)
             )
             if chunk_rows:
-                self.db.add_all(
+                self.db.execute(
+                    insert(RagChunk),
                     [
-                        RagChunk(
-                            source_id=source_id,
-                            chunk_id=chunk_id,
-                            content=content,
-                            faiss_id=faiss_id,
-                        )
+                        {
+                            "source_id": source_id,
+                            "chunk_id": chunk_id,
+                            "content": content,
+                            "faiss_id": faiss_id,
+                        }
                         for chunk_id, content, faiss_id in chunk_rows
-                    ]
+                    ],
                 )
             self.db.commit()
             self.db.refresh(source)
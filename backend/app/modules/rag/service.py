@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import hashlib
+import io
+import os
 import shutil
 import uuid
 from dataclasses import dataclass
 from pathlib import Path
 from typing import IO, Any, Iterable, Optional
 
+from ..datasets.compression import detect_codec, open_dataset_binary, strip_compression_suffix
 from ..datasets.models import Dataset
 from ..datasets.repository import DatasetRepository
 from ..datasets.service import DatasetService
@@ -15,6 +18,7 @@ from ..guidelines.service import GuidelineService
 from .ai import answer_with_context
 from .errors import RagEmbeddingError, RagNotIndexedError, RagSearchError
 from .guideline_repository import GuidelineRagRepository
+from .infra.chunk_store import CHUNK_STORE_FILENAMES, ChunkStore
 from .repository import RagRepository
 
 MAX_INDEX_TEXT_CHARS = 200_000
@@ -117,6 +121,52 @@ class _BaseIndexedRagService:
         chunks: list[str],
     ) -> None:
         chunk_rows, temp_dir = self._build_temp_index(source_id=source_id, chunks=chunks)
+        self._install_source_index(
+            source_id=source_id,
+            checksum=checksum,
+            chunk_rows=chunk_rows,
+            temp_dir=temp_dir,
+        )
+
+    # 같은 checksum/embedding model로 이미 만든 index가 있으면 embedding 없이 파일을 공유한다.
+    def _reuse_source_index(self, *, source_id: str, checksum: str) -> bool:
+        donor = self.repository.find_source_by_checksum(
+            checksum,
+            embedding_model=self.embedder.model_name,
+            exclude_source_id=source_id,
+        )
+        if donor is None:
+            return False
+        donor_dir = self._source_dir(donor.source_id)
+        if not (donor_dir / "index.faiss").exists() or not ChunkStore.exists(donor_dir):
+            return False
+
+        temp_dir = self._temp_dir(source_id)
+        self._remove_dir(temp_dir)
+        temp_dir.mkdir(parents=True)
+        try:
+            for filename in ("index.faiss", *CHUNK_STORE_FILENAMES):
+                self._link_or_copy(donor_dir / filename, temp_dir / filename)
+            chunk_rows = ChunkStore.load(temp_dir).rows()
+        except Exception:
+            self._remove_dir(temp_dir)
+            raise
+        self._install_source_index(
+            source_id=source_id,
+            checksum=checksum,
+            chunk_rows=chunk_rows,
+            temp_dir=temp_dir,
+        )
+        return True
+
+    def _install_source_index(
+        self,
+        *,
+        source_id: str,
+        checksum: str,
+        chunk_rows: list[tuple[int, str, int]],
+        temp_dir: Path,
+    ) -> None:
         final_dir = self._source_dir(source_id)
         backup_dir = self._backup_dir(source_id)
 
@@ -169,6 +219,7 @@ class _BaseIndexedRagService:
 
         store.save(temp_dir / "index.faiss")
         chunk_rows = list(zip(range(len(chunks)), chunks, faiss_ids))
+        ChunkStore.write(temp_dir, chunk_rows)
         return chunk_rows, temp_dir
 
     def _source_dir(self, source_id: str) -> Path:
@@ -188,6 +239,14 @@ class _BaseIndexedRagService:
         if path.exists():
             shutil.rmtree(path)
 
+    # index 파일은 교체될 때 디렉터리 단위로 바뀌고 제자리 수정되지 않으므로 hard link로 공유해도 된다.
+    @staticmethod
+    def _link_or_copy(source: Path, target: Path) -> None:
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copy2(source, target)
+
     @staticmethod
     def _checksum_file(path: Path) -> str:
         hasher = hashlib.sha256()
@@ -200,7 +259,11 @@ class _BaseIndexedRagService:
     def _load_text_from_file(*, path: Path, max_chars: int = MAX_INDEX_TEXT_CHARS) -> str:
         if path.suffix.lower() == ".pdf":
             return _BaseIndexedRagService._load_pdf(path=path, max_chars=max_chars)
-        return path.read_text(encoding="utf-8", errors="ignore")[:max_chars]
+        if detect_codec(path) != "none":
+            with io.TextIOWrapper(open_dataset_binary(path), encoding="utf-8", errors="ignore") as handle:
+                return handle.read(max_chars)
+        with open(path, encoding="utf-8", errors="ignore") as handle:
+            return handle.read(max_chars)
 
     @staticmethod
     def _load_pdf(*, path: Path, max_chars: int) -> str:
@@ -247,13 +310,12 @@ class _BaseIndexedRagService:
 
         chunk_map: dict[tuple[str, int], RetrievedChunk] = {}
         for source_id, faiss_ids in by_source.items():
-            rows = self.repository.get_chunks_by_faiss_ids(source_id, faiss_ids)
-            for row in rows:
-                chunk_map[(source_id, row.faiss_id)] = RetrievedChunk(
+            for faiss_id, chunk_id, content in self._read_source_chunks(source_id, faiss_ids):
+                chunk_map[(source_id, faiss_id)] = RetrievedChunk(
                     source_id=source_id,
-                    chunk_id=row.chunk_id,
+                    chunk_id=chunk_id,
                     score=0.0,
-                    content=row.content,
+                    content=content,
                 )
 
         retrieved: list[RetrievedChunk] = []
@@ -271,6 +333,27 @@ class _BaseIndexedRagService:
             )
         return retrieved
 
+    # index 옆 chunk store에서 바로 읽고, chunk store가 없는 이전 index만 DB에서 읽는다.
+    def _read_source_chunks(
+        self,
+        source_id: str,
+        faiss_ids: list[int],
+    ) -> list[tuple[int, int, str]]:
+        source_dir = self._source_dir(source_id)
+        if ChunkStore.exists(source_dir):
+            chunk_store = ChunkStore.load(source_dir)
+            rows: list[tuple[int, int, str]] = []
+            for faiss_id in faiss_ids:
+                item = chunk_store.get(faiss_id)
+                if item is not None:
+                    rows.append((faiss_id, item[0], item[1]))
+            return rows
+
+        return [
+            (row.faiss_id, row.chunk_id, row.content)
+            for row in self.repository.get_chunks_by_faiss_ids(source_id, faiss_ids)
+        ]
+
 
 class RagService(_BaseIndexedRagService):
     def __init__(
@@ -328,11 +411,15 @@ class RagService(_BaseIndexedRagService):
         if not path.exists() or not self._is_supported_dataset(dataset):
             return
 
-        checksum = self._checksum_file(path)
+        # 업로드 때 계산한 checksum이 있으면 파일을 다시 읽지 않는다.
+        checksum = dataset.checksum or self._checksum_file(path)
         existing = self.repository.get_source(dataset.source_id)
         if existing and existing.checksum == checksum and self._index_path(dataset.source_id).exists():
             return
 
+        if self._reuse_source_index(source_id=dataset.source_id, checksum=checksum):
+            return
+
         text = self._load_dataset_text(path)
         chunks = self._chunk_text(text)
         self._replace_source_index(
@@ -381,7 +468,8 @@ class RagService(_BaseIndexedRagService):
     def _is_supported_dataset(dataset: Dataset) -> bool:
         if not dataset.storage_path:
             return False
-        return Path(dataset.storage_path).suffix.lower() in SUPPORTED_DATASET_RAG_EXTENSIONS
+        suffix = strip_compression_suffix(dataset.storage_path).suffix.lower()
+        return suffix in SUPPORTED_DATASET_RAG_EXTENSIONS
 
     @staticmethod
     def _load_dataset_text(path: Path) -> str:
@@ -436,6 +524,9 @@ class GuidelineRagService(_BaseIndexedRagService):
         if existing and existing.checksum == checksum and self._index_path(guideline.source_id).exists():
             return
 
+        if self._reuse_source_index(source_id=guideline.source_id, checksum=checksum):
+            return
+
         text = self._load_guideline_text(path)
         chunks = self._chunk_text(text)
         self._replace_source_index(
@@ -4,6 +4,7 @@ from typing import Any, Dict
 import pandas as pd
 
 from ..analysis.schemas import AnalysisExecutionResult, AnalysisPlan
+from ..datasets.compression import strip_compression_suffix
 from ..datasets.repository import DatasetRepository
 from ..datasets.service import DatasetReader
 from .processor import VisualizationProcessor
@@ -55,16 +56,16 @@ class VisualizationService:
         dataset = self.repository.get_by_source_id(source_id)
         if not dataset or not dataset.storage_path:
             return None
-        file_path = Path(dataset.storage_path)
-        if not file_path.exists() or not file_path.is_file():
+        if not self.reader.exists(dataset.storage_path):
             return None
-        return file_path
+        # 차트 script가 경로를 직접 읽으므로 lineage dataset은 CSV로 써 둔다.
+        return self.reader.ensure_file(dataset.storage_path)
 
     def load_sample_frame(self, source_id: str, *, nrows: int) -> tuple[pd.DataFrame | None, str]:
         file_path = self.resolve_source_path(source_id)
         if file_path is None:
             return None, "dataset_missing"
-        if file_path.suffix.lower() != ".csv":
+        if strip_compression_suffix(file_path).suffix.lower() != ".csv":
             return None, "unsupported_format"
         try:
             return self.reader.read_csv(str(file_path), nrows=nrows), "available"
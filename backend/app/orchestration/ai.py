@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import json
+from typing import AsyncIterator
 
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 from pydantic import BaseModel, Field
 
 from ..core.ai import LLMGateway, PromptRegistry
@@ -58,25 +59,55 @@ def analyze_intent(
     )
 
 
-def answer_general_question(
+def _build_general_question_messages(
+    *,
+    user_input: str,
+    request_context: str | None,
+) -> list[BaseMessage]:
+    content = user_input
+    if isinstance(request_context, str) and request_context.strip():
+        content = f"question:\n{user_input}\n\nrequest_context:\n{request_context.strip()}"
+    return [
+        SystemMessage(content=PROMPTS.load_prompt("general.system")),
+        HumanMessage(content=content),
+    ]
+
+
+def _build_data_question_messages(
+    *,
+    user_input: str,
+    merged_context: dict,
+    evidence_package: dict,
+    answer_quality: dict,
+) -> list[BaseMessage]:
+    return [
+        SystemMessage(content=PROMPTS.load_prompt("data_qa.system")),
+        HumanMessage(
+            content=(
+                f"question:\n{user_input}\n\n"
+                f"evidence_package:\n{json.dumps(evidence_package, ensure_ascii=False)}\n\n"
+                f"answer_quality:\n{json.dumps(answer_quality, ensure_ascii=False)}\n\n"
+                f"merged_context:\n{json.dumps(merged_context, ensure_ascii=False)}"
+            )
+        ),
+    ]
+
+
+def astream_general_question(
     *,
     user_input: str,
     request_context: str | None = None,
     model_id: str | None,
     default_model: str,
-) -> str:
+) -> AsyncIterator[str]:
     llm = LLMGateway(default_model=default_model)
-    content = user_input
-    if isinstance(request_context, str) and request_context.strip():
-        content = f"question:\n{user_input}\n\nrequest_context:\n{request_context.strip()}"
-    result = llm.invoke(
+    return llm.stream_text(
         model_id=model_id,
-        messages=[
-            SystemMessage(content=PROMPTS.load_prompt("general.system")),
-            HumanMessage(content=content),
-        ],
+        messages=_build_general_question_messages(
+            user_input=user_input,
+            request_context=request_context,
+        ),
     )
-    return result.content if isinstance(result.content, str) else str(result.content)
 
 
 def answer_data_question(
@@ -91,16 +122,32 @@ def answer_data_question(
     llm = LLMGateway(default_model=default_model)
     result = llm.invoke(
         model_id=model_id,
-        messages=[
-            SystemMessage(content=PROMPTS.load_prompt("data_qa.system")),
-            HumanMessage(
-                content=(
-                    f"question:\n{user_input}\n\n"
-                    f"evidence_package:\n{json.dumps(evidence_package, ensure_ascii=False)}\n\n"
-                    f"answer_quality:\n{json.dumps(answer_quality, ensure_ascii=False)}\n\n"
-                    f"merged_context:\n{json.dumps(merged_context, ensure_ascii=False)}"
-                )
-            ),
-        ],
+        messages=_build_data_question_messages(
+            user_input=user_input,
+            merged_context=merged_context,
+            evidence_package=evidence_package,
+            answer_quality=answer_quality,
+        ),
     )
     return result.content if isinstance(result.content, str) else str(result.content)
+
+
+def astream_data_question(
+    *,
+    user_input: str,
+    merged_context: dict,
+    evidence_package: dict,
+    answer_quality: dict,
+    model_id: str | None,
+    default_model: str,
+) -> AsyncIterator[str]:
+    llm = LLMGateway(default_model=default_model)
+    return llm.stream_text(
+        model_id=model_id,
+        messages=_build_data_question_messages(
+            user_input=user_input,
+            merged_context=merged_context,
+            evidence_package=evidence_package,
+            answer_quality=answer_quality,
+        ),
+    )
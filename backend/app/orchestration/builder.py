@@ -5,12 +5,13 @@ from typing import Any, Dict
 from langgraph.graph import END, START, StateGraph
 
 from ..core.trace_logging import set_trace_stage
-from .ai import answer_data_question, answer_general_question
+from .ai import astream_data_question, astream_general_question
 from .evidence import build_evidence_contract
 from .intake_router import build_intake_router_workflow
 from ..modules.planner.service import build_handoff_from_planning_result
 from .state import MainWorkflowState
 from .state_view import build_merged_context
+from .utils import relay_answer_stream
 from .workflows.analysis import build_analysis_workflow
 from .workflows.guideline import build_guideline_workflow
 from .workflows.preprocess import build_preprocess_workflow
@@ -133,13 +134,15 @@ def build_main_workflow(
             return "cancelled"
         return "merge_context"
 
-    def general_question_terminal(state: MainWorkflowState) -> Dict[str, Any]:
+    async def general_question_terminal(state: MainWorkflowState) -> Dict[str, Any]:
         set_trace_stage("general_question")
-        answer = answer_general_question(
-            user_input=str(state.get("user_input", "")),
-            request_context=str(state.get("request_context", "")),
-            model_id=state.get("model_id"),
-            default_model=default_model,
+        answer = await relay_answer_stream(
+            astream_general_question(
+                user_input=str(state.get("user_input", "")),
+                request_context=str(state.get("request_context", "")),
+                model_id=state.get("model_id"),
+                default_model=default_model,
+            )
         )
         return {
             "output": {
@@ -203,7 +206,7 @@ def build_main_workflow(
             "clarification_question": planning_result.clarification_question,
         }
 
-    def data_qa_terminal(state: MainWorkflowState) -> Dict[str, Any]:
+    async def data_qa_terminal(state: MainWorkflowState) -> Dict[str, Any]:
         set_trace_stage("data_qa")
         evidence_package = state.get("evidence_package")
         if not isinstance(evidence_package, dict):
@@ -255,13 +258,15 @@ def build_main_workflow(
                 }
 
         merged_context = state.get("merged_context")
-        answer = answer_data_question(
-            user_input=str(state.get("user_input", "")),
-            merged_context=merged_context if isinstance(merged_context, dict) else {},
-            evidence_package=evidence_package,
-            answer_quality=answer_quality,
-            model_id=state.get("model_id"),
-            default_model=default_model,
+        answer = await relay_answer_stream(
+            astream_data_question(
+                user_input=str(state.get("user_input", "")),
+                merged_context=merged_context if isinstance(merged_context, dict) else {},
+                evidence_package=evidence_package,
+                answer_quality=answer_quality,
+                model_id=state.get("model_id"),
+                default_model=default_model,
+            )
         )
         answer_text = str(answer or "").strip()
         return {
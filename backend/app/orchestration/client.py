@@ -5,11 +5,14 @@ LLMClient는 선택된 프리셋으로 LangChain 체인을 구성해 간단한 
 from __future__ import annotations
 
 import asyncio
+from functools import partial
 from typing import Any, AsyncIterator, Dict
 
 from langgraph.types import Command
 
-from ..core.trace_logging import log_trace
+from ..core.profiling import profile_async_iterator, run_in_profiled_thread
+from ..core.trace_logging import get_trace_verbosity, log_trace
+from .metrics import WorkflowNodeMetricsHandler
 from .state_view import build_approval_wait_step, collect_thought_steps, make_thought_step
 
 
@@ -23,7 +26,7 @@ class AgentClient:
         self.default_model = default_model
         self._workflow_runtime_factory = workflow_runtime_factory
 
-    async def astream_with_trace(
+    def astream_with_trace(
         self,
         session_id: str | None = None,
         run_id: str | None = None,
@@ -32,6 +35,32 @@ class AgentClient:
         dataset: Any | None = None,
         model_id: str | None = None,
         resume: Dict[str, Any] | None = None,
+        profile: bool = False,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        events = self._astream_with_trace(
+            session_id=session_id,
+            run_id=run_id,
+            question=question,
+            context=context,
+            dataset=dataset,
+            model_id=model_id,
+            resume=resume,
+        )
+        # profile을 요청하지 않으면 workflow 이벤트 스트림을 그대로 돌려준다.
+        if not profile:
+            return events
+        return profile_async_iterator(events)
+
+    async def _astream_with_trace(
+        self,
+        *,
+        session_id: str | None,
+        run_id: str | None,
+        question: str | None,
+        context: str | None,
+        dataset: Any | None,
+        model_id: str | None,
+        resume: Dict[str, Any] | None,
     ) -> AsyncIterator[Dict[str, Any]]:
         async with self._runtime() as runtime:
             workflow = getattr(runtime, "workflow", runtime)
@@ -68,13 +97,41 @@ class AgentClient:
                 yield {"type": "thought", "step": initial_step}
 
             final_state: Dict[str, Any] = {}
-            async for snapshot in self._astream_workflow_values(workflow, input_payload, config):
+            last_snapshot_summary: Dict[str, Any] = {}
+            streamed_parts: list[str] = []
+            async for kind, payload in self._astream_workflow_events(workflow, input_payload, config):
+                if kind == "chunk":
+                    delta = payload.get("delta")
+                    if isinstance(delta, str) and delta:
+                        streamed_parts.append(delta)
+                        yield {"type": "chunk", "delta": delta}
+                    continue
+
+                snapshot = payload
                 final_state = snapshot
-                log_trace(
-                    layer="workflow",
-                    event="snapshot",
-                    payload=self._summarize_snapshot(snapshot),
-                )
+                verbosity = get_trace_verbosity("workflow")
+                # summary verbosity에서는 직전 snapshot과 달라진 key만 남긴다. 비교하려면 매번 요약해야 한다.
+                if verbosity == "summary":
+                    snapshot_summary = self._summarize_snapshot(snapshot)
+                    changed_summary = {
+                        key: value
+                        for key, value in snapshot_summary.items()
+                        if key not in last_snapshot_summary or last_snapshot_summary[key] != value
+                    }
+                    last_snapshot_summary = snapshot_summary
+                    if changed_summary:
+                        log_trace(
+                            layer="workflow",
+                            event="snapshot",
+                            payload=changed_summary,
+                        )
+                # full은 log_trace가 record를 받을 때만 요약하고, off는 요약하지 않는다.
+                elif verbosity == "full":
+                    log_trace(
+                        layer="workflow",
+                        event="snapshot",
+                        payload=partial(self._summarize_snapshot, snapshot),
+                    )
                 pending_approval = self._extract_interrupt_payload(snapshot)
                 if pending_approval is not None:
                     log_trace(
@@ -109,13 +166,15 @@ class AgentClient:
             log_trace(
                 layer="workflow",
                 event="workflow_final_state",
-                payload=self._summarize_snapshot(final_state),
+                payload=partial(self._summarize_snapshot, final_state),
             )
             answer = self._extract_answer(final_state)
-            for index in range(0, len(answer), 24):
-                delta = answer[index:index + 24]
-                yield {"type": "chunk", "delta": delta}
-                await asyncio.sleep(0)
+            # 답변 노드가 토큰을 직접 흘려보내지 않은 경로(고정 문구, 차트 요약 등)만 잘라서 보낸다.
+            if not streamed_parts:
+                for index in range(0, len(answer), 24):
+                    delta = answer[index:index + 24]
+                    yield {"type": "chunk", "delta": delta}
+                    await asyncio.sleep(0)
             done_event: Dict[str, Any] = {
                 "type": "done",
                 "answer": answer,
@@ -204,7 +263,10 @@ class AgentClient:
     @staticmethod
     def _build_config(*, run_id: str | None, session_id: str | None) -> Dict[str, Any]:
         thread_id = str(run_id or session_id or "default")
-        return {"configurable": {"thread_id": thread_id}}
+        return {
+            "configurable": {"thread_id": thread_id},
+            "callbacks": [WorkflowNodeMetricsHandler()],
+        }
 
     @staticmethod
     def _extract_output_type(result_state: Dict[str, Any]) -> str:
@@ -335,23 +397,40 @@ class AgentClient:
             "interrupt_stage": interrupt.get("stage") if isinstance(interrupt, dict) else None,
         }
 
-    async def _astream_workflow_values(
+    async def _astream_workflow_events(
         self,
         workflow: Any,
         input_payload: Any,
         config: Dict[str, Any],
-    ) -> AsyncIterator[Dict[str, Any]]:
+    ) -> AsyncIterator[tuple[str, Dict[str, Any]]]:
         if hasattr(workflow, "astream"):
-            async for snapshot in workflow.astream(input_payload, config, stream_mode="values"):
-                if isinstance(snapshot, dict):
-                    yield snapshot
+            async for namespace, mode, payload in workflow.astream(
+                input_payload,
+                config,
+                stream_mode=["values", "custom"],
+                subgraphs=True,
+            ):
+                if not isinstance(payload, dict):
+                    continue
+                if mode == "custom":
+                    if payload.get("type") == "chunk":
+                        yield "chunk", payload
+                    continue
+                # 서브그래프 내부 values는 부모 state와 shape가 달라 root snapshot만 사용한다.
+                if mode == "values" and not namespace:
+                    yield "values", payload
             return
 
-        final_state = await asyncio.to_thread(
-            workflow.invoke,
-            input_payload,
-            config,
-            stream_mode="values",
-        )
+        # node가 async라 sync invoke로는 실행할 수 없다. stream을 못 하는 runtime도 ainvoke로 실행한다.
+        if hasattr(workflow, "ainvoke"):
+            final_state = await workflow.ainvoke(input_payload, config, stream_mode="values")
+        else:
+            final_state = await asyncio.to_thread(
+                run_in_profiled_thread,
+                workflow.invoke,
+                input_payload,
+                config,
+                stream_mode="values",
+            )
         if isinstance(final_state, dict):
-            yield final_state
+            yield "values", final_state
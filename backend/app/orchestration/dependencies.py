@@ -18,7 +18,7 @@ from ..modules.analysis.dependencies import (
     build_results_repository,
 )
 from ..modules.analysis.service import AnalysisService
-from ..modules.datasets.dependencies import build_dataset_reader, build_dataset_repository
+from ..modules.datasets.dependencies import build_dataset_repository
 from ..modules.eda.dependencies import build_eda_service
 from ..modules.eda.service import EDAService
 from ..modules.guidelines.dependencies import build_guideline_repository, build_guideline_service
@@ -26,6 +26,8 @@ from ..modules.guidelines.service import GuidelineService
 from ..modules.planner.dependencies import build_planner_service
 from ..modules.planner.service import PlannerService
 from ..modules.preprocess.dependencies import (
+    build_lineage_dataset_reader,
+    build_preprocess_pipeline_repository,
     build_preprocess_processor,
     build_preprocess_service,
 )
@@ -67,7 +69,7 @@ class WorkflowServices:
 
 def build_orchestration_services(*, db: Session, agent: Any) -> WorkflowServices:
     dataset_repository = build_dataset_repository(db)
-    dataset_reader = build_dataset_reader()
+    dataset_reader = build_lineage_dataset_reader()
     profile_service = build_dataset_profile_service(
         repository=dataset_repository,
         reader=dataset_reader,
@@ -97,12 +99,14 @@ def build_orchestration_services(*, db: Session, agent: Any) -> WorkflowServices
         sandbox=build_analysis_sandbox(),
         results_repository=build_results_repository(db=db),
         visualization_service=visualization_service,
+        reader=dataset_reader,
     )
     preprocess_service = build_preprocess_service(
         repository=dataset_repository,
         reader=dataset_reader,
         processor=build_preprocess_processor(),
         profile_service=profile_service,
+        pipeline_repository=build_preprocess_pipeline_repository(db),
     )
     rag_service = build_rag_service(
         repository=build_rag_repository(db),
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from time import perf_counter
+from typing import Any
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langgraph.errors import GraphBubbleUp
+
+from ..core.metrics import WORKFLOW_NODE_ERRORS, WORKFLOW_NODE_SECONDS
+
+
+class WorkflowNodeMetricsHandler(BaseCallbackHandler):
+    """LangGraph node 단위 chain run의 시작/종료 시각으로 node 실행 시간을 기록한다."""
+
+    run_inline = True
+
+    def __init__(self) -> None:
+        self._started: dict[UUID, tuple[str, float]] = {}
+
+    def on_chain_start(
+        self,
+        serialized: dict[str, Any] | None,
+        inputs: Any,
+        *,
+        run_id: UUID,
+        metadata: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        node = (metadata or {}).get("langgraph_node")
+        # node 내부의 하위 runnable은 제외하고 node run 자체만 잰다.
+        if node and kwargs.get("name") == node:
+            self._started[run_id] = (str(node), perf_counter())
+
+    def on_chain_end(self, outputs: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        started = self._started.pop(run_id, None)
+        if started is not None:
+            node, started_at = started
+            WORKFLOW_NODE_SECONDS.observe(perf_counter() - started_at, node=node)
+
+    def on_chain_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        started = self._started.pop(run_id, None)
+        if started is None:
+            return
+        node, started_at = started
+        WORKFLOW_NODE_SECONDS.observe(perf_counter() - started_at, node=node)
+        # 승인 대기 interrupt는 실패가 아니다.
+        if not isinstance(error, GraphBubbleUp):
+            WORKFLOW_NODE_ERRORS.inc(node=node)
@@ -201,6 +201,7 @@ class PreprocessGraphState(AgentState, total=False):
     handoff: HandoffPayload
     preprocess_decision: Dict[str, Any]
     preprocess_plan: Dict[str, Any]
+    preprocess_preview: Dict[str, Any] | None
     preprocess_result: PreprocessResultPayload
     output: OutputPayload
 
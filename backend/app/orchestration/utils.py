@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, AsyncIterator, Dict
+
+from langgraph.config import get_stream_writer
 
 
 def resolve_target_source_id(state: Dict[str, Any]) -> str | None:
@@ -19,3 +21,17 @@ def resolve_target_source_id(state: Dict[str, Any]) -> str | None:
     if isinstance(source_id, str) and source_id.strip():
         return source_id.strip()
     return None
+
+
+def emit_answer_chunk(delta: str) -> None:
+    if delta:
+        get_stream_writer()({"type": "chunk", "delta": delta})
+
+
+# LLM 토큰을 custom stream 이벤트로 흘려보내면서 최종 답변 문자열을 모은다.
+async def relay_answer_stream(deltas: AsyncIterator[str]) -> str:
+    parts: list[str] = []
+    async for delta in deltas:
+        parts.append(delta)
+        emit_answer_chunk(delta)
+    return "".join(parts)
@@ -19,6 +19,7 @@ from backend.app.modules.preprocess.planner import (
     build_preprocess_review_payload,
     get_revision_instruction,
 )
+from backend.app.modules.datasets.service import DatasetReadError
 from backend.app.modules.eda.service import EDAService
 from backend.app.modules.preprocess.service import PreprocessService
 from backend.app.orchestration.state import PreprocessGraphState
@@ -85,6 +86,19 @@ def build_preprocess_workflow(
             "preprocess_plan": plan.model_dump(),
         }
 
+    def preview_node(state: PreprocessGraphState) -> Dict[str, Any]:
+        # 승인 전에 표본에서 plan 효과를 추정해 보여준다. 실패해도 승인 흐름은 막지 않는다.
+        # approval_gate는 resume 때 다시 실행되므로 dataset을 훑는 preview는 이 node에서 한 번만 만든다.
+        set_trace_stage("preprocess_preview")
+        plan = PreprocessPlan.model_validate(state.get("preprocess_plan") or {})
+        if not plan.operations:
+            return {"preprocess_preview": None}
+        try:
+            preview = preprocess_service.preview(str(state.get("source_id") or ""), plan.operations)
+        except (FileNotFoundError, ValueError, DatasetReadError):
+            return {"preprocess_preview": None}
+        return {"preprocess_preview": preview.model_dump(mode="json")}
+
     def approval_gate_node(state: PreprocessGraphState) -> Dict[str, Any]:
         set_trace_stage("preprocess_approval")
         plan = PreprocessPlan.model_validate(state.get("preprocess_plan") or {})
@@ -95,6 +109,7 @@ def build_preprocess_workflow(
             dataset_profile=state.get("dataset_profile", {}),
             plan=plan,
             reason_summary=str(reason_summary) if isinstance(reason_summary, str) else "",
+            preview=state.get("preprocess_preview"),
         )
         decision_raw = interrupt(payload)
 
@@ -177,6 +192,7 @@ def build_preprocess_workflow(
     graph.add_node("ingestion_and_profile", ingestion_and_profile_node)
     graph.add_node("preprocess_decision", preprocess_decision_node)
     graph.add_node("planner", planner_node)
+    graph.add_node("preview", preview_node)
     graph.add_node("approval_gate", approval_gate_node)
     graph.add_node("executor", executor_node)
     graph.add_node("skip", skip_node)
@@ -191,7 +207,8 @@ def build_preprocess_workflow(
             "skip_preprocess": "skip",
         },
     )
-    graph.add_edge("planner", "approval_gate")
+    graph.add_edge("planner", "preview")
+    graph.add_edge("preview", "approval_gate")
     graph.add_conditional_edges(
         "approval_gate",
         route_after_approval,
@@ -0,0 +1,111 @@
+"""DatasetReader CSV engine 비교 benchmark.
+
+제조 설비 export와 비슷한 두 가지 모양(긴 narrow 표, 센서 채널이 많은 wide 표)의 CSV를 만들고
+C engine, pyarrow engine, pyarrow dtype backend, profile load plan 조합의 전체 읽기 시간과 메모리를 잰다.
+
+    python -m backend.scripts.benchmark_csv_read --scale 0.2 --repeat 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from backend.app.modules.datasets.csv_engine import CsvReadOptions, _pyarrow_available
+from backend.app.modules.datasets.dtypes import DatasetLoadPlan
+from backend.app.modules.datasets.service import DatasetReader
+
+# 이름 -> (행 수, 숫자 센서 컬럼 수)
+SHAPES: dict[str, tuple[int, int]] = {
+    "narrow": (1_000_000, 4),
+    "wide": (200_000, 60),
+}
+VARIANTS: dict[str, CsvReadOptions] = {
+    "c": CsvReadOptions(),
+    "pyarrow": CsvReadOptions(engine="pyarrow"),
+    "pyarrow+arrow_dtypes": CsvReadOptions(engine="pyarrow", dtype_backend="pyarrow"),
+}
+
+
+def _write_dataset(path: Path, *, rows: int, sensors: int, seed: int = 0) -> DatasetLoadPlan:
+    rng = np.random.default_rng(seed)
+    frame = pd.DataFrame(
+        {
+            "measured_at": pd.date_range("2024-01-01", periods=rows, freq="s").strftime("%Y-%m-%d %H:%M:%S"),
+            "line_group": rng.choice([f"LINE-{index}" for index in range(12)], rows),
+            "equipment_id": rng.choice([f"EQ-{index:04d}" for index in range(300)], rows),
+            "status": rng.choice(["OK", "NG", "HOLD"], rows),
+            "cycle": rng.integers(0, 10_000, rows),
+        }
+    )
+    for index in range(sensors):
+        values = rng.normal(50, 10, rows).round(3)
+        values[rng.random(rows) < 0.02] = np.nan
+        frame[f"sensor_{index:02d}"] = values
+    frame.to_csv(path, index=False)
+    return DatasetLoadPlan(
+        category_columns=frozenset({"line_group", "equipment_id", "status"}),
+        datetime_columns=frozenset({"measured_at"}),
+    )
+
+
+def _measure(
+    reader: DatasetReader,
+    path: Path,
+    *,
+    repeat: int,
+    load_plan: DatasetLoadPlan | None,
+) -> tuple[float, float]:
+    best = float("inf")
+    memory = 0.0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        frame = reader.read_csv(str(path), load_plan=load_plan)
+        best = min(best, time.perf_counter() - started)
+        memory = frame.memory_usage(deep=True).sum() / (1024 * 1024)
+        del frame
+    return best, memory
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=float, default=1.0, help="SHAPES 행 수에 곱할 배율")
+    parser.add_argument("--repeat", type=int, default=3, help="variant마다 반복해 최솟값을 쓴다")
+    parser.add_argument("--shape", choices=sorted(SHAPES), action="append", help="특정 모양만 잰다")
+    args = parser.parse_args(argv)
+
+    has_pyarrow = _pyarrow_available()
+    if not has_pyarrow:
+        print("pyarrow is not installed; only C engine variants are measured", file=sys.stderr)
+    print(f"{'shape':<8} {'variant':<22} {'seconds':>8} {'memory_mb':>10} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as directory:
+        for shape in args.shape or list(SHAPES):
+            rows, sensors = SHAPES[shape]
+            path = Path(directory) / f"{shape}.csv"
+            load_plan = _write_dataset(path, rows=max(1, int(rows * args.scale)), sensors=sensors)
+            runs = [(name, options, None) for name, options in VARIANTS.items()]
+            runs.append(("c+load_plan", CsvReadOptions(), load_plan))
+            runs.append(("pyarrow+load_plan", CsvReadOptions(engine="pyarrow"), load_plan))
+            baseline = None
+            for name, options, plan in runs:
+                if not has_pyarrow and "pyarrow" in (options.engine, options.dtype_backend):
+                    continue
+                seconds, memory = _measure(
+                    DatasetReader(csv_options=options),
+                    path,
+                    repeat=max(1, args.repeat),
+                    load_plan=plan,
+                )
+                baseline = baseline or seconds
+                print(f"{shape:<8} {name:<22} {seconds:>8.3f} {memory:>10.1f} {baseline / seconds:>7.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import pytest
+
+from backend.app.core import trace_logging
+from backend.app.core.trace_logging import flush_trace_logs
+
+
+class InMemoryDatasetRepository:
+    """DatasetRepository와 같은 method를 dict로 흉내 내는 테스트용 저장소."""
+
+    def __init__(self) -> None:
+        self.items = {}
+        self.updates = 0
+
+    def create(self, dataset):
+        dataset.source_id = dataset.source_id or f"source-{len(self.items) + 1}"
+        self.items[dataset.source_id] = dataset
+        return dataset
+
+    def get_by_source_id(self, source_id: str):
+        return self.items.get(source_id)
+
+    def update(self, dataset):
+        self.updates += 1
+        return dataset
+
+    def count_by_storage_path(self, storage_path: str) -> int:
+        return sum(1 for item in self.items.values() if item.storage_path == storage_path)
+
+    def delete(self, dataset) -> None:
+        self.items.pop(dataset.source_id, None)
+
+
+@pytest.fixture(autouse=True)
+def _trace_logs_in_tmp_path(tmp_path, monkeypatch):
+    # workflow 실행은 trace를 남기므로 실제 storage/logs 대신 임시 경로에 쓰게 한다.
+    flush_trace_logs()
+    monkeypatch.setattr(trace_logging, "TRACE_LOG_PATH", tmp_path / "agent-trace.jsonl")
+    monkeypatch.setattr(trace_logging, "TRACE_SUMMARY_DIR", tmp_path / "traces")
+    yield
+    flush_trace_logs()
+
+
+@pytest.fixture
+def dataset_repository() -> InMemoryDatasetRepository:
+    return InMemoryDatasetRepository()
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import threading
+import time
+from types import SimpleNamespace
+
+from backend.app.modules.analysis.dependencies import ANALYSIS_CANDIDATE_COUNT_ENV, build_analysis_service
+from backend.app.modules.analysis.processor import AnalysisProcessor
+from backend.app.modules.analysis.schemas import AnalysisExecutionResult
+from backend.app.modules.analysis.service import AnalysisService
+
+
+class FakeWorker:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FakeSandbox:
+    def __init__(self) -> None:
+        self.workers: list[FakeWorker] = []
+        self.executed: list[str] = []
+
+    def start_worker(self, *, dataset_path: str) -> FakeWorker:
+        worker = FakeWorker()
+        self.workers.append(worker)
+        return worker
+
+    def execute(self, *, code: str, dataset_path: str, worker: FakeWorker):
+        self.executed.append(code)
+        return SimpleNamespace(code=code)
+
+
+class FakeProcessor(AnalysisProcessor):
+    def validate_generated_code(self, *, generated_code: str, analysis_plan) -> str:
+        return generated_code
+
+    def validate_execution_result(self, *, sandbox_result, analysis_plan) -> AnalysisExecutionResult:
+        if sandbox_result.code == "good":
+            return AnalysisExecutionResult(execution_status="success", summary="ok")
+        return AnalysisExecutionResult(
+            execution_status="fail",
+            error_stage="result_validation",
+            error_message="bad output",
+        )
+
+
+class FakeRunService:
+    def __init__(self) -> None:
+        self.primary_released = threading.Event()
+        self.repair_calls = 0
+
+    def generate_analysis_code(self, *, question, analysis_plan, model_id, temperature):
+        if temperature == 0:
+            # primary 후보는 느리게 실패한다.
+            self.primary_released.wait(timeout=5)
+            return "bad"
+        return "good"
+
+    def repair_analysis_code(self, **kwargs) -> str:
+        self.repair_calls += 1
+        return "good"
+
+
+def _build_service(run_service: FakeRunService, sandbox: FakeSandbox, **kwargs) -> AnalysisService:
+    return AnalysisService(
+        dataset_repository=SimpleNamespace(),
+        dataset_context_service=SimpleNamespace(),
+        planner_service=SimpleNamespace(),
+        run_service=run_service,
+        processor=FakeProcessor(),
+        sandbox=sandbox,
+        **kwargs,
+    )
+
+
+def test_parallel_candidates_accept_first_valid_result() -> None:
+    run_service = FakeRunService()
+    sandbox = FakeSandbox()
+    service = _build_service(run_service, sandbox, candidate_count=2)
+
+    bundle = service._run_code_generation_loop(
+        question="q",
+        dataset=SimpleNamespace(storage_path="data.csv"),
+        analysis_plan=SimpleNamespace(),
+        model_id=None,
+    )
+    run_service.primary_released.set()
+    deadline = time.monotonic() + 5
+    while not all(worker.closed for worker in sandbox.workers) and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert bundle["final_status"] == "success"
+    assert bundle["generated_code"] == "good"
+    assert run_service.repair_calls == 0
+    # 채택 뒤 코드 생성을 마친 primary 후보는 sandbox 실행 전에 멈춘다.
+    assert all(worker.closed for worker in sandbox.workers)
+    assert sandbox.executed == ["good"]
+
+
+def test_candidate_count_is_read_from_env(monkeypatch) -> None:
+    monkeypatch.setenv(ANALYSIS_CANDIDATE_COUNT_ENV, "3")
+    service = build_analysis_service(
+        repository=SimpleNamespace(),
+        dataset_context_service=SimpleNamespace(),
+        planner_service=SimpleNamespace(),
+        processor=FakeProcessor(),
+        run_service=FakeRunService(),
+        sandbox=FakeSandbox(),
+    )
+
+    assert service.candidate_count == 3
+
+
+def test_single_candidate_repairs_after_failed_attempt() -> None:
+    run_service = FakeRunService()
+    run_service.primary_released.set()
+    sandbox = FakeSandbox()
+    service = _build_service(run_service, sandbox)
+
+    bundle = service._run_code_generation_loop(
+        question="q",
+        dataset=SimpleNamespace(storage_path="data.csv"),
+        analysis_plan=SimpleNamespace(),
+        model_id=None,
+    )
+
+    assert bundle["final_status"] == "success"
+    assert run_service.repair_calls == 1
+    assert all(worker.closed for worker in sandbox.workers)
+
+
+def test_worker_start_failure_is_reported_as_sandbox_error() -> None:
+    class BrokenSandbox(FakeSandbox):
+        def start_worker(self, *, dataset_path: str) -> FakeWorker:
+            raise OSError("cannot spawn")
+
+    run_service = FakeRunService()
+    run_service.primary_released.set()
+    service = _build_service(run_service, BrokenSandbox())
+
+    bundle = service._run_code_attempt(
+        question="q",
+        dataset=SimpleNamespace(storage_path="data.csv"),
+        analysis_plan=SimpleNamespace(),
+        model_id=None,
+        attempt=0,
+    )
+
+    assert bundle["final_status"] == "fail"
+    assert bundle["analysis_error"].stage == "sandbox_execution"
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from backend.app.modules.analysis.sandbox import AnalysisSandbox
+
+_SNIPPET = (
+    "print(json.dumps({'summary': 'rows', 'raw_metrics': {'rows': len(df), 'total': float(df['sales'].sum())},"
+    " 'used_columns': ['sales']}))"
+)
+
+
+def test_prestarted_worker_runs_code_against_loaded_dataset(tmp_path) -> None:
+    source = tmp_path / "sales.csv"
+    source.write_text("region,sales\nseoul,10\nbusan,2.5\n", encoding="utf-8")
+    sandbox = AnalysisSandbox(timeout_seconds=60)
+
+    worker = sandbox.start_worker(dataset_path=str(source))
+    workdir = Path(worker.workdir.name)
+    try:
+        result = sandbox.execute(code=_SNIPPET, dataset_path=str(source), worker=worker)
+    finally:
+        worker.close()
+
+    assert result.ok, result.stderr
+    assert result.stdout_json.raw_metrics == {"rows": 2, "total": 12.5}
+    assert worker.process.poll() is not None
+    assert not workdir.exists()
+
+
+def test_worker_start_failure_becomes_runtime_error(tmp_path) -> None:
+    sandbox = AnalysisSandbox(python_executable=str(tmp_path / "missing-python"))
+
+    result = sandbox.execute(code=_SNIPPET, dataset_path=str(tmp_path / "sales.csv"))
+
+    assert not result.ok
+    assert result.error_type == "runtime"
+    assert result.message.startswith("failed to execute analysis code")
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from backend.app.modules.datasets import csv_engine
+from backend.app.modules.datasets.csv_engine import CsvReadOptions
+from backend.app.modules.datasets.models import Dataset
+from backend.app.modules.datasets.service import DatasetReader
+from backend.app.modules.preprocess.processor import PreprocessProcessor
+from backend.app.modules.preprocess.schemas import (
+    DerivedColumnOperation,
+    ImputeOperation,
+    OutlierOperation,
+)
+from backend.app.modules.preprocess.service import PreprocessService
+
+
+def test_pyarrow_engine_is_used_only_for_full_reads_and_falls_back_to_c(tmp_path) -> None:
+    source = tmp_path / "sensor.csv"
+    pd.DataFrame({"line": ["A", "B", None, "A"], "temp": [1.5, 2.0, None, 4.25], "qty": [1, 2, 3, 4]}).to_csv(
+        source, index=False
+    )
+    options = CsvReadOptions(engine="pyarrow")
+
+    assert options.pandas_options() == {"engine": "pyarrow"}
+    assert options.pandas_options(nrows=10) == {}
+    assert options.pandas_options(chunked=True) == {}
+
+    # pyarrow가 없거나 지원하지 않는 조합이면 C engine으로 다시 읽으므로 결과 값은 기본 reader와 같다.
+    expected = DatasetReader().read_csv(str(source))
+    reader = DatasetReader(csv_options=options)
+    pd.testing.assert_frame_equal(reader.read_csv(str(source)), expected, check_dtype=False)
+    chunks = list(reader.read_csv_chunks(str(source), chunksize=3))
+    assert [len(chunk) for chunk in chunks] == [3, 1]
+
+
+def test_csv_read_options_from_env_falls_back_without_pyarrow(monkeypatch) -> None:
+    monkeypatch.setenv(csv_engine.DATASET_CSV_ENGINE_ENV, "pyarrow")
+    monkeypatch.setenv(csv_engine.DATASET_DTYPE_BACKEND_ENV, "pyarrow")
+    monkeypatch.setattr(csv_engine, "_pyarrow_available", lambda: False)
+
+    assert CsvReadOptions.from_env() == CsvReadOptions(engine="c", dtype_backend="numpy")
+
+    monkeypatch.setenv(csv_engine.DATASET_DTYPE_BACKEND_ENV, "numpy_nullable")
+    monkeypatch.setattr(csv_engine, "_pyarrow_available", lambda: True)
+    assert CsvReadOptions.from_env() == CsvReadOptions(engine="pyarrow", dtype_backend="numpy_nullable")
+
+
+@pytest.mark.parametrize("streaming_threshold_bytes", [None, 0])
+def test_preprocess_gives_same_values_with_nullable_dtype_backend(
+    tmp_path, dataset_repository, streaming_threshold_bytes
+) -> None:
+    source = tmp_path / "sensor.csv"
+    source.write_text(
+        "line,qty,temp\nA,1,10.5\nB,,11.0\nA,3,\nC,1000,12.5\nA,5,10.0\nB,6,11.5\nA,4,\n",
+        encoding="utf-8",
+    )
+    operations = [
+        OutlierOperation(op="outlier", columns=["qty", "temp"], method="iqr", strategy="drop"),
+        ImputeOperation(op="impute", columns=["temp"], method="mean"),
+        OutlierOperation(op="outlier", columns=["qty"], method="zscore", strategy="clip", z_threshold=1.0),
+        DerivedColumnOperation(op="derived_column", name="load", expression="where(qty > 2, qty * temp, 0)"),
+    ]
+
+    dataset_repository.create(Dataset(source_id="raw", filename="sensor.csv", storage_path=str(source)))
+
+    def run(reader: DatasetReader) -> pd.DataFrame:
+        service = PreprocessService(
+            repository=dataset_repository,
+            reader=reader,
+            processor=PreprocessProcessor(),
+            profile_service=None,
+            streaming_threshold_bytes=streaming_threshold_bytes,
+            streaming_chunksize=3,
+        )
+        response = service.apply("raw", operations)
+        return pd.read_csv(Path(dataset_repository.get_by_source_id(response.output_source_id).storage_path))
+
+    expected = run(DatasetReader())
+    nullable = run(DatasetReader(csv_options=CsvReadOptions(dtype_backend="numpy_nullable")))
+
+    assert len(expected) == 6
+    pd.testing.assert_frame_equal(nullable, expected, check_dtype=False)
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import io
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+from backend.app.modules.datasets.compression import DatasetCompressionPolicy, open_compressed_writer
+from backend.app.modules.datasets.service import DatasetReader, DatasetService, DatasetStorage
+from backend.app.modules.preprocess.processor import PreprocessProcessor
+from backend.app.modules.preprocess.schemas import DropMissingOperation
+from backend.app.modules.preprocess.service import PreprocessService
+from backend.app.modules.profiling.service import DatasetProfileService
+
+
+class _NoRescanReader(DatasetReader):
+    def read_csv_chunks(self, *args, **kwargs):
+        raise AssertionError("profile must reuse ingest stats instead of rescanning the file")
+
+
+def _build_service(tmp_path, repository) -> DatasetService:
+    return DatasetService(
+        repository=repository,
+        storage=DatasetStorage(tmp_path),
+        reader=DatasetReader(),
+    )
+
+
+def test_upload_computes_checksum_and_profile_seed_in_one_pass(tmp_path, dataset_repository) -> None:
+    payload = "﻿region,sales,memo\nseoul,10,\nbusan,NA,\"line\nbreak\"\nseoul,-2.5\n".encode("utf-8")
+    service = _build_service(tmp_path / "datasets", dataset_repository)
+
+    dataset = service.upload_dataset(file_stream=io.BytesIO(payload), original_filename="sales.csv")
+
+    assert dataset.checksum == hashlib.sha256(payload).hexdigest()
+    assert dataset.filesize == len(payload)
+    assert open(dataset.storage_path, "rb").read() == payload
+    assert dataset.ingest_stats == {
+        "row_count": 3,
+        "columns": ["region", "sales", "memo"],
+        "null_counts": {"region": 0, "sales": 1, "memo": 2},
+        "numeric_ranges": {"sales": [-2.5, 10.0]},
+    }
+
+    profile = DatasetProfileService(repository=dataset_repository, reader=_NoRescanReader()).build_profile(
+        dataset.source_id
+    )
+    assert profile.row_count == 3
+    assert profile.missing_rates == {"region": 0.0, "sales": 0.333, "memo": 0.667}
+    sales = next(column for column in profile.column_profiles if column.name == "sales")
+    assert (sales.min_value, sales.max_value) == (-2.5, 10.0)
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        b"name,value\n\xff\xfe,1\n",
+        b"a,b\n1,2,3\n",
+        b"",
+    ],
+)
+def test_upload_rejects_invalid_csv_and_removes_file(tmp_path, dataset_repository, payload: bytes) -> None:
+    storage_dir = tmp_path / "datasets"
+    service = _build_service(storage_dir, dataset_repository)
+
+    with pytest.raises(ValueError):
+        service.upload_dataset(file_stream=io.BytesIO(payload), original_filename="broken.csv")
+
+    assert list(storage_dir.iterdir()) == []
+    assert dataset_repository.items == {}
+
+
+def test_repeat_upload_shares_blob_until_last_reference_is_deleted(tmp_path, dataset_repository) -> None:
+    payload = b"a,b\n1,2\n"
+    service = _build_service(tmp_path / "datasets", dataset_repository)
+
+    first = service.upload_dataset(file_stream=io.BytesIO(payload), original_filename="a.csv")
+    second = service.upload_dataset(file_stream=io.BytesIO(payload), original_filename="copy.csv")
+
+    assert first.source_id != second.source_id
+    assert first.storage_path == second.storage_path
+    assert first.storage_path.endswith(f"{first.checksum}.csv")
+
+    assert service.delete_dataset(first.source_id)
+    assert open(second.storage_path, "rb").read() == payload
+    assert service.delete_dataset(second.source_id)
+    assert not os.path.exists(second.storage_path)
+
+
+def test_delete_waits_for_concurrent_upload_that_reuses_the_blob(tmp_path, dataset_repository) -> None:
+    payload = b"a,b\n1,2\n"
+    service = _build_service(tmp_path / "datasets", dataset_repository)
+    first = service.upload_dataset(file_stream=io.BytesIO(payload), original_filename="a.csv")
+    create = dataset_repository.create
+    deleter = threading.Thread(target=service.delete_dataset, args=(first.source_id,))
+
+    # blob을 재사용하기로 정한 뒤 row를 만들기 직전에 원본 삭제가 끼어드는 순서를 만든다.
+    def create_during_delete(dataset):
+        deleter.start()
+        deleter.join(timeout=0.2)
+        return create(dataset)
+
+    dataset_repository.create = create_during_delete
+    second = service.upload_dataset(file_stream=io.BytesIO(payload), original_filename="copy.csv")
+    deleter.join(timeout=5)
+
+    assert first.source_id not in dataset_repository.items
+    assert open(second.storage_path, "rb").read() == payload
+
+
+def test_compressed_upload_is_read_back_transparently(tmp_path, dataset_repository) -> None:
+    payload = b"a,b\n" + b"".join(f"{index},{index % 3}\n".encode() for index in range(2000))
+    service = DatasetService(
+        repository=dataset_repository,
+        storage=DatasetStorage(
+            tmp_path / "datasets",
+            compression=DatasetCompressionPolicy(codec="gzip", scope="all"),
+        ),
+        reader=DatasetReader(),
+    )
+
+    dataset = service.upload_dataset(file_stream=io.BytesIO(payload), original_filename="big.csv")
+
+    assert dataset.storage_path.endswith(".csv.gz")
+    assert dataset.checksum == hashlib.sha256(payload).hexdigest()
+    assert os.path.getsize(dataset.storage_path) < len(payload)
+    frame = DatasetReader().read_csv(dataset.storage_path)
+    assert frame.shape == (2000, 2)
+    chunk_rows = sum(len(chunk) for chunk in DatasetReader().read_csv_chunks(dataset.storage_path, chunksize=500))
+    assert chunk_rows == 2000
+
+
+def test_compression_level_zero_is_kept_instead_of_default() -> None:
+    payload = b"a,b\n" + b"".join(f"{index},{index % 3}\n".encode() for index in range(2000))
+    sizes = {}
+    for level in (0, None):
+        target = io.BytesIO()
+        with open_compressed_writer(target, "gzip", level) as writer:
+            writer.write(payload)
+        assert gzip.decompress(target.getvalue()) == payload
+        sizes[level] = len(target.getvalue())
+
+    # level 0은 저장만 하므로 기본 level보다 훨씬 크다.
+    assert sizes[0] > len(payload) > sizes[None]
+
+
+def test_preprocess_output_is_written_outside_the_blob_store(tmp_path, dataset_repository) -> None:
+    storage_dir = tmp_path / "datasets"
+    service = _build_service(storage_dir, dataset_repository)
+    dataset = service.upload_dataset(file_stream=io.BytesIO(b"a,b\n1,\n2,3\n"), original_filename="sales.csv")
+    preprocess = PreprocessService(
+        repository=dataset_repository,
+        reader=DatasetReader(),
+        processor=PreprocessProcessor(),
+        profile_service=None,
+        output_dir=storage_dir / "derived",
+    )
+
+    response = preprocess.apply(dataset.source_id, [DropMissingOperation(op="drop_missing", columns=["b"])])
+
+    output_path = Path(dataset_repository.get_by_source_id(response.output_source_id).storage_path)
+    assert output_path.parent == storage_dir / "derived"
+    assert response.output_filename.startswith("sales_preprocessed_")
+    assert [path.name for path in (storage_dir / "blobs").rglob("*") if path.is_file()] == [
+        f"{dataset.checksum}.csv"
+    ]
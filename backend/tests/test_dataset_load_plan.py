@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from backend.app.modules.datasets.dtypes import csv_dtype_name
+from backend.app.modules.datasets.models import Dataset
+from backend.app.modules.datasets.service import DatasetReader
+from backend.app.modules.eda.service import EDAService
+from backend.app.modules.preprocess.processor import PreprocessProcessor
+from backend.app.modules.preprocess.schemas import ImputeOperation, ScaleOperation
+from backend.app.modules.preprocess.service import PreprocessService
+from backend.app.modules.profiling.service import DatasetProfileService
+
+
+def _write_sensor_export(tmp_path, repository) -> Path:
+    rng = np.random.default_rng(3)
+    size = 20_000
+    df = pd.DataFrame(
+        {
+            "measured_at": pd.date_range("2024-01-01", periods=size, freq="min").strftime("%Y-%m-%d %H:%M:%S"),
+            "line_group": rng.choice(["LINE-A", "LINE-B", "LINE-C"], size),
+            "status": rng.choice(["OK", "NG", None], size),
+            "pass_flag": rng.choice(["Y", "N"], size),
+            "rpm": rng.integers(0, 3_000, size),
+            "cycle": rng.integers(0, 100, size),
+            "temp": rng.normal(60, 5, size).round(2),
+        }
+    )
+    source = tmp_path / "sensor.csv"
+    df.to_csv(source, index=False)
+    repository.create(Dataset(source_id="raw", filename="sensor.csv", storage_path=str(source)))
+    return source
+
+
+def test_load_plan_from_profile_shrinks_memory_without_changing_values(tmp_path, dataset_repository) -> None:
+    source = _write_sensor_export(tmp_path, dataset_repository)
+    reader = DatasetReader()
+    load_plan = DatasetProfileService(repository=dataset_repository, reader=reader).build_load_plan("raw")
+
+    default = reader.read_csv(str(source))
+    compact = reader.read_csv(str(source), load_plan=load_plan)
+
+    assert load_plan.category_columns == {"line_group", "status", "pass_flag"}
+    assert str(compact["rpm"].dtype) == "int16"
+    assert pd.api.types.is_datetime64_any_dtype(compact["measured_at"])
+    assert default.memory_usage(deep=True).sum() > 3 * compact.memory_usage(deep=True).sum()
+    for column in ["line_group", "status", "pass_flag", "rpm", "cycle", "temp"]:
+        pd.testing.assert_series_equal(compact[column].astype(default[column].dtype), default[column])
+    pd.testing.assert_series_equal(compact["measured_at"], pd.to_datetime(default["measured_at"]))
+
+
+def test_preprocess_output_is_identical_with_compact_loads(tmp_path, dataset_repository) -> None:
+    _write_sensor_export(tmp_path, dataset_repository)
+    reader = DatasetReader()
+    operations = [
+        ImputeOperation(op="impute", columns=["status"], method="value", value="UNKNOWN"),
+        ScaleOperation(op="scale", columns=["cycle"], method="standardize"),
+    ]
+
+    def run(profile_service, *, streaming_threshold_bytes):
+        service = PreprocessService(
+            repository=dataset_repository,
+            reader=reader,
+            processor=PreprocessProcessor(),
+            profile_service=profile_service,
+            streaming_threshold_bytes=streaming_threshold_bytes,
+            streaming_chunksize=3_000,
+        )
+        response = service.apply("raw", operations)
+        output = dataset_repository.get_by_source_id(response.output_source_id)
+        return Path(output.storage_path).read_bytes(), response.summary_diff
+
+    profile_service = DatasetProfileService(repository=dataset_repository, reader=reader)
+    # 0이면 chunk 경로, None이면 in-memory 경로다.
+    for threshold in [None, 0]:
+        baseline_bytes, baseline_diff = run(None, streaming_threshold_bytes=threshold)
+        output_bytes, diff = run(profile_service, streaming_threshold_bytes=threshold)
+        assert output_bytes == baseline_bytes
+        assert diff == baseline_diff
+
+
+def test_eda_distribution_uses_full_range_of_downcast_integer_columns(tmp_path, dataset_repository) -> None:
+    source = tmp_path / "offset.csv"
+    source.write_text("offset\n" + "".join(f"{value}\n" for value in list(range(-100, 101)) * 3), encoding="utf-8")
+    dataset_repository.create(Dataset(source_id="raw", filename="offset.csv", storage_path=str(source)))
+    reader = DatasetReader()
+    profile_service = DatasetProfileService(repository=dataset_repository, reader=reader)
+    eda = EDAService(profile_service=profile_service, dataset_repository=dataset_repository, reader=reader)
+
+    # int8로 읽히면 max - min(200)이 넘쳐 pd.cut 경계가 틀어진다.
+    assert str(reader.read_csv(str(source), load_plan=profile_service.build_load_plan("raw"))["offset"].dtype) == "int8"
+    response = eda.get_distribution("raw", column="offset", bins=4)
+
+    assert response.total_count == 603
+    assert response.bins[0].lower < -100
+    assert response.bins[-1].upper == 100
+
+
+def test_csv_dtype_name_matches_default_read_of_written_csv(tmp_path) -> None:
+    frame = pd.DataFrame(
+        {
+            "flag": np.array([0, 1, 1], dtype=np.uint8),
+            "count": np.array([1, 2, 3], dtype=np.int16),
+            "sparse_flag": pd.arrays.SparseArray([0, 0, 1], dtype=pd.SparseDtype(np.uint8, 0)),
+            "sparse_value": pd.arrays.SparseArray([np.nan, 1.5, np.nan]),
+        }
+    )
+    path = tmp_path / "written.csv"
+    frame.to_csv(path, index=False)
+
+    reloaded = pd.read_csv(path)
+
+    assert {column: csv_dtype_name(dtype) for column, dtype in frame.dtypes.items()} == {
+        column: str(dtype) for column, dtype in reloaded.dtypes.items()
+    }
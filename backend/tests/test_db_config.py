@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from sqlalchemy import Column, Integer, MetaData, String, Table, inspect, text
+
+from backend.app.core.db import build_engine
+from backend.app.core.migrations import Migration, add_column_if_missing, run_migrations
+
+
+def test_sqlite_engine_applies_wal_pragmas(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("SQLITE_BUSY_TIMEOUT_MS", "1234")
+    engine = build_engine(f"sqlite:///{tmp_path / 'app.db'}")
+
+    with engine.connect() as connection:
+        assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert connection.execute(text("PRAGMA busy_timeout")).scalar() == 1234
+        # NORMAL = 1
+        assert connection.execute(text("PRAGMA synchronous")).scalar() == 1
+
+
+def test_migrations_run_once_in_version_order(tmp_path) -> None:
+    engine = build_engine(f"sqlite:///{tmp_path / 'app.db'}")
+    metadata = MetaData()
+    Table("items", metadata, Column("id", Integer, primary_key=True))
+
+    def add_name(connection, _metadata) -> None:
+        add_column_if_missing(connection, "items", "name VARCHAR(64)")
+
+    migrations = [
+        Migration("0002", "add items.name", add_name),
+        Migration("0001", "initial schema", lambda connection, md: md.create_all(bind=connection)),
+    ]
+
+    assert run_migrations(engine, metadata, migrations=migrations) == ["0001", "0002"]
+    assert run_migrations(engine, metadata, migrations=migrations) == []
+    columns = {column["name"] for column in inspect(engine).get_columns("items")}
+    assert columns == {"id", "name"}
+
+    # 최신 model로 만든 fresh DB에서도 column 추가 migration이 실패하지 않는다.
+    fresh_engine = build_engine(f"sqlite:///{tmp_path / 'fresh.db'}")
+    Table("items", metadata, Column("name", String(64)), extend_existing=True)
+    assert run_migrations(fresh_engine, metadata, migrations=migrations) == ["0001", "0002"]
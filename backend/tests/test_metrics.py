@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+from backend.app.core.metrics import MetricsRegistry
+from backend.app.main import app
+
+
+def test_histogram_renders_cumulative_buckets() -> None:
+    registry = MetricsRegistry()
+    histogram = registry.histogram("stage_seconds", "stage time", ("stage",), buckets=(0.1, 1.0))
+    counter = registry.counter("stage_errors_total", "stage errors", ("stage",))
+
+    histogram.observe(0.05, stage="planner")
+    histogram.observe(0.5, stage="planner")
+    histogram.observe(3.0, stage="planner")
+    counter.inc(stage="planner")
+
+    lines = registry.render().splitlines()
+    assert 'stage_seconds_bucket{stage="planner",le="0.1"} 1' in lines
+    assert 'stage_seconds_bucket{stage="planner",le="1"} 2' in lines
+    assert 'stage_seconds_bucket{stage="planner",le="+Inf"} 3' in lines
+    assert 'stage_seconds_count{stage="planner"} 3' in lines
+    assert 'stage_errors_total{stage="planner"} 1' in lines
+
+
+def test_metrics_endpoint_exposes_registry() -> None:
+    response = TestClient(app).get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "# TYPE agent_workflow_node_duration_seconds histogram" in response.text
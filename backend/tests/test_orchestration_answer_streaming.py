@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import json
+import threading
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from backend.app.core.metrics import WORKFLOW_NODE_SECONDS
+from backend.app.core.profiling import SamplingProfiler, profile_async_iterator, run_in_profiled_thread
+from backend.app.core.trace_logging import (
+    TraceLayerPolicy,
+    configure_trace_layer,
+    flush_trace_logs,
+    trace_context,
+)
+from backend.app.orchestration import ai
+from backend.app.orchestration.builder import build_main_workflow
+from backend.app.orchestration.client import AgentClient
+
+
+@pytest.fixture
+def llm_tokens(monkeypatch) -> list[str]:
+    """LLMGateway.stream_text가 흘려보낼 token 목록. 테스트에서 바꿔 쓸 수 있다."""
+    tokens = ["답변"]
+
+    class FakeGateway:
+        def __init__(self, *, default_model: str) -> None:
+            self.default_model = default_model
+
+        async def stream_text(self, *, model_id: str | None, messages: list[object]):
+            for token in tokens:
+                yield token
+
+    monkeypatch.setattr(ai, "LLMGateway", FakeGateway)
+    return tokens
+
+
+def _build_client() -> AgentClient:
+    workflow = build_main_workflow(
+        planner_service=SimpleNamespace(),
+        analysis_service=SimpleNamespace(),
+        preprocess_service=SimpleNamespace(),
+        eda_service=SimpleNamespace(),
+        rag_service=SimpleNamespace(),
+        guideline_service=SimpleNamespace(),
+        guideline_rag_service=SimpleNamespace(),
+        visualization_service=SimpleNamespace(),
+        report_service=SimpleNamespace(),
+        default_model="default-model",
+    )
+
+    @asynccontextmanager
+    async def runtime_factory():
+        yield workflow
+
+    return AgentClient(workflow_runtime_factory=runtime_factory)
+
+
+async def _collect(client: AgentClient) -> list[dict]:
+    return [
+        event
+        async for event in client.astream_with_trace(
+            session_id="1",
+            run_id="run-1",
+            question="안녕?",
+        )
+    ]
+
+
+def test_general_question_tokens_are_relayed_as_live_chunks(llm_tokens) -> None:
+    llm_tokens[:] = ["안녕", "하세요", "!"]
+
+    events = asyncio.run(_collect(_build_client()))
+
+    chunks = [event["delta"] for event in events if event["type"] == "chunk"]
+    assert chunks == ["안녕", "하세요", "!"]
+    done = events[-1]
+    assert done["type"] == "done"
+    assert done["answer"] == "안녕하세요!"
+    assert done["output_type"] == "general_question"
+
+
+def test_workflow_node_durations_are_recorded(llm_tokens) -> None:
+    before = WORKFLOW_NODE_SECONDS.count(node="general_question_terminal")
+
+    asyncio.run(_collect(_build_client()))
+
+    assert WORKFLOW_NODE_SECONDS.count(node="general_question_terminal") == before + 1
+
+
+def test_profiled_run_saves_profile_next_to_trace_summary(tmp_path, llm_tokens) -> None:
+    async def collect_profiled() -> list[dict]:
+        with trace_context(trace_id="trace-profile", session_id=1, run_id="run-1"):
+            return [
+                event
+                async for event in _build_client().astream_with_trace(
+                    session_id="1",
+                    run_id="run-1",
+                    question="안녕?",
+                    profile=True,
+                )
+            ]
+
+    events = asyncio.run(collect_profiled())
+    assert flush_trace_logs()
+
+    assert events[-1]["answer"] == "답변"
+    summary = json.loads((tmp_path / "traces" / "trace-profile.json").read_text(encoding="utf-8"))
+    [profile] = summary["profiles"]
+    assert profile["format"] == "collapsed"
+    assert Path(profile["path"]).parent == tmp_path / "traces"
+    assert Path(profile["path"]).exists()
+
+
+def test_profiler_samples_only_threads_of_the_traced_request(monkeypatch) -> None:
+    profilers: list[SamplingProfiler] = []
+    original_start = SamplingProfiler.start
+
+    def record_start(self) -> None:
+        profilers.append(self)
+        original_start(self)
+
+    monkeypatch.setattr(SamplingProfiler, "start", record_start)
+    stop = threading.Event()
+
+    def spin() -> None:
+        while not stop.is_set():
+            time.sleep(0.001)
+
+    # 다른 요청을 흉내 내는 thread는 profiler에 등록되지 않는다.
+    other_request = threading.Thread(target=spin, name="other-request", daemon=True)
+    other_request.start()
+
+    async def events():
+        worker = threading.Thread(
+            target=contextvars.copy_context().run,
+            args=(run_in_profiled_thread, spin),
+            name="request-worker",
+        )
+        worker.start()
+        await asyncio.sleep(0.05)
+        stop.set()
+        worker.join()
+        yield "done"
+
+    async def collect() -> list[str]:
+        with trace_context(trace_id="trace-threads", session_id=1, run_id="run-1"):
+            return [event async for event in profile_async_iterator(events(), interval_seconds=0.002)]
+
+    try:
+        assert asyncio.run(collect()) == ["done"]
+    finally:
+        stop.set()
+        other_request.join()
+
+    [profiler] = profilers
+    sampled_threads = {stack.split(";", 1)[0] for stack in profiler.samples}
+    assert "thread:request-worker" in sampled_threads
+    assert "thread:other-request" not in sampled_threads
+
+
+def test_runtime_without_astream_runs_async_nodes_through_ainvoke(llm_tokens) -> None:
+    class InvokeOnlyRuntime:
+        def __init__(self, workflow) -> None:
+            self.ainvoke = workflow.ainvoke
+            self.invoke = workflow.invoke
+
+    workflow = _build_client()._workflow_runtime_factory
+
+    @asynccontextmanager
+    async def runtime_factory():
+        async with workflow() as compiled:
+            yield InvokeOnlyRuntime(compiled)
+
+    events = asyncio.run(_collect(AgentClient(workflow_runtime_factory=runtime_factory)))
+
+    assert events[-1]["type"] == "done"
+    assert events[-1]["answer"] == "답변"
+    assert "".join(event["delta"] for event in events if event["type"] == "chunk") == "답변"
+
+
+def test_workflow_trace_off_skips_snapshot_summaries(llm_tokens, monkeypatch) -> None:
+    summarized = []
+    monkeypatch.setattr(AgentClient, "_summarize_snapshot", staticmethod(lambda snapshot: summarized.append(1) or {}))
+    configure_trace_layer("workflow", TraceLayerPolicy(verbosity="off"))
+    try:
+        events = asyncio.run(_collect(_build_client()))
+    finally:
+        configure_trace_layer("workflow", None)
+
+    assert events[-1]["answer"] == "답변"
+    assert summarized == []
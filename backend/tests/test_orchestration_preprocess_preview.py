@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import END, START, StateGraph
+from langgraph.types import Command
+
+from backend.app.modules.preprocess.planner import PreprocessPlan
+from backend.app.modules.preprocess.schemas import DropMissingOperation
+from backend.app.orchestration.state import PreprocessGraphState
+from backend.app.orchestration.workflows import preprocess as preprocess_workflow
+
+
+class _Preview:
+    def model_dump(self, mode: str = "python"):
+        return {"summary_diff": {"row_count_delta": -1}}
+
+
+class _PreviewCountingService:
+    def __init__(self) -> None:
+        self.previews = 0
+
+    def build_dataset_profile(self, source_id: str):
+        return {"source_id": source_id, "preprocess_recommendations": []}
+
+    def preview(self, source_id, operations):
+        self.previews += 1
+        return _Preview()
+
+
+def test_preview_runs_once_even_though_approval_gate_reruns_on_resume(monkeypatch) -> None:
+    monkeypatch.setattr(
+        preprocess_workflow,
+        "build_preprocess_plan",
+        lambda **_: PreprocessPlan(
+            operations=[DropMissingOperation(op="drop_missing", columns=["sales"], how="any")]
+        ),
+    )
+    service = _PreviewCountingService()
+    subgraph = preprocess_workflow.build_preprocess_workflow(preprocess_service=service, eda_service=None)
+    # interrupt/resume에는 checkpointer가 필요하므로 상위 graph처럼 감싼다.
+    parent = StateGraph(PreprocessGraphState)
+    parent.add_node("preprocess", subgraph)
+    parent.add_edge(START, "preprocess")
+    parent.add_edge("preprocess", END)
+    graph = parent.compile(checkpointer=MemorySaver())
+    config = {"configurable": {"thread_id": "preview"}}
+
+    interrupted = graph.invoke(
+        {"source_id": "raw", "planning_result": {"route": "analysis", "preprocess_required": True}},
+        config,
+    )
+    payload = interrupted["__interrupt__"][0].value
+    final = graph.invoke(Command(resume={"decision": "cancel"}), config)
+
+    assert service.previews == 1
+    assert payload["plan"]["preview"] == {"summary_diff": {"row_count_delta": -1}}
+    assert final["preprocess_result"]["status"] == "cancelled"
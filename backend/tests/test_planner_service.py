@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from backend.app.modules.analysis.processor import AnalysisProcessor
+from backend.app.modules.planner.schemas import CombinedPlannerOutput, PlannerDecision
+from backend.app.modules.planner.service import PlannerService
+from backend.app.modules.profiling.schemas import DatasetContext
+
+
+class FakeLLM:
+    def __init__(self, responses: dict[str, object]) -> None:
+        self.responses = responses
+        self.calls: list[str] = []
+
+    def invoke_structured(self, *, schema, messages, model_id=None):
+        self.calls.append(schema.__name__)
+        response = self.responses[schema.__name__]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def _build_service(llm: FakeLLM) -> PlannerService:
+    service = PlannerService(
+        dataset_context_service=SimpleNamespace(),
+        analysis_processor=AnalysisProcessor(),
+    )
+    service.llm = llm
+    return service
+
+
+def _dataset_context() -> DatasetContext:
+    return DatasetContext(
+        source_id="src-1",
+        available=True,
+        columns=["line", "defect_rate"],
+        numeric_columns=["defect_rate"],
+        categorical_columns=["line"],
+    )
+
+
+def test_combined_planning_uses_single_structured_call() -> None:
+    llm = FakeLLM(
+        {
+            "CombinedPlannerOutput": CombinedPlannerOutput(
+                decision=PlannerDecision(guideline_context_used=True),
+            ),
+        }
+    )
+
+    result = _build_service(llm).plan(
+        user_input="이 데이터셋은 어떤 내용이야?",
+        request_context=None,
+        source_id="src-1",
+        dataset_context=_dataset_context(),
+    )
+
+    assert llm.calls == ["CombinedPlannerOutput"]
+    assert result.route == "fallback_rag"
+    assert result.guideline_context_used is False
+
+
+def test_combined_planning_falls_back_to_multi_call_when_output_is_incomplete() -> None:
+    llm = FakeLLM(
+        {
+            "CombinedPlannerOutput": CombinedPlannerOutput(
+                decision=PlannerDecision(ask_analysis=True),
+            ),
+            "PlannerDecision": PlannerDecision(need_report=True),
+            "QuestionUnderstanding": ValueError("invalid structured output"),
+        }
+    )
+    service = _build_service(llm)
+
+    with pytest.raises(ValueError, match="invalid structured output"):
+        service.plan(
+            user_input="라인별 불량률 리포트",
+            request_context=None,
+            source_id="src-1",
+            dataset_context=_dataset_context(),
+        )
+
+    assert llm.calls == ["CombinedPlannerOutput", "PlannerDecision", "QuestionUnderstanding"]
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from backend.app.modules.preprocess.fitting import fit_operation, transform_operation
+from backend.app.modules.preprocess.processor import PreprocessProcessor
+from backend.app.modules.preprocess.schemas import EncodeCategoricalOperation
+
+
+def test_label_encoding_uses_stable_codes_and_marks_unseen_values() -> None:
+    operation = EncodeCategoricalOperation(op="encode_categorical", columns=["line"], method="label")
+    params = fit_operation(pd.DataFrame({"line": ["B", "A", None, 10]}), operation)
+
+    out = transform_operation(pd.DataFrame({"line": ["A", "B", "C", None, 10]}), operation, params)
+
+    assert params["categories"]["line"] == [10, "A", "B"]
+    assert out["line"].tolist()[:2] == [1.0, 2.0]
+    assert out["line"].isna().tolist() == [False, False, True, True, False]
+
+
+def test_one_hot_switches_high_cardinality_columns_to_sparse_or_hashed() -> None:
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "lot": [f"L{value}" for value in rng.integers(0, 300, 2_000)],
+            "line": rng.choice(["A", "B", None], 2_000),
+        }
+    )
+
+    def encode(**options):
+        operation = EncodeCategoricalOperation(
+            op="encode_categorical",
+            columns=["lot", "line"],
+            method="one_hot",
+            **{"max_categories": 100, **options},
+        )
+        return PreprocessProcessor().apply_operations(df, [operation])
+
+    sparse = encode()
+    assert str(sparse["line_A"].dtype) == "uint8"
+    assert isinstance(sparse["lot_L0"].dtype, pd.SparseDtype)
+    assert sparse.filter(like="line_").sum(axis=1).tolist() == df["line"].notna().astype(int).tolist()
+
+    dense = encode(dtype="int64", max_categories=1_000)
+    assert sparse.memory_usage().sum() * 8 < dense.memory_usage().sum()
+    pd.testing.assert_frame_equal(sparse.astype("int64"), dense)
+
+    hashed = encode(high_cardinality="hash", hash_buckets=16)
+    assert [column for column in hashed.columns if column.startswith("lot")] == [f"lot_hash_{index}" for index in range(16)]
+    assert (hashed.filter(like="lot_hash_").sum(axis=1) == 1).all()
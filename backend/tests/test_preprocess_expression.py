@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.app.core.expressions import ExpressionError, compile_expression
+from backend.app.modules.analysis.processor import AnalysisProcessor
+from backend.app.modules.preprocess.fitting import operation_footprint
+from backend.app.modules.preprocess.processor import PreprocessProcessor
+from backend.app.modules.preprocess.schemas import DerivedColumnOperation
+
+
+def test_derived_column_expression_is_vectorized_and_reads_only_referenced_columns() -> None:
+    df = pd.DataFrame({"sales": [10.0, None, 30.0], "unit cost": [2.0, 5.0, 0.0], "line": ["A", "B", "A"]})
+    operation = DerivedColumnOperation(
+        op="derived_column",
+        name="margin",
+        expression="where(line == 'A' and sales > 0, log1p(sales) - `unit cost`, 0)",
+    )
+
+    out = PreprocessProcessor().apply_operations(df, [operation])
+
+    expected = np.where((df["line"] == "A") & (df["sales"] > 0), np.log1p(df["sales"]) - df["unit cost"], 0)
+    np.testing.assert_allclose(out["margin"].to_numpy(dtype="float64"), expected)
+    assert operation_footprint(operation).reads == frozenset({"line", "sales", "unit cost"})
+
+
+@pytest.mark.parametrize(
+    ("expression", "message"),
+    [
+        ("sales.__class__", "Unsupported expression syntax: Attribute"),
+        ("__import__('os')", "Unknown function: __import__"),
+        ("sales * qty", "Column not found: qty"),
+        ("sales +", "Invalid expression syntax"),
+        ('"x" * 10**10', "String constants are not allowed in arithmetic"),
+    ],
+)
+def test_expression_rejects_syntax_outside_the_whitelist(expression: str, message: str) -> None:
+    operation = DerivedColumnOperation(op="derived_column", name="out", expression=expression)
+
+    with pytest.raises(ExpressionError, match=message):
+        PreprocessProcessor().apply_operations(pd.DataFrame({"sales": [1, 2]}), [operation])
+
+
+def test_constant_arithmetic_runs_in_float64_instead_of_unbounded_python_ints() -> None:
+    # Python int로 계산하면 끝나지 않는 수식이다. 큰 정수 지수는 float64로 계산해 바로 inf가 된다.
+    out = compile_expression("9**9**9 + sales").evaluate(pd.DataFrame({"sales": [1, 2]}))
+
+    assert np.isinf(out).all()
+    with pytest.raises(ExpressionError, match="too large"):
+        compile_expression("1" + "0" * 400)
+
+
+def test_integer_expressions_keep_int64_like_pandas_eval() -> None:
+    df = pd.DataFrame({"b": [1, 2, 3], "my col": [4, 5, 6]})
+
+    for expression, expected in [("b - 1", [0, 1, 2]), ("2 ** b", [2, 4, 8]), ("`my col` * 2", [8, 10, 12])]:
+        out = compile_expression(expression).evaluate(df)
+        assert out.dtype == "int64"
+        assert out.tolist() == expected
+    # 음수 지수는 정수로 표현할 수 없어 float64가 된다.
+    assert compile_expression("b ** -1").evaluate(df).tolist() == [1.0, 0.5, 1 / 3]
+
+
+def test_analysis_plan_reuses_expression_engine_for_arithmetic_columns() -> None:
+    plan = AnalysisProcessor().validate_and_finalize_plan(
+        {
+            "analysis_type": "aggregation",
+            "objective": "line margin",
+            "metrics": [{"name": "rows", "aggregation": "count", "alias": "rows"}],
+            "derived_columns": [
+                {
+                    "name": "margin",
+                    "expression_type": "arithmetic",
+                    "params": {"expression": "Sales - `Unit Cost` * 2"},
+                }
+            ],
+            "ambiguity_status": "clear",
+        },
+        {"columns": ["sales", "unit cost"]},
+    )
+
+    derived = plan.derived_columns[0]
+    assert derived.params["expression"] == "sales - `unit cost` * 2"
+    assert derived.source_columns == ["sales", "unit cost"]
+    assert compile_expression(derived.params["expression"]).columns == ("sales", "unit cost")
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from backend.app.modules.datasets.lineage import MaterializedFrameCache
+from backend.app.modules.datasets.models import Dataset
+from backend.app.modules.datasets.service import DatasetReader, DatasetService, DatasetStorage
+from backend.app.modules.preprocess.processor import PreprocessProcessor
+from backend.app.modules.preprocess.schemas import (
+    DropMissingOperation,
+    ImputeOperation,
+    ScaleOperation,
+)
+from backend.app.modules.preprocess.service import PreprocessService
+
+
+class _CountingProcessor(PreprocessProcessor):
+    def __init__(self) -> None:
+        self.replays = 0
+
+    def replay_operations(self, df, operations):
+        self.replays += 1
+        return super().replay_operations(df, operations)
+
+
+def test_lazy_apply_records_lineage_and_materializes_on_first_read(tmp_path, dataset_repository) -> None:
+    source = tmp_path / "sales.csv"
+    source.write_text("region,sales,qty\nseoul,1,\nbusan,,4\n,3,5\nseoul,8,6\n", encoding="utf-8")
+    dataset_repository.create(Dataset(source_id="raw", filename="sales.csv", storage_path=str(source)))
+    processor = _CountingProcessor()
+    reader = DatasetReader(
+        lineage_transform=processor.replay_operations,
+        materialized_cache=MaterializedFrameCache(tmp_path / ".materialized"),
+    )
+    service = PreprocessService(
+        repository=dataset_repository,
+        reader=reader,
+        processor=PreprocessProcessor(),
+        profile_service=None,
+    )
+    first_ops = [ImputeOperation(op="impute", columns=["sales"], method="median")]
+    second_ops = [
+        DropMissingOperation(op="drop_missing", columns=["region"], how="any"),
+        ScaleOperation(op="scale", columns=["sales"], method="normalize"),
+    ]
+
+    first = service.apply("raw", first_ops, lazy=True)
+    second = service.apply(first.output_source_id, second_ops, lazy=True)
+
+    lazy_path = dataset_repository.get_by_source_id(second.output_source_id).storage_path
+    assert first.summary_after is None
+    assert not Path(lazy_path).exists()
+    assert reader.exists(lazy_path)
+
+    expected = PreprocessProcessor().apply_operations(pd.read_csv(source), first_ops + second_ops)
+    expected = expected.reset_index(drop=True)
+    pd.testing.assert_frame_equal(reader.read_csv(lazy_path), expected)
+    assert reader.read_csv(lazy_path, nrows=1, usecols=["sales"])["sales"].tolist() == [0.0]
+    assert processor.replays == 2
+
+    # 두 번째 읽기는 materialized cache를 쓰고, 경로가 필요한 consumer에는 CSV를 써 준다.
+    reader.read_csv(lazy_path)
+    assert processor.replays == 2
+    pd.testing.assert_frame_equal(pd.read_csv(reader.ensure_file(lazy_path)), expected, check_dtype=False)
+
+
+def _lineage_setup(tmp_path, repository):
+    storage = DatasetStorage(tmp_path / "datasets")
+    source = storage.storage_dir / "sales.csv"
+    source.write_text("region,sales\nseoul,1\nbusan,\nseoul,8\n", encoding="utf-8")
+    repository.create(Dataset(source_id="raw", filename="sales.csv", storage_path=str(source)))
+    processor = PreprocessProcessor()
+    reader = DatasetReader(lineage_transform=processor.replay_operations)
+    service = PreprocessService(repository=repository, reader=reader, processor=processor, profile_service=None)
+    return storage, reader, service
+
+
+def test_lazy_apply_rejects_plans_that_would_fail_on_materialize(tmp_path, dataset_repository) -> None:
+    _, _, service = _lineage_setup(tmp_path, dataset_repository)
+    first = service.apply(
+        "raw", [ImputeOperation(op="impute", columns=["sales"], method="median")], lazy=True
+    )
+
+    with pytest.raises(ValueError):
+        service.apply(
+            first.output_source_id,
+            [ScaleOperation(op="scale", columns=["region"], method="standardize")],
+            lazy=True,
+        )
+    assert len(dataset_repository.items) == 2
+
+
+def test_deleting_lineage_parent_materializes_children_first(tmp_path, dataset_repository) -> None:
+    storage, reader, service = _lineage_setup(tmp_path, dataset_repository)
+    child = service.apply(
+        "raw", [DropMissingOperation(op="drop_missing", columns=["sales"], how="any")], lazy=True
+    )
+    child_path = dataset_repository.get_by_source_id(child.output_source_id).storage_path
+
+    DatasetService(repository=dataset_repository, storage=storage, reader=reader).delete_dataset("raw")
+
+    assert Path(child_path).is_file()
+    assert reader.read_csv(child_path)["sales"].tolist() == [1, 8]
+
+
+def test_materialized_cache_evicts_least_recently_used_entries(tmp_path) -> None:
+    frame = pd.DataFrame({"value": range(1000)})
+    probe = MaterializedFrameCache(tmp_path / "probe")
+    probe.put("probe", frame)
+    entry_size = next((tmp_path / "probe").iterdir()).stat().st_size
+    cache = MaterializedFrameCache(tmp_path / "cache", max_bytes=entry_size * 2)
+
+    cache.put("a", frame)
+    cache.put("b", frame)
+    assert cache.get("a") is not None
+    cache.put("c", frame)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+
+def test_failed_cache_write_does_not_fail_materialized_read(tmp_path, dataset_repository) -> None:
+    class _BrokenCache(MaterializedFrameCache):
+        def put(self, key, frame) -> None:
+            raise OSError("disk full")
+
+    _, reader, service = _lineage_setup(tmp_path, dataset_repository)
+    reader.materialized_cache = _BrokenCache(tmp_path / ".broken")
+    child = service.apply(
+        "raw", [DropMissingOperation(op="drop_missing", columns=["sales"], how="any")], lazy=True
+    )
+
+    child_path = dataset_repository.get_by_source_id(child.output_source_id).storage_path
+    assert reader.read_csv(child_path)["sales"].tolist() == [1, 8]
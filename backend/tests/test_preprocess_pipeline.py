@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from backend.app.modules.preprocess.fitting import fit_operation, transform_operation
+from backend.app.modules.preprocess.pipeline import compile_operations
+from backend.app.modules.preprocess.processor import PreprocessProcessor
+from backend.app.modules.preprocess.schemas import (
+    DerivedColumnOperation,
+    DropColumnsOperation,
+    DropMissingOperation,
+    ImputeOperation,
+    OutlierOperation,
+    ScaleOperation,
+)
+
+
+def _operations():
+    return [
+        ImputeOperation(op="impute", columns=["sales"], method="median"),
+        OutlierOperation(op="outlier", columns=["sales"], method="iqr", strategy="clip"),
+        ScaleOperation(op="scale", columns=["sales", "qty"], method="standardize"),
+        DerivedColumnOperation(op="derived_column", name="total", source_columns=["sales", "qty"], transform_type="sum"),
+        DropMissingOperation(op="drop_missing", columns=["region"], how="any"),
+        OutlierOperation(op="outlier", columns=["qty"], method="zscore", strategy="drop", z_threshold=1.0),
+        DropColumnsOperation(op="drop_columns", columns=["memo"]),
+    ]
+
+
+def test_compile_hoists_drop_columns_and_groups_stages() -> None:
+    pipeline = compile_operations(_operations())
+
+    assert [operation.op for operation in pipeline.operations][0] == "drop_columns"
+    assert [(stage.kind, len(stage.indices)) for stage in pipeline.stages] == [
+        ("drop_columns", 1),
+        ("columns", 3),
+        ("frame", 1),
+        ("rows", 2),
+    ]
+
+
+def test_fused_pipeline_matches_sequential_operations() -> None:
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "region": rng.choice(["seoul", "busan", None], 60),
+            "sales": rng.normal(100, 30, 60).astype(str),
+            "qty": rng.integers(0, 20, 60),
+            "memo": ["note"] * 60,
+        }
+    )
+    df.loc[::5, "sales"] = None
+
+    expected = df.copy()
+    for operation in _operations():
+        expected = transform_operation(expected, operation, fit_operation(expected, operation))
+    actual = PreprocessProcessor().apply_operations(df, _operations())
+
+    pd.testing.assert_frame_equal(actual, expected)
+    assert list(df.columns) == ["region", "sales", "qty", "memo"]
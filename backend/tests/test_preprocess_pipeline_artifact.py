@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.core.db import Base
+from backend.app.modules.datasets.models import Dataset
+from backend.app.modules.datasets.repository import DatasetRepository
+from backend.app.modules.datasets.service import DatasetReader
+from backend.app.modules.preprocess.processor import PreprocessProcessor
+from backend.app.modules.preprocess.repository import PreprocessPipelineRepository
+from backend.app.modules.preprocess.schemas import (
+    EncodeCategoricalOperation,
+    ImputeOperation,
+    ScaleOperation,
+)
+from backend.app.modules.preprocess.service import PreprocessService
+
+
+class _NoFitProcessor(PreprocessProcessor):
+    def fit_transform(self, *args, **kwargs):
+        raise AssertionError("saved pipeline must not refit")
+
+    def fit_operations_chunked(self, *args, **kwargs):
+        raise AssertionError("saved pipeline must not refit")
+
+
+def _build_service(db, processor) -> PreprocessService:
+    return PreprocessService(
+        repository=DatasetRepository(db),
+        reader=DatasetReader(),
+        processor=processor,
+        profile_service=None,
+        streaming_chunksize=2,
+        pipeline_repository=PreprocessPipelineRepository(db),
+    )
+
+
+def test_saved_pipeline_transforms_new_upload_without_refit(tmp_path) -> None:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    day1 = tmp_path / "day1.csv"
+    day1.write_text("line,temp\nA,10\nB,\nA,30\n", encoding="utf-8")
+    day2 = tmp_path / "day2.csv"
+    day2.write_text("line,temp\nB,50\n,\nA,20\n", encoding="utf-8")
+    datasets = DatasetRepository(db)
+    datasets.create(Dataset(source_id="day1", filename="day1.csv", storage_path=str(day1)))
+    datasets.create(Dataset(source_id="day2", filename="day2.csv", storage_path=str(day2)))
+    operations = [
+        ImputeOperation(op="impute", columns=["temp"], method="mean"),
+        ScaleOperation(op="scale", columns=["temp"], method="normalize"),
+        EncodeCategoricalOperation(op="encode_categorical", columns=["line"], method="label"),
+    ]
+
+    first = _build_service(db, PreprocessProcessor()).apply("day1", operations)
+    artifact = PreprocessPipelineRepository(db).get_by_output_source_id(first.output_source_id)
+    assert artifact.input_source_id == "day1"
+    assert artifact.input_columns == ["line", "temp"]
+    assert artifact.params[0] == {"fill": {"temp": 20.0}}
+
+    second = _build_service(db, _NoFitProcessor()).apply_saved_pipeline("day2", first.output_source_id)
+
+    output = pd.read_csv(datasets.get_by_source_id(second.output_source_id).storage_path)
+    # day1에서 fit한 평균(20), min/max(10, 30), category(A=0, B=1)를 그대로 쓴다.
+    assert output["temp"].tolist() == [2.0, 0.5, 0.5]
+    assert output["line"].tolist()[::2] == [1.0, 0.0]
+    assert pd.isna(output["line"].iloc[1])
+
+    with pytest.raises(FileNotFoundError):
+        _build_service(db, _NoFitProcessor()).apply_saved_pipeline("day2", "missing")
+
+
+def test_output_row_and_artifact_are_created_and_deleted_together(tmp_path) -> None:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    source = tmp_path / "raw.csv"
+    source.write_text("temp\n1\n\n3\n", encoding="utf-8")
+    datasets = DatasetRepository(db)
+    datasets.create(Dataset(source_id="raw", filename="raw.csv", storage_path=str(source)))
+    operations = [ImputeOperation(op="impute", columns=["temp"], method="mean")]
+
+    class _FailingPipelineRepository(PreprocessPipelineRepository):
+        def create_with_output(self, output_dataset, **kwargs):
+            kwargs["params"] = object()  # JSON으로 저장할 수 없어 commit이 실패한다.
+            return super().create_with_output(output_dataset, **kwargs)
+
+    service = _build_service(db, PreprocessProcessor())
+    service.pipeline_repository = _FailingPipelineRepository(db)
+    with pytest.raises(Exception):
+        service.apply("raw", operations)
+    assert datasets.count_all() == 1
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["raw.csv"]
+
+    response = _build_service(db, PreprocessProcessor()).apply("raw", operations)
+    pipelines = PreprocessPipelineRepository(db)
+    datasets.delete(datasets.get_by_source_id(response.output_source_id))
+    assert pipelines.get_by_output_source_id(response.output_source_id) is None
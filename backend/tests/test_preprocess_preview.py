@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from backend.app.modules.datasets.models import Dataset
+from backend.app.modules.datasets.service import DatasetReader
+from backend.app.modules.preprocess.processor import PreprocessProcessor
+from backend.app.modules.preprocess.schemas import (
+    DropMissingOperation,
+    ImputeOperation,
+    OutlierOperation,
+)
+from backend.app.modules.preprocess.service import PreprocessService
+
+
+def _build_service(tmp_path, repository) -> PreprocessService:
+    rng = np.random.default_rng(7)
+    size = 20_000
+    df = pd.DataFrame(
+        {
+            "line": rng.choice(["A", "B", "C"], size),
+            "temp": rng.normal(50, 10, size),
+            "pressure": rng.normal(3, 1, size),
+        }
+    )
+    df.loc[rng.random(size) < 0.003, "line"] = None
+    df.loc[rng.random(size) < 0.15, "pressure"] = np.nan
+    source = tmp_path / "sensor.csv"
+    df.to_csv(source, index=False)
+    repository.create(Dataset(source_id="raw", filename="sensor.csv", storage_path=str(source)))
+    return PreprocessService(
+        repository=repository,
+        reader=DatasetReader(),
+        processor=PreprocessProcessor(),
+        profile_service=None,
+        streaming_chunksize=4_000,
+    )
+
+
+def test_preview_is_exact_for_missing_driven_operations(tmp_path, dataset_repository) -> None:
+    service = _build_service(tmp_path, dataset_repository)
+    operations = [
+        DropMissingOperation(op="drop_missing", columns=["line"], how="any"),
+        ImputeOperation(op="impute", columns=["pressure"], method="median"),
+    ]
+
+    preview = service.preview("raw", operations, sample_size=500)
+    applied = service.apply("raw", operations)
+
+    assert preview.total_row_count == 20_000
+    assert preview.sample_row_count < 1_000
+    # 결측 패턴으로 층을 나눴으므로 결측에만 반응하는 operation은 오차 없이 추정된다.
+    assert preview.summary_diff.row_count_delta == applied.summary_diff.row_count_delta
+    assert preview.summary_diff.missing_by_column_delta == applied.summary_diff.missing_by_column_delta
+    assert preview.error_bounds.row_count_delta == 0.0
+
+
+def test_preview_reports_error_bounds_for_value_driven_filters(tmp_path, dataset_repository) -> None:
+    service = _build_service(tmp_path, dataset_repository)
+    operations = [
+        OutlierOperation(op="outlier", columns=["temp"], method="zscore", strategy="drop", z_threshold=1.0),
+    ]
+
+    preview = service.preview("raw", operations, sample_size=2_000, stratify_by="line")
+    applied = service.apply("raw", operations)
+
+    estimate = preview.summary_diff.row_count_delta
+    margin = preview.error_bounds.row_count_delta
+    assert 0 < margin < 2_000
+    assert abs(estimate - applied.summary_diff.row_count_delta) <= margin
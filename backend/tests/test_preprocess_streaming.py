@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from backend.app.modules.datasets.models import Dataset
+from backend.app.modules.datasets.service import DatasetReader
+from backend.app.modules.preprocess.dependencies import (
+    PREPROCESS_STREAMING_THRESHOLD_BYTES_ENV,
+    build_preprocess_service,
+)
+from backend.app.modules.preprocess.processor import PreprocessProcessor
+from backend.app.modules.preprocess.schemas import (
+    DerivedColumnOperation,
+    DropMissingOperation,
+    EncodeCategoricalOperation,
+    ImputeOperation,
+    OutlierOperation,
+    ScaleOperation,
+)
+from backend.app.modules.preprocess.service import DEFAULT_STREAMING_THRESHOLD_BYTES, PreprocessService
+
+
+def _build_service(repository, *, streaming_threshold_bytes) -> PreprocessService:
+    return PreprocessService(
+        repository=repository,
+        reader=DatasetReader(),
+        processor=PreprocessProcessor(),
+        profile_service=None,
+        streaming_threshold_bytes=streaming_threshold_bytes,
+        streaming_chunksize=3,
+    )
+
+
+def _operations():
+    return [
+        ImputeOperation(op="impute", columns=["sales"], method="median"),
+        ImputeOperation(op="impute", columns=["region"], method="mode"),
+        ScaleOperation(op="scale", columns=["qty"], method="standardize"),
+        OutlierOperation(op="outlier", columns=["sales"], method="iqr", strategy="clip"),
+        DerivedColumnOperation(op="derived_column", name="unit", source_columns=["sales", "qty"], transform_type="ratio"),
+        EncodeCategoricalOperation(op="encode_categorical", columns=["region"], method="one_hot"),
+        DropMissingOperation(op="drop_missing", columns=["unit"], how="any"),
+    ]
+
+
+def test_streaming_apply_matches_in_memory_apply(tmp_path, dataset_repository) -> None:
+    source = tmp_path / "sales.csv"
+    source.write_text(
+        "region,sales,qty\n"
+        "seoul,10,1\nbusan,,2\nseoul,12,3\ndaegu,400,4\n"
+        ",11,5\nbusan,9,6\nseoul,13,7\nbusan,,8\n",
+        encoding="utf-8",
+    )
+    dataset_repository.create(Dataset(source_id="raw", filename="sales.csv", storage_path=str(source), filesize=1))
+
+    in_memory = _build_service(dataset_repository, streaming_threshold_bytes=None).apply("raw", _operations())
+    streamed = _build_service(dataset_repository, streaming_threshold_bytes=0).apply("raw", _operations())
+
+    expected = pd.read_csv(dataset_repository.get_by_source_id(in_memory.output_source_id).storage_path)
+    actual = pd.read_csv(dataset_repository.get_by_source_id(streamed.output_source_id).storage_path)
+    pd.testing.assert_frame_equal(actual, expected)
+    assert streamed.summary_before == in_memory.summary_before
+    assert streamed.summary_after.row_count == in_memory.summary_after.row_count
+    assert streamed.summary_after.missing_by_column == in_memory.summary_after.missing_by_column
+    assert streamed.summary_after.numeric_distribution["sales"].p50 == pytest.approx(
+        in_memory.summary_after.numeric_distribution["sales"].p50
+    )
+
+
+def test_streaming_apply_removes_partial_output_on_error(tmp_path, dataset_repository) -> None:
+    source = tmp_path / "sales.csv"
+    source.write_text("sales\n1\n2\n3\n4\n", encoding="utf-8")
+    dataset_repository.create(Dataset(source_id="raw", filename="sales.csv", storage_path=str(source), filesize=1))
+    operations = [DerivedColumnOperation(op="derived_column", name="sales", expression="sales * 2")]
+
+    with pytest.raises(ValueError, match="already exists"):
+        _build_service(dataset_repository, streaming_threshold_bytes=0).apply("raw", operations)
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["sales.csv"]
+
+
+def test_streaming_label_then_one_hot_keeps_in_memory_column_names(tmp_path, dataset_repository) -> None:
+    source = tmp_path / "lines.csv"
+    # 결측이 두 번째 chunk에만 있어 첫 chunk의 label code도 float로 맞춰야 한다.
+    source.write_text("line,qty\nA,1\nB,2\nA,3\n,4\nB,5\nA,6\n", encoding="utf-8")
+    dataset_repository.create(Dataset(source_id="raw", filename="lines.csv", storage_path=str(source), filesize=1))
+    operations = [
+        EncodeCategoricalOperation(op="encode_categorical", columns=["line"], method="label"),
+        EncodeCategoricalOperation(op="encode_categorical", columns=["line"], method="one_hot"),
+    ]
+
+    in_memory = _build_service(dataset_repository, streaming_threshold_bytes=None).apply("raw", operations)
+    streamed = _build_service(dataset_repository, streaming_threshold_bytes=0).apply("raw", operations)
+
+    expected = pd.read_csv(dataset_repository.get_by_source_id(in_memory.output_source_id).storage_path)
+    actual = pd.read_csv(dataset_repository.get_by_source_id(streamed.output_source_id).storage_path)
+    assert list(expected.columns) == ["qty", "line_0.0", "line_1.0"]
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def _build_service_from_env(repository) -> PreprocessService:
+    return build_preprocess_service(
+        repository=repository,
+        reader=DatasetReader(),
+        processor=PreprocessProcessor(),
+        profile_service=None,
+    )
+
+
+def test_streaming_threshold_is_read_from_env(monkeypatch, dataset_repository) -> None:
+    monkeypatch.delenv(PREPROCESS_STREAMING_THRESHOLD_BYTES_ENV, raising=False)
+    assert _build_service_from_env(dataset_repository).streaming_threshold_bytes == DEFAULT_STREAMING_THRESHOLD_BYTES
+
+    monkeypatch.setenv(PREPROCESS_STREAMING_THRESHOLD_BYTES_ENV, "1048576")
+    assert _build_service_from_env(dataset_repository).streaming_threshold_bytes == 1048576
+
+    monkeypatch.setenv(PREPROCESS_STREAMING_THRESHOLD_BYTES_ENV, "256MB")
+    with pytest.raises(ValueError, match=PREPROCESS_STREAMING_THRESHOLD_BYTES_ENV):
+        _build_service_from_env(dataset_repository)
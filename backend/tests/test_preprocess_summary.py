@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from backend.app.modules.datasets.models import Dataset
+from backend.app.modules.datasets.service import DatasetReader
+from backend.app.modules.preprocess.processor import PreprocessProcessor
+from backend.app.modules.preprocess.schemas import (
+    DerivedColumnOperation,
+    EncodeCategoricalOperation,
+    ImputeOperation,
+    ScaleOperation,
+)
+from backend.app.modules.preprocess.service import (
+    PreprocessService,
+    _build_summary,
+    _build_summary_after,
+)
+
+
+def test_summary_after_recomputes_only_touched_columns() -> None:
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({f"c{index}": rng.normal(size=50) for index in range(20)})
+    df["line"] = rng.choice(["A", "B"], 50)
+    df.loc[::4, "c1"] = np.nan
+    operations = [
+        ImputeOperation(op="impute", columns=["c1"], method="median"),
+        ScaleOperation(op="scale", columns=["c2"], method="normalize"),
+        DerivedColumnOperation(op="derived_column", name="ratio", source_columns=["c3", "c4"], transform_type="ratio"),
+        EncodeCategoricalOperation(op="encode_categorical", columns=["line"], method="one_hot"),
+    ]
+    before = _build_summary(df)
+
+    processed, pipeline, _ = PreprocessProcessor().fit_transform(df, operations)
+
+    assert _build_summary_after(processed, before, pipeline) == _build_summary(processed)
+
+
+def test_apply_reuses_cached_summary_for_chained_preprocess(tmp_path, dataset_repository) -> None:
+    source = tmp_path / "sales.csv"
+    source.write_text("sales,qty\n1,\n2,3\n,4\n", encoding="utf-8")
+    dataset_repository.create(Dataset(source_id="raw", filename="sales.csv", storage_path=str(source)))
+    service = PreprocessService(
+        repository=dataset_repository,
+        reader=DatasetReader(),
+        processor=PreprocessProcessor(),
+        profile_service=None,
+    )
+
+    first = service.apply("raw", [ImputeOperation(op="impute", columns=["sales"], method="mean")])
+    assert dataset_repository.items["raw"].data_summary == first.summary_before.model_dump(mode="json")
+    assert dataset_repository.items[first.output_source_id].data_summary == first.summary_after.model_dump(mode="json")
+
+    second = service.apply(first.output_source_id, [ImputeOperation(op="impute", columns=["qty"], method="mean")])
+    assert second.summary_before == first.summary_after
+    assert dataset_repository.updates == 1
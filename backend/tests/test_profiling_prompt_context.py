@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from backend.app.modules.profiling.prompt_context import (
+    DatasetPromptContextBuilder,
+    estimate_tokens,
+)
+from backend.app.modules.profiling.schemas import DatasetContext
+
+
+def _wide_context(column_count: int) -> DatasetContext:
+    columns = [f"sensor_{index:03d}" for index in range(column_count)] + ["line", "defect_rate"]
+    return DatasetContext(
+        source_id="src-1",
+        filename="wide.csv",
+        available=True,
+        row_count_total=1000,
+        columns=columns,
+        dtypes={column: "float64" for column in columns},
+        type_columns={"numerical": columns},
+        numeric_columns=columns,
+        missing_rates={column: 0.0 for column in columns},
+        sample_rows=[{column: 1.0 for column in columns}],
+    )
+
+
+def test_prompt_context_keeps_relevant_columns_within_token_budget() -> None:
+    builder = DatasetPromptContextBuilder(token_budget=300)
+
+    payload = builder.build(
+        _wide_context(250),
+        question="라인별 defect rate 추이",
+        required_columns=["line"],
+    )
+
+    assert payload["columns"][-2:] == ["line", "defect_rate"]
+    assert payload["omitted_column_count"] > 0
+    assert "type_columns" not in payload
+    assert estimate_tokens(builder.to_prompt_json(_wide_context(250), question="defect")) <= 300
+
+
+def test_prompt_context_keeps_all_columns_when_budget_allows() -> None:
+    payload = DatasetPromptContextBuilder().build(_wide_context(3), question="")
+
+    assert payload["columns"] == ["sensor_000", "sensor_001", "sensor_002", "line", "defect_rate"]
+    assert "omitted_column_count" not in payload
+    assert len(payload["sample_rows"]) == 1
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import numpy as np
+
+from backend.app.modules.rag.infra.chunk_store import ChunkStore
+from backend.app.modules.rag.service import GuidelineRagService
+
+
+class _KeywordEmbedder:
+    model_name = "keyword"
+    embedding_dim = 3
+    _keywords = ("매출", "고객", "지역")
+
+    def __init__(self) -> None:
+        self.document_calls = 0
+
+    def _embed(self, text: str) -> np.ndarray:
+        vector = np.array([float(keyword in text) for keyword in self._keywords], dtype="float32")
+        return vector / max(float(np.linalg.norm(vector)), 1.0)
+
+    def embed_documents(self, texts: list[str]) -> np.ndarray:
+        self.document_calls += 1
+        return np.stack([self._embed(text) for text in texts])
+
+    def embed_query(self, query: str) -> np.ndarray:
+        return self._embed(query)[None, :]
+
+
+class _MetadataOnlyRepository:
+    def __init__(self) -> None:
+        self.sources: dict[str, SimpleNamespace] = {}
+
+    def replace_source_contents(self, *, source_id: str, checksum: str, embedding_model: str, chunks, **kwargs):
+        self.sources[source_id] = SimpleNamespace(
+            source_id=source_id,
+            checksum=checksum,
+            embedding_model=embedding_model,
+            chunk_rows=list(chunks),
+        )
+
+    def get_source(self, source_id: str):
+        return self.sources.get(source_id)
+
+    def find_source_by_checksum(self, checksum: str, *, embedding_model: str, exclude_source_id=None):
+        return next(
+            (
+                source
+                for source in self.sources.values()
+                if source.checksum == checksum
+                and source.embedding_model == embedding_model
+                and source.source_id != exclude_source_id
+            ),
+            None,
+        )
+
+    def list_sources(self, source_filter=None):
+        return [source for key, source in self.sources.items() if not source_filter or key in source_filter]
+
+    def get_chunks_by_faiss_ids(self, source_id: str, faiss_ids: list[int]):
+        raise AssertionError("retrieval must not read chunk text from the database")
+
+
+def test_chunk_store_reads_text_by_faiss_id(tmp_path) -> None:
+    ChunkStore.write(tmp_path, [(1, "두 번째 청크", 1), (0, "first", 0), (2, "", 2)])
+
+    store = ChunkStore.load(tmp_path)
+
+    assert len(store) == 3
+    assert store.get(0) == (0, "first")
+    assert store.get(1) == (1, "두 번째 청크")
+    assert store.get(2) == (2, "")
+    assert store.get(3) is None
+
+
+def test_query_hydrates_chunks_without_database(tmp_path) -> None:
+    repository = _MetadataOnlyRepository()
+    service = GuidelineRagService(repository=repository, storage_dir=tmp_path, embedder=_KeywordEmbedder())
+    service._replace_source_index(
+        source_id="guide-1",
+        checksum="abc",
+        chunks=["매출은 월별로 본다", "고객 세그먼트 정의", "지역 코드는 두 자리"],
+    )
+
+    [top] = service.query(query="고객 기준이 뭐야", top_k=1)
+
+    assert top.source_id == "guide-1"
+    assert top.chunk_id == 1
+    assert top.content == "고객 세그먼트 정의"
+
+
+def test_same_content_reuses_existing_index_without_embedding(tmp_path) -> None:
+    embedder = _KeywordEmbedder()
+    repository = _MetadataOnlyRepository()
+    service = GuidelineRagService(repository=repository, storage_dir=tmp_path / "vectors", embedder=embedder)
+    for name in ("first.txt", "second.txt"):
+        (tmp_path / name).write_text("고객 세그먼트 정의", encoding="utf-8")
+
+    service.index_guideline(SimpleNamespace(source_id="guide-1", storage_path=str(tmp_path / "first.txt")))
+    service.index_guideline(SimpleNamespace(source_id="guide-2", storage_path=str(tmp_path / "second.txt")))
+
+    assert embedder.document_calls == 1
+    assert repository.sources["guide-2"].chunk_rows == repository.sources["guide-1"].chunk_rows
+    [top] = service.query(query="고객", top_k=1, source_filter=["guide-2"])
+    assert (top.source_id, top.content) == ("guide-2", "고객 세그먼트 정의")
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.core.db import Base
+from backend.app.modules.rag.guideline_repository import GuidelineRagRepository
+from backend.app.modules.rag.models import GuidelineRagChunk, RagChunk
+from backend.app.modules.rag.repository import RagRepository
+
+
+def _build_session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)()
+
+
+def test_replace_source_contents_swaps_chunks_in_bulk() -> None:
+    db = _build_session()
+    for repository, chunk_model in (
+        (RagRepository(db), RagChunk),
+        (GuidelineRagRepository(db), GuidelineRagChunk),
+    ):
+        repository.replace_source_contents(
+            source_id="source-1",
+            checksum="old",
+            embedding_model="model",
+            embedding_dim=4,
+            chunks=[(0, "a", 0), (1, "b", 1), (2, "c", 2)],
+        )
+        source = repository.replace_source_contents(
+            source_id="source-1",
+            checksum="new",
+            embedding_model="model",
+            embedding_dim=4,
+            chunks=[(0, "x", 10), (1, "y", 11)],
+        )
+
+        assert source.checksum == "new"
+        assert source.chunk_count == 2
+        chunks = db.query(chunk_model).order_by(chunk_model.chunk_id).all()
+        assert [(chunk.chunk_id, chunk.content, chunk.faiss_id) for chunk in chunks] == [
+            (0, "x", 10),
+            (1, "y", 11),
+        ]
+        assert [chunk.content for chunk in repository.get_chunks_by_faiss_ids("source-1", [11])] == ["y"]
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import json
+
+from backend.app.core import trace_logging
+from backend.app.core.trace_logging import (
+    TraceLayerPolicy,
+    configure_trace_layer,
+    flush_trace_logs,
+    log_trace,
+    trace_context,
+)
+
+
+def test_trace_writer_batches_events_and_writes_summary_on_flush(tmp_path, monkeypatch) -> None:
+    # 다른 테스트가 남긴 이벤트가 임시 경로로 섞이지 않게 먼저 비운다.
+    flush_trace_logs()
+    log_path = tmp_path / "agent-trace.jsonl"
+    monkeypatch.setattr(trace_logging, "TRACE_LOG_PATH", log_path)
+    monkeypatch.setattr(trace_logging, "TRACE_SUMMARY_DIR", tmp_path / "traces")
+
+    with trace_context(trace_id="trace-1", session_id=1, run_id="run-1"):
+        log_trace(layer="chat", event="ingress", payload={"question": "매출 추이", "source_id": "src-1"})
+        log_trace(layer="chat", event="chunk", payload={"chunk_count": 1})
+        log_trace(layer="chat", event="done", payload={"answer": "증가", "output_type": "data_qa"})
+
+    assert flush_trace_logs()
+
+    lines = log_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["event"] for line in lines] == ["ingress", "chunk", "done"]
+    summary = json.loads((tmp_path / "traces" / "trace-1.json").read_text(encoding="utf-8"))
+    assert summary["question"] == "매출 추이"
+    assert summary["status"] == "success"
+    assert summary["final_output"] == {"answer": "증가", "output_type": "data_qa"}
+
+
+def test_trace_layer_policy_skips_rendering_dropped_records(tmp_path, monkeypatch) -> None:
+    flush_trace_logs()
+    log_path = tmp_path / "agent-trace.jsonl"
+    monkeypatch.setattr(trace_logging, "TRACE_LOG_PATH", log_path)
+    monkeypatch.setattr(trace_logging, "TRACE_SUMMARY_DIR", tmp_path / "traces")
+    rendered: list[str] = []
+
+    def build_payload(name: str):
+        def render() -> dict[str, str]:
+            rendered.append(name)
+            return {"name": name}
+
+        return render
+
+    configure_trace_layer("llm", TraceLayerPolicy(verbosity="off"))
+    configure_trace_layer("chat", TraceLayerPolicy(sample_rate=0.0))
+    try:
+        log_trace(layer="llm", event="invoke", payload=build_payload("llm"))
+        log_trace(layer="chat", event="chunk", payload=build_payload("chunk"))
+        log_trace(layer="chat", event="ingress", payload=build_payload("ingress"))
+    finally:
+        configure_trace_layer("llm", None)
+        configure_trace_layer("chat", None)
+    assert flush_trace_logs()
+
+    assert rendered == ["ingress"]
+    events = [json.loads(line)["event"] for line in log_path.read_text(encoding="utf-8").splitlines()]
+    assert events == ["ingress"]
+
+
+def test_trace_writer_survives_bad_entries_and_bounds_cached_summaries(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(trace_logging, "TRACE_LOG_PATH", tmp_path / "agent-trace.jsonl")
+    monkeypatch.setattr(trace_logging, "TRACE_SUMMARY_DIR", tmp_path / "traces")
+    update = trace_logging._update_trace_summary
+
+    def update_or_fail(summary, entry):
+        if entry["event"] == "broken":
+            raise KeyError("payload")
+        update(summary, entry)
+
+    monkeypatch.setattr(trace_logging, "_update_trace_summary", update_or_fail)
+    writer = trace_logging._TraceWriter(flush_interval_seconds=60, max_batch_size=100, max_cached_summaries=2)
+
+    def entry(trace_id: str, event: str) -> dict:
+        return {
+            "trace_id": trace_id,
+            "session_id": 1,
+            "run_id": "run-1",
+            "ts": "2024-01-01T00:00:00Z",
+            "layer": "chat",
+            "event": event,
+            "payload": {},
+        }
+
+    writer.enqueue(entry("t-0", "broken"))
+    for index in range(5):
+        writer.enqueue(entry(f"t-{index}", "chunk"))
+    assert writer.flush(timeout=5)
+
+    assert writer._thread.is_alive()
+    assert list(writer._summaries) == ["t-3", "t-4"]
+    assert sorted(path.name for path in (tmp_path / "traces").iterdir()) == [f"t-{index}.json" for index in range(5)]